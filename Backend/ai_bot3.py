@@ -9,7 +9,7 @@ import re
 import json
 from datetime import datetime, timedelta
 import hashlib
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Callable
 import autogen
 from autogen import AssistantAgent
 import logging
@@ -19,7 +19,9 @@ from contextlib import contextmanager
 import secrets
 import uuid
 import os
+import threading
 from dotenv import load_dotenv
+from llm_cache import CachedReplyMixin, shared_cache, DAY
 
 # Load environment variables
 load_dotenv()
@@ -39,7 +41,9 @@ class Config:
     # OpenAI API Configuration (SAME AS EMAIL BOT)
     OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
     OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
-    OPENAI_API_BASE = "https://api.openai.com/v1"
+    OPENAI_API_BASE = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+    # Test call to the API when the chat bot starts
+    OPENAI_STARTUP_CHECK = os.getenv("OPENAI_STARTUP_CHECK", "True").lower() == "true"
     
     # MySQL Configuration (SAME AS EMAIL BOT)
     MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
@@ -66,7 +70,6 @@ llm_config = {
         "model": Config.OPENAI_MODEL,
         "api_key": Config.OPENAI_API_KEY,
         "base_url": Config.OPENAI_API_BASE,
-        "api_type": "openai",
     }],
     "temperature": 0.1,
     "seed": 42,
@@ -654,10 +657,12 @@ class ChatTicketManager:
 # AI AGENTS (USING OPENAI)
 # ============================================================================
 
-class LanguageDetectorAgent(AssistantAgent):
+class LanguageDetectorAgent(CachedReplyMixin, AssistantAgent):
     """Agent for detecting non-English messages"""
     
-    def __init__(self):
+    cache_ttl = 30 * DAY
+    
+    def __init__(self, llm_cache=None):
         system_message = """You are a language detector. Analyze the message and return a JSON object.
 
 Return JSON in this exact format:
@@ -699,11 +704,14 @@ IMPORTANT: Return ONLY the JSON object, no other text."""
             llm_config=llm_config,
             human_input_mode="NEVER"
         )
+        self.llm_cache = llm_cache
 
-class ChatClassifierAgent(AssistantAgent):
+class ChatClassifierAgent(CachedReplyMixin, AssistantAgent):
     """Agent for classifying chat messages"""
     
-    def __init__(self):
+    cache_ttl = 7 * DAY
+    
+    def __init__(self, llm_cache=None):
         system_message = """You are a chat message classifier. Analyze the user's message and return a JSON object with the classification.
 
 Return JSON in this exact format:
@@ -734,6 +742,7 @@ IMPORTANT: Return ONLY the JSON object, no other text."""
             llm_config=llm_config,
             human_input_mode="NEVER"
         )
+        self.llm_cache = llm_cache
 
 class ChatResponseAgent(AssistantAgent):
     """Agent for generating chat responses"""
@@ -767,11 +776,39 @@ Always maintain a helpful, encouraging tone."""
             llm_config=llm_config,
             human_input_mode="NEVER"
         )
+        self._stream_client = None
+    
+    def stream_reply(self, messages: List[Dict], on_token: Callable[[str], None]) -> str:
+        """Same reply as generate_reply() for a single prompt, passing each text delta to on_token as it arrives"""
+        # AutoGen's own streaming only prints to the console, so call the API directly
+        config = self.llm_config["config_list"][0]
+        if self._stream_client is None:
+            from openai import OpenAI
+            self._stream_client = OpenAI(api_key=config["api_key"], base_url=config.get("base_url"),
+                                         timeout=self.llm_config.get("timeout"))
+        
+        stream = self._stream_client.chat.completions.create(
+            model=config["model"],
+            messages=self._oai_system_message + messages,
+            temperature=self.llm_config.get("temperature"),
+            max_tokens=self.llm_config.get("max_tokens"),
+            stream=True
+        )
+        
+        parts = []
+        for chunk in stream:
+            token = chunk.choices[0].delta.content if chunk.choices else None
+            if token:
+                parts.append(token)
+                on_token(token)
+        return "".join(parts)
 
-class HiringDetailsExtractorAgent(AssistantAgent):
+class HiringDetailsExtractorAgent(CachedReplyMixin, AssistantAgent):
     """Agent for extracting hiring details"""
     
-    def __init__(self):
+    cache_ttl = 7 * DAY
+    
+    def __init__(self, llm_cache=None):
         system_message = """You are a hiring details extractor. Extract job posting details from the conversation.
 
 Return ONLY a JSON object with these fields:
@@ -795,6 +832,7 @@ Return ONLY valid JSON, no other text."""
             llm_config=llm_config,
             human_input_mode="NEVER"
         )
+        self.llm_cache = llm_cache
 
 class UpdateDetailsExtractorAgent(AssistantAgent):
     """Agent for extracting update details"""
@@ -836,13 +874,17 @@ class ChatBotHandler:
         self.session_manager = ChatSessionManager(self.db_manager)
         self.ticket_manager = ChatTicketManager(self.db_manager)
         
-        # Initialize AI agents
-        self.language_detector = LanguageDetectorAgent()
-        self.classifier = ChatClassifierAgent()
+        # Initialize AI agents (classification and extraction replies are cached when LLM_CACHE_ENABLED is set)
+        llm_cache = shared_cache()
+        self.language_detector = LanguageDetectorAgent(llm_cache)
+        self.classifier = ChatClassifierAgent(llm_cache)
         self.responder = ChatResponseAgent()
-        self.extractor = HiringDetailsExtractorAgent()
+        self.extractor = HiringDetailsExtractorAgent(llm_cache)
         self.update_extractor = UpdateDetailsExtractorAgent()
         
+        # Token callback of the message being processed, per Socket.IO handler thread
+        self._stream = threading.local()
+        
         # Test database connection
         try:
             with self.db_manager.get_connection() as conn:
@@ -855,7 +897,8 @@ class ChatBotHandler:
             raise
         
         # Test OpenAI connection
-        self._test_openai_connection()
+        if Config.OPENAI_STARTUP_CHECK:
+            self._test_openai_connection()
     
     def _test_openai_connection(self):
         """Test OpenAI API connection"""
@@ -1212,9 +1255,14 @@ Thank you for your understanding! 😊"""
         }
     
     def process_message(self, session_id: str, user_id: str, 
-                       message: str) -> Dict[str, Any]:
-        """Process a user message and generate response"""
-        
+                       message: str, on_token: Optional[Callable[[str], None]] = None,
+                       on_reset: Optional[Callable[[], None]] = None) -> Dict[str, Any]:
+        """Process a user message and generate response
+        (on_token receives the reply text as it is generated, for replies written by the LLM;
+        on_reset means the text streamed so far is void because the reply is being regenerated)"""
+        
+        self._stream.on_token = on_token
+        self._stream.on_reset = on_reset
         try:
             # Save user message
             self.session_manager.save_message(session_id, "user", message)
@@ -1274,6 +1322,32 @@ Thank you for your understanding! 😊"""
                 pass
                 
             return error_response
+        finally:
+            self._stream.on_token = None
+            self._stream.on_reset = None
+    
+    def _respond(self, prompt: str) -> str:
+        """Chat reply from the responder, streamed to the current message's token callback if it has one"""
+        messages = [{"content": prompt, "role": "user"}]
+        on_token = getattr(self._stream, 'on_token', None)
+        if on_token:
+            streamed = []
+            
+            def forward(token: str):
+                streamed.append(token)
+                on_token(token)
+            
+            try:
+                return self.responder.stream_reply(messages, forward)
+            except Exception as e:
+                on_reset = getattr(self._stream, 'on_reset', None)
+                if streamed:
+                    # The client already shows part of this reply: void it before sending a different one
+                    if not on_reset:
+                        raise
+                    on_reset()
+                logger.warning(f"Streaming reply failed after {len(streamed)} token(s), generating it in one piece: {e}")
+        return self.responder.generate_reply(messages=messages)
     
     def _classify_message(self, message: str, history: List[Dict]) -> Dict:
         """Classify user message intent"""
@@ -1407,9 +1481,7 @@ Thank you for your understanding! 😊"""
             Be friendly and conversational.
             """
             
-            response_text = self.responder.generate_reply(
-                messages=[{"content": prompt, "role": "user"}]
-            )
+            response_text = self._respond(prompt)
             
             return {
                 "message": response_text,
@@ -1732,9 +1804,7 @@ What would you like to do?"""
         Remember: We handle job postings from both chat and email sources.
         """
         
-        response_text = self.responder.generate_reply(
-            messages=[{"content": prompt, "role": "user"}]
-        )
+        response_text = self._respond(prompt)
         
         return {
             "message": response_text,
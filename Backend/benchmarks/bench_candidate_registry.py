@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+bench_candidate_registry.py - Lookup cost of the cross-ticket candidate registry
+Usage: python benchmarks/bench_candidate_registry.py [registered candidates]
+Fills a temporary registry with synthetic applicants, then times resolve() for known and unseen
+applicants, with and without the Bloom filter in front of the database.
+"""
+
+import sys
+import time
+import random
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resume_filter5 import CandidateRegistry
+
+
+def synthetic_identifiers(index: int) -> dict:
+    return {
+        'emails': [f"applicant{index}@mail.org"],
+        'phones': [f"{9000000000 + index}"],
+        'github': f"dev{index}" if index % 3 == 0 else None,
+        'linkedin': f"applicant-{index}" if index % 2 == 0 else None,
+    }
+
+
+def time_resolve(registry: CandidateRegistry, identifiers: list) -> float:
+    start = time.perf_counter()
+    for ids in identifiers:
+        registry.resolve(ids)
+    return (time.perf_counter() - start) / len(identifiers) * 1e6
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    ticket_folder = Path(tempfile.mkdtemp()) / "bench_ticket"
+    ticket_folder.mkdir()
+    registry = CandidateRegistry.for_tickets_root(ticket_folder.parent)
+
+    resume_file = ticket_folder / "resume.txt"
+    start = time.perf_counter()
+    for index in range(count):
+        resume_file.write_text(f"resume {index}")
+        registry.register(resume_file, f"resume {index}", synthetic_identifiers(index))
+    print(f"Registered {count:,} applicants in {time.perf_counter() - start:.1f} s")
+
+    rng = random.Random(1)
+    known = [synthetic_identifiers(rng.randrange(count)) for _ in range(2000)]
+    unseen = [synthetic_identifiers(count + i) for i in range(2000)]
+
+    print(f"\n{'lookup':8} | {'bloom us':>9} | {'no bloom us':>11}")
+    for label, identifiers in (("known", known), ("unseen", unseen)):
+        with_bloom = time_resolve(registry, identifiers)
+        bloom, registry.bloom = registry.bloom, type('AlwaysMaybe', (), {
+            '__contains__': lambda self, key: True, 'count': 0, 'capacity': float('inf')})()
+        without_bloom = time_resolve(registry, identifiers)
+        registry.bloom = bloom
+        print(f"{label:8} | {with_bloom:>9.1f} | {without_bloom:>11.1f}")
+
+    false_positives = sum(f"email:{ids['emails'][0]}" in registry.bloom for ids in unseen)
+    print(f"\nBloom filter: {registry.bloom.size / 8 / 1024:.0f} KiB, {registry.bloom.hash_count} hashes, "
+          f"{false_positives / len(unseen):.2%} false positives on unseen emails")
+    registry.close()
+
+
+if __name__ == "__main__":
+    main()
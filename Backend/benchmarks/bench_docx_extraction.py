@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+bench_docx_extraction.py - Compare the streaming DOCX extractor with python-docx
+Usage: python benchmarks/bench_docx_extraction.py [file.docx ...]
+Without arguments a large synthetic resume (paragraphs + skills table) is generated.
+The streaming output must equal the text python-docx reads from the same parts (exit code 1 otherwise).
+"""
+
+import os
+import sys
+import time
+import tempfile
+import tracemalloc
+from pathlib import Path
+
+import docx
+from docx.oxml.ns import qn
+from docx.text.paragraph import Paragraph
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resume_filter5 import ResumeExtractor
+
+
+def python_docx_extract(file_path: str) -> str:
+    """Previous extraction path: full object tree, body paragraphs only"""
+    document = docx.Document(file_path)
+    return "\n".join(paragraph.text for paragraph in document.paragraphs)
+
+
+def python_docx_reference(file_path: str) -> str:
+    """Full text through python-docx: every paragraph of the headers, body (tables included) and footers,
+    with repeated header/footer blocks dropped like the streaming extractor does"""
+    document = docx.Document(file_path)
+    parts = {str(part.partname).lstrip('/'): part for part in document.part.package.iter_parts()}
+    headers = sorted(name for name in parts if name.startswith('word/header'))
+    footers = sorted(name for name in parts if name.startswith('word/footer'))
+    fallback = ResumeExtractor._MC_FALLBACK
+
+    lines = []
+    seen_blocks = set()
+    for name in headers + ['word/document.xml'] + footers:
+        element = document.element if name == 'word/document.xml' else parts[name].element
+        block = [Paragraph(p, None).text for p in element.iter(qn('w:p'))
+                 if not any(ancestor.tag == fallback for ancestor in p.iterancestors())]
+        block_key = tuple(line for line in block if line.strip())
+        if name != 'word/document.xml' and (not block_key or block_key in seen_blocks):
+            continue
+        seen_blocks.add(block_key)
+        lines.extend(block)
+    return "\n".join(lines)
+
+
+def build_synthetic_resume(paragraphs: int = 20000, table_rows: int = 500) -> str:
+    """Create a large DOCX with body text, a skills table and a header"""
+    document = docx.Document()
+    document.sections[0].header.paragraphs[0].text = "Jane Doe | jane.doe@mail.org | +1 555 123 4567"
+
+    for i in range(paragraphs):
+        document.add_paragraph(f"Built data pipeline {i} with Python, Spark and SQL on AWS for 3 years")
+
+    table = document.add_table(rows=table_rows, cols=2)
+    for i, row in enumerate(table.rows):
+        row.cells[0].text = f"Skill {i}"
+        row.cells[1].text = "Kubernetes, Docker, Terraform"
+
+    path = os.path.join(tempfile.mkdtemp(), "synthetic_resume.docx")
+    document.save(path)
+    return path
+
+
+def measure(label: str, func, file_path: str, repeat: int = 3):
+    """Run an extractor and report best time, peak traced memory and output size"""
+    best = float("inf")
+    peak = 0
+    text = ""
+    for _ in range(repeat):
+        tracemalloc.start()
+        start = time.perf_counter()
+        text = func(file_path)
+        best = min(best, time.perf_counter() - start)
+        peak = max(peak, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    print(f"  {label:12} {best * 1000:9.1f} ms | peak {peak / 1e6:7.1f} MB | {len(text):9,} chars")
+    return text
+
+
+def report_difference(expected: str, actual: str) -> bool:
+    """Print the first differing line; True when the texts are equal"""
+    if expected == actual:
+        print("  ✅ streaming text matches python-docx")
+        return True
+    expected_lines, actual_lines = expected.split("\n"), actual.split("\n")
+    for i, (want, got) in enumerate(zip(expected_lines, actual_lines)):
+        if want != got:
+            print(f"  ❌ line {i + 1} differs: python-docx {want[:60]!r}, streaming {got[:60]!r}")
+            break
+    else:
+        print(f"  ❌ python-docx has {len(expected_lines)} lines, streaming {len(actual_lines)}")
+    return False
+
+
+def main():
+    files = sys.argv[1:] or [build_synthetic_resume()]
+
+    matches = True
+    for file_path in files:
+        print(f"\n{Path(file_path).name} ({os.path.getsize(file_path) / 1e6:.1f} MB)")
+        measure("python-docx", python_docx_extract, file_path)
+        streamed = measure("streaming", ResumeExtractor.extract_text_from_docx, file_path)
+        matches &= report_difference(python_docx_reference(file_path), streamed)
+
+    sys.exit(0 if matches else 1)
+
+
+if __name__ == "__main__":
+    main()
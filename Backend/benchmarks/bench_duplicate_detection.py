@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+bench_duplicate_detection.py - Compare blocked duplicate search with the previous scan over every candidate
+Usage: python benchmarks/bench_duplicate_detection.py [pool sizes ...]
+Synthetic pools mix unique candidates with re-submissions (new email/phone, same content or profile,
+or lightly edited content that only the MinHash index can match).
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resume_filter5 import DuplicateCandidateDetector
+
+FIRST_NAMES = "Asha Rahul Priya Vikram Neha Arjun Kavya Rohan Sneha Aditya Maria John Wei Fatima Lucas".split()
+LAST_NAMES = "Sharma Patel Iyer Khan Reddy Gupta Singh Rodriguez Chen Okafor Silva Novak".split()
+COMPANIES = "Infosys Wipro Accenture Amazon Google Flipkart Zoho Oracle Cisco Adobe".split()
+SKILLS = "python java sql aws docker kubernetes react spark terraform go".split()
+FILLER = ("built designed migrated led owned improved reduced automated pipeline service platform team "
+          "latency cost reliability customers dashboards releases incidents api data model tests cloud "
+          "deployment monitoring batch streaming storage security onboarding mentoring roadmap").split()
+
+
+def synthetic_resume(rng: random.Random, index: int, profile_seed: int = None) -> str:
+    """A resume with a unique contact block; profile_seed fixes education and experience"""
+    profile_rng = random.Random(profile_seed if profile_seed is not None else rng.random())
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    degree_year = profile_rng.randint(2005, 2020)
+    jobs = [
+        f"{profile_rng.choice(COMPANIES)} {profile_rng.choice(COMPANIES)} Engineer "
+        f"{degree_year + i * 2} - {degree_year + i * 2 + 2}"
+        for i in range(profile_rng.randint(1, 3))
+    ]
+    return "\n".join([
+        name,
+        f"candidate{index}@mail.org",
+        f"+1 {rng.randint(200, 999)} {rng.randint(200, 999)} {rng.randint(1000, 9999)}",
+        "Summary",
+        f"Engineer with {profile_rng.randint(1, 12)} years in {', '.join(profile_rng.sample(SKILLS, 4))}",
+        "Experience",
+        *jobs,
+        f"Worked with {' and '.join(rng.sample(SKILLS, 3))} on project {index}",
+        "Projects",
+        " ".join(profile_rng.choice(FILLER) for _ in range(120)),
+        "Education",
+        f"B.Tech Computer Science {degree_year}",
+    ])
+
+
+def synthetic_pool(size: int, duplicate_share: float = 0.1) -> list:
+    rng = random.Random(size)
+    pool = []
+    for index in range(size):
+        if pool and rng.random() < duplicate_share:
+            # Re-submission with new contact details: same body under another name, same name and
+            # profile with an extra summary line, or an edited word with re-exported spacing
+            original_text, original_seed = rng.choice(pool)
+            lines = original_text.split("\n")
+            lines[1:3] = [f"resubmit{index}@mail.org", f"+44 {rng.randint(1000, 9999)} {rng.randint(100000, 999999)}"]
+            kind = rng.random()
+            if kind < 0.33:
+                lines[0] = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+            elif kind < 0.66:
+                lines.insert(5, f"Open to relocation, reference {index}")
+            else:
+                lines[0] = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+                lines[-1] = lines[-1].replace("Computer Science", "Computer  Science Engineering")
+                lines = [line.replace(" - ", "-") for line in lines]
+            pool.append(("\n".join(lines), original_seed))
+        else:
+            seed = rng.randint(0, 10 ** 9)
+            pool.append((synthetic_resume(rng, index, seed), seed))
+    return [text for text, _ in pool]
+
+
+def run(detector: DuplicateCandidateDetector, texts: list, identifiers: list) -> tuple:
+    start = time.perf_counter()
+    found = []
+    for index, (text, ids) in enumerate(zip(texts, identifiers)):
+        _, duplicates = detector.add_candidate(text, f"resume_{index}.pdf", ids)
+        found.append(sorted(d['filename'] for d in duplicates))
+    return (time.perf_counter() - start) * 1000, found
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [250, 1000, 2000]
+    extractor = DuplicateCandidateDetector()
+
+    print(f"{'pool':>6} | {'full scan ms':>12} | {'blocked ms':>10} | {'dup pairs':>9} | same result")
+    for size in sizes:
+        texts = synthetic_pool(size)
+        identifiers = [extractor.extract_candidate_identifiers(text, f"resume_{i}.pdf")
+                       for i, text in enumerate(texts)]
+
+        full_scan = DuplicateCandidateDetector()
+        full_scan._blocking_keys = lambda ids: [('all',)]  # one block: every candidate is compared
+        full_ms, full_found = run(full_scan, texts, identifiers)
+        blocked_ms, blocked_found = run(DuplicateCandidateDetector(), texts, identifiers)
+
+        pairs = sum(len(found) for found in blocked_found)
+        print(f"{size:>6} | {full_ms:>12.0f} | {blocked_ms:>10.1f} | {pairs:>9} | {full_found == blocked_found}")
+
+
+if __name__ == "__main__":
+    main()
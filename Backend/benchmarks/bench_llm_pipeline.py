@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+bench_llm_pipeline.py - Offline end-to-end timing of resume filtering against mock_openai_server.py
+Usage: python benchmarks/bench_llm_pipeline.py [--latency 1.0] [--jitter 0.2] [--error-rate 0] [--tickets 3] [--batch] [--mode fast]
+Copies sample tickets from approved_tickets/ to a temporary folder, starts the stand-in server in-process
+and runs the full pipeline (real autogen/OpenAI clients) against it. Timings are reproducible for a seed.
+"""
+
+import os
+import sys
+import time
+import shutil
+import argparse
+import tempfile
+import threading
+import contextlib
+import io
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+import mock_openai_server
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--latency", type=float, default=1.0)
+    parser.add_argument("--jitter", type=float, default=0.2)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rpm", type=int, default=10000)
+    parser.add_argument("--tickets", type=int, default=3, help="Sample tickets to copy")
+    parser.add_argument("--batch", action="store_true", help="Run BatchProcessor instead of one ticket at a time")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--mode", choices=("full", "fast"), default="full")
+    args = parser.parse_args()
+
+    server_args = mock_openai_server.parse_args([
+        "--port", "0", "--latency", str(args.latency), "--jitter", str(args.jitter),
+        "--error-rate", str(args.error_rate), "--rpm", str(args.rpm),
+    ])
+    server = mock_openai_server.make_server(server_args)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    # resume_filter5 reads the endpoint at import time
+    os.environ["OPENAI_API_BASE"] = f"http://127.0.0.1:{server.server_port}/v1"
+    os.environ["OPENAI_API_KEY"] = "mock"
+    import resume_filter5
+
+    jobs_folder = Path(tempfile.mkdtemp()) / "approved_tickets"
+    jobs_folder.mkdir()
+    samples = [t for t in sorted((BACKEND_DIR / "approved_tickets").iterdir())
+               if t.is_dir() and any(t.glob("*.pdf")) and (t / "job_details.json").exists()][:args.tickets]
+    for ticket in samples:
+        shutil.copytree(ticket, jobs_folder / ticket.name, ignore=shutil.ignore_patterns("filtering_results"))
+
+    # AutoGen writes its response cache to ./.cache; keep the mock replies out of the real one
+    os.chdir(jobs_folder.parent)
+
+    timings = []
+    start = time.perf_counter()
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        if args.batch:
+            resume_filter5.BatchProcessor(str(jobs_folder)).process_all_tickets(
+                force_reprocess=True, workers=args.workers, mode=args.mode
+            )
+        else:
+            for ticket in sorted(jobs_folder.iterdir()):
+                if not ticket.is_dir() or ticket.name == "batch_results":
+                    continue
+                ticket_start = time.perf_counter()
+                resume_filter5.UpdatedResumeFilteringSystem(str(ticket), mode=args.mode).filter_resumes()
+                timings.append((ticket.name, time.perf_counter() - ticket_start))
+    total = time.perf_counter() - start
+
+    for name, seconds in timings:
+        print(f"  {name[:40]:40} {seconds:6.2f} s")
+    for line in log.getvalue().splitlines():
+        if line.lstrip().startswith(("🚦", "❌", "⚠️")):
+            print(f"  {line.strip()}")
+    stats = server.RequestHandlerClass.mock.stats
+    print(f"{'batch' if args.batch else 'sequential'} ({args.mode} mode): {len(samples)} ticket(s) in {total:.2f} s "
+          f"(mock latency {args.latency}s ± {args.jitter}s)")
+    print(f"mock server: {stats['requests']} requests, errors {stats['errors']}, "
+          f"{stats['prompt_tokens']:,} prompt tokens")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+bench_skill_matching.py - Compare the Aho-Corasick skill matcher with the previous per-skill scan
+Usage: python benchmarks/bench_skill_matching.py [resume.pdf|.docx|.txt ...]
+Without arguments a pool of synthetic resumes is generated.
+"""
+
+import sys
+import time
+import random
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from resume_filter5 import ResumeExtractor, UpdateAwareResumeFilter
+
+
+def legacy_skill_match(skill_variations, resume_text, required_skills):
+    """Previous implementation: substring search per skill and per variation"""
+    resume_lower = resume_text.lower()
+    matched_skills = []
+    detailed_matches = {}
+
+    for skill in required_skills:
+        skill_lower = skill.lower().strip()
+        skill_matched = False
+
+        if skill_lower in resume_lower:
+            matched_skills.append(skill)
+            detailed_matches[skill] = [skill_lower]
+            continue
+
+        skill_key = None
+        for key in skill_variations:
+            if skill_lower in skill_variations[key] or key in skill_lower:
+                skill_key = key
+                break
+
+        if skill_key:
+            variations_found = [v for v in skill_variations[skill_key] if v in resume_lower]
+            if variations_found:
+                skill_matched = True
+                matched_skills.append(skill)
+                detailed_matches[skill] = variations_found
+
+        if not skill_matched and ' ' in skill:
+            if all(part.lower() in resume_lower for part in skill.split()):
+                matched_skills.append(skill)
+                detailed_matches[skill] = [skill_lower]
+
+    return matched_skills, detailed_matches
+
+
+def synthetic_resumes(count: int = 50, words: int = 500) -> list:
+    """Generate resume-like texts: mostly filler with skills and near-misses mixed in"""
+    random.seed(7)
+    filler = ("the and of with for in on to a team led project developed delivered managed "
+              "stakeholders requirements designed improved performance customers reports").split()
+    skills = ("python java docker kubernetes k8s spark aws lambda sql postgres react node.js "
+              "rest apis ci/cd jenkins agile scrum machine learning tensorflow").split()
+    near_misses = "json html happy interest digital restore nodejs-like".split()
+    vocab = filler * 6 + skills + near_misses
+    return [' '.join(random.choice(vocab) + random.choice(['', '', ',', '.', '\n']) for _ in range(words))
+            for _ in range(count)]
+
+
+def time_per_resume(func, resumes, repeat: int = 20) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for resume_text in resumes:
+            func(resume_text)
+    return (time.perf_counter() - start) / (repeat * len(resumes)) * 1000
+
+
+def main():
+    if len(sys.argv) > 1:
+        resumes = [ResumeExtractor.extract_text(Path(arg)) for arg in sys.argv[1:]]
+        resumes = [text for text in resumes if text]
+    else:
+        resumes = synthetic_resumes()
+
+    resume_filter = UpdateAwareResumeFilter()
+    variations = resume_filter.skill_variations
+    all_skills = list(variations.keys())
+
+    avg_length = sum(len(text) for text in resumes) / len(resumes)
+    print(f"{len(resumes)} resumes, {avg_length:,.0f} chars on average\n")
+    print(f"{'skills':>6} | {'legacy ms':>9} | {'automaton ms':>12} | {'build ms':>8} | resumes changed")
+
+    for count in (5, 10, 20, len(all_skills)):
+        skills = all_skills[:count]
+
+        build_start = time.perf_counter()
+        resume_filter.compile_skill_matcher(skills)
+        build_ms = (time.perf_counter() - build_start) * 1000
+        resume_filter.calculate_skill_match_score(resumes[0], skills)  # warm the per-ticket cache
+
+        legacy_ms = time_per_resume(lambda text: legacy_skill_match(variations, text, skills), resumes)
+        new_ms = time_per_resume(lambda text: resume_filter.calculate_skill_match_score(text, skills), resumes)
+
+        # Differences come from word-boundary checks, e.g. 'ml' no longer matching inside 'html'
+        changed = sum(
+            legacy_skill_match(variations, text, skills)[0] !=
+            resume_filter.calculate_skill_match_score(text, skills)[1]
+            for text in resumes
+        )
+
+        print(f"{count:>6} | {legacy_ms:>9.3f} | {new_ms:>12.3f} | {build_ms:>8.2f} | {changed}/{len(resumes)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+bench_startup.py - Measure startup time and peak RSS of a filter run's setup phase
+Usage: python benchmarks/bench_startup.py [repeats]
+Each case runs in a fresh interpreter: import resume_filter5 and build UpdateAwareBasicFilter.
+The "eager" case also loads spaCy at startup, as the filter used to.
+"""
+
+import sys
+import json
+import subprocess
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+CASE_SCRIPT = """
+import json, os, resource, sys, time
+start = time.perf_counter()
+import resume_filter5
+imported = time.perf_counter()
+basic_filter = resume_filter5.UpdateAwareBasicFilter()
+nlp_status = "not loaded"
+if sys.argv[1] == "eager":
+    try:
+        basic_filter.nlp
+        nlp_status = "model loaded"
+    except RuntimeError:
+        nlp_status = "spacy imported, model not installed"
+done = time.perf_counter()
+print(json.dumps({
+    "import_ms": (imported - start) * 1000,
+    "init_ms": (done - imported) * 1000,
+    "rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "nlp": nlp_status,
+}))
+"""
+
+
+def run_case(mode: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", CASE_SCRIPT, mode],
+        cwd=BACKEND_DIR, capture_output=True, text=True, check=True
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    # Interleave the cases so disk cache warm-up does not favour one of them
+    runs = {"lazy": [], "eager": []}
+    for _ in range(repeats):
+        for mode in runs:
+            runs[mode].append(run_case(mode))
+
+    print(f"{'case':6} | {'import ms':>9} | {'init ms':>8} | {'peak RSS MB':>11} | nlp")
+    for mode, mode_runs in runs.items():
+        best = min(mode_runs, key=lambda r: r["import_ms"] + r["init_ms"])
+        print(f"{mode:6} | {best['import_ms']:>9.0f} | {best['init_ms']:>8.0f} | "
+              f"{best['rss_mb']:>11.0f} | {best['nlp']}")
+
+
+if __name__ == "__main__":
+    main()
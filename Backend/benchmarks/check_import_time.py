@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+check_import_time.py - Startup regression check for the resume_filter5 CLI
+Usage: python benchmarks/check_import_time.py [budget_ms]
+Imports resume_filter5 under `python -X importtime` in a fresh interpreter (without OPENAI_API_KEY)
+and fails when the import exceeds the budget or pulls in a heavy dependency that should be deferred.
+"""
+
+import os
+import sys
+import time
+import subprocess
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+DEFAULT_BUDGET_MS = 300
+DEFERRED_MODULES = ("autogen", "openai", "sklearn", "numpy", "spacy", "pandas", "PyPDF2", "rapidfuzz", "jellyfish")
+
+
+def clean_env() -> dict:
+    env = dict(os.environ)
+    env.pop("OPENAI_API_KEY", None)
+    return env
+
+
+def import_profile() -> dict:
+    """Cumulative import time (ms) of every module imported by resume_filter5"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import resume_filter5"],
+        cwd=BACKEND_DIR, env=clean_env(), capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise SystemExit(f"❌ import resume_filter5 failed:\n{result.stderr}")
+
+    entries = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header line
+        entries.append((name[1:], int(cumulative) / 1000))
+
+    # Children are printed before their parent with deeper indentation; skip interpreter startup
+    profile = {}
+    for name, ms in reversed(entries):
+        if profile and not name.startswith(" "):
+            break
+        profile[name.strip()] = ms
+    return profile
+
+
+def time_command(*args: str) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "resume_filter5.py", *args], cwd=BACKEND_DIR, env=clean_env(),
+                   capture_output=True, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_BUDGET_MS
+
+    # Best of three, so a cold disk cache does not fail the check
+    profiles = [import_profile() for _ in range(3)]
+    profile = min(profiles, key=lambda p: p["resume_filter5"])
+    total_ms = profile["resume_filter5"]
+
+    print("Slowest imports:")
+    for name, ms in sorted(profile.items(), key=lambda item: -item[1])[1:8]:  # [0] is resume_filter5
+        print(f"  {name:40} {ms:8.1f} ms")
+
+    print(f"\nimport resume_filter5: {total_ms:.1f} ms (budget {budget_ms:.0f} ms)")
+    print(f"resume_filter5.py --status: {time_command('--status'):.0f} ms (wall clock)")
+
+    eager = sorted({name for name in profile if name.split(".")[0] in DEFERRED_MODULES})
+    failures = []
+    if total_ms > budget_ms:
+        failures.append(f"import took {total_ms:.1f} ms, budget is {budget_ms:.0f} ms")
+    if eager:
+        failures.append(f"heavy modules imported at startup: {', '.join(eager[:10])}")
+
+    if failures:
+        for failure in failures:
+            print(f"❌ {failure}")
+        sys.exit(1)
+    print("✅ Startup within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+Shared LLM response cache for the chat and email bots
+Replies are keyed by endpoint, model, system prompt and message hash, expire after a per-agent TTL and
+are evicted least-recently-used once the cache holds MAX_ENTRIES replies.
+Opt-in: set LLM_CACHE_ENABLED=true. Usage: python llm_cache.py [--clear]
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parent / ".cache" / "llm_cache.db"
+
+DAY = 24 * 60 * 60
+
+
+class LLMCache:
+    """SQLite-backed reply cache with TTL, LRU eviction and hit/miss counters, shared across processes"""
+
+    MAX_ENTRIES = 20000
+
+    def __init__(self, db_path: Path = DEFAULT_CACHE_PATH, max_entries: int = MAX_ENTRIES):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        # Agents are called from Socket.IO handler threads
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS replies (
+                key TEXT PRIMARY KEY,
+                agent TEXT NOT NULL,
+                reply TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                last_used REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS replies_by_last_used ON replies (last_used);
+            CREATE TABLE IF NOT EXISTS metrics (
+                agent TEXT PRIMARY KEY,
+                hits INTEGER NOT NULL DEFAULT 0,
+                misses INTEGER NOT NULL DEFAULT 0,
+                expired INTEGER NOT NULL DEFAULT 0,
+                evictions INTEGER NOT NULL DEFAULT 0
+            );
+        """)
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def make_key(base_url: str, model: str, system_message: str, messages: List[Dict]) -> str:
+        # The endpoint is part of the key so replies from a stand-in server never reach real runs
+        payload = json.dumps(
+            [base_url, model, system_message, [(m.get("role"), m.get("content")) for m in messages]],
+            ensure_ascii=False
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _count(self, agent: str, field: str, amount: int = 1):
+        self.conn.execute("INSERT OR IGNORE INTO metrics (agent) VALUES (?)", (agent,))
+        self.conn.execute(f"UPDATE metrics SET {field} = {field} + ? WHERE agent = ?", (amount, agent))
+
+    def get(self, key: str, agent: str) -> Optional[str]:
+        """Cached reply, or None on a miss (expired replies are dropped)"""
+        now = time.time()
+        with self.lock, self.conn:
+            row = self.conn.execute("SELECT reply, expires_at FROM replies WHERE key = ?", (key,)).fetchone()
+            if row and row[1] > now:
+                self.conn.execute("UPDATE replies SET last_used = ? WHERE key = ?", (now, key))
+                self._count(agent, 'hits')
+                return row[0]
+            if row:
+                self.conn.execute("DELETE FROM replies WHERE key = ?", (key,))
+                self._count(agent, 'expired')
+            self._count(agent, 'misses')
+            return None
+
+    def put(self, key: str, agent: str, reply: str, ttl: float):
+        now = time.time()
+        with self.lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO replies (key, agent, reply, expires_at, last_used) VALUES (?, ?, ?, ?, ?)",
+                (key, agent, reply, now + ttl, now)
+            )
+            excess = self.conn.execute("SELECT COUNT(*) FROM replies").fetchone()[0] - self.max_entries
+            if excess > 0:
+                # Expired replies go first, then the least recently used
+                evicted = self.conn.execute(
+                    "SELECT key, agent FROM replies ORDER BY expires_at > ?, last_used LIMIT ?", (now, excess)
+                ).fetchall()
+                self.conn.executemany("DELETE FROM replies WHERE key = ?", [(k,) for k, _ in evicted])
+                for _, evicted_agent in evicted:
+                    self._count(evicted_agent, 'evictions')
+
+    def stats(self) -> Dict:
+        """Hit/miss counters per agent plus cache size"""
+        with self.lock:
+            agents = {}
+            for agent, hits, misses, expired, evictions in self.conn.execute(
+                "SELECT agent, hits, misses, expired, evictions FROM metrics ORDER BY agent"
+            ):
+                lookups = hits + misses
+                agents[agent] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": hits / lookups if lookups else 0.0,
+                    "expired": expired,
+                    "evictions": evictions,
+                }
+            entries, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(LENGTH(reply)), 0) FROM replies").fetchone()
+        return {"entries": entries, "max_entries": self.max_entries, "reply_bytes": size, "agents": agents}
+
+    def clear(self):
+        with self.lock, self.conn:
+            self.conn.execute("DELETE FROM replies")
+            self.conn.execute("DELETE FROM metrics")
+
+
+_shared_cache = None
+_shared_cache_lock = threading.Lock()
+
+
+def shared_cache() -> Optional[LLMCache]:
+    """Process-wide cache when LLM_CACHE_ENABLED is true, otherwise None (agents call the API)"""
+    global _shared_cache
+    if os.getenv("LLM_CACHE_ENABLED", "False").lower() != "true":
+        return None
+    with _shared_cache_lock:
+        if _shared_cache is None:
+            _shared_cache = LLMCache(
+                Path(os.getenv("LLM_CACHE_PATH", str(DEFAULT_CACHE_PATH))),
+                int(os.getenv("LLM_CACHE_MAX_ENTRIES", str(LLMCache.MAX_ENTRIES)))
+            )
+        return _shared_cache
+
+
+class CachedReplyMixin:
+    """Cache generate_reply() for an AssistantAgent whose reply only depends on its messages.
+
+    Mix in before AssistantAgent and set self.llm_cache (None disables caching).
+    """
+
+    cache_ttl = 7 * DAY
+    llm_cache = None
+
+    def _cache_endpoint(self) -> Tuple[str, str]:
+        """Base URL and model the agent calls"""
+        config_list = (self.llm_config or {}).get("config_list") or [{}]
+        return (config_list[0].get("base_url") or "").rstrip("/"), config_list[0].get("model", "")
+
+    def generate_reply(self, messages: Optional[List[Dict]] = None, sender=None, **kwargs):
+        if self.llm_cache is None or not messages:
+            return super().generate_reply(messages=messages, sender=sender, **kwargs)
+
+        key = self.llm_cache.make_key(*self._cache_endpoint(), self.system_message, messages)
+        reply = self.llm_cache.get(key, self.name)
+        if reply is not None:
+            return reply
+
+        reply = super().generate_reply(messages=messages, sender=sender, **kwargs)
+        if isinstance(reply, str) and reply:
+            self.llm_cache.put(key, self.name, reply, self.cache_ttl)
+        return reply
+
+
+def main():
+    cache = LLMCache(Path(os.getenv("LLM_CACHE_PATH", str(DEFAULT_CACHE_PATH))))
+    if "--clear" in sys.argv[1:]:
+        cache.clear()
+        print(f"🧹 Cleared {cache.db_path}")
+        return
+
+    stats = cache.stats()
+    print(f"📦 {cache.db_path}: {stats['entries']:,}/{stats['max_entries']:,} replies, "
+          f"{stats['reply_bytes'] / 1024:.0f} KiB")
+    for agent, counters in stats["agents"].items():
+        print(f"  • {agent}: {counters['hits']} hits, {counters['misses']} misses "
+              f"({counters['hit_rate']:.0%}), {counters['expired']} expired, {counters['evictions']} evicted")
+
+
+if __name__ == "__main__":
+    main()
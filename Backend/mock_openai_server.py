@@ -0,0 +1,319 @@
+#!/usr/bin/env python3
+"""
+mock_openai_server.py - Local OpenAI-compatible stand-in for offline load tests and benchmarks
+Serves /v1/chat/completions (including streaming) with scripted, recorded or default replies,
+configurable latency, error injection and rate limit headers. Latency and errors are seeded
+per request, so the same run gives the same timings.
+
+Usage:
+  python mock_openai_server.py --port 8011 --latency 0.8 --jitter 0.2 --error-rate 0.05
+  OPENAI_API_BASE=http://127.0.0.1:8011/v1 OPENAI_API_KEY=mock python resume_filter5.py --batch
+
+  --script rules.json                 replies from [{"system": regex, "user": regex, "response": "..."}]
+  --record calls.jsonl --upstream URL forward to a real API and record its replies
+  --replay calls.jsonl                serve recorded replies (other requests fall back to the rules)
+  --rpm N --tpm N                     limits behind the x-ratelimit-* headers; 429 when exceeded
+  GET /stats                          request, error and token counters
+"""
+
+import re
+import json
+import time
+import random
+import hashlib
+import argparse
+import threading
+import urllib.request
+import urllib.error
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# Replies for the JSON agents of the chat and email bots, so they take their normal code paths
+DEFAULT_RULES = [
+    {"system": r"language detector",
+     "response": '{"is_english": true, "detected_language": "English", "confidence": 0.99, "has_mixed_languages": false}'},
+    {"system": r"chat message classifier",
+     "response": '{"intent": "question", "is_hiring_related": false, "has_complete_info": false, "ticket_id": null, "confidence": 0.9}'},
+    {"system": r"email classifier",
+     "response": '{"is_hiring_email": false, "is_termination_request": false, "is_approval_response": false, '
+                 '"is_conversational": true, "ticket_id": null, "confidence": 0.9, "reason": "mock reply"}'},
+    {"system": r"(hiring|update) details|Extract hiring details",
+     "response": '{"job_title": "NOT_FOUND", "location": "NOT_FOUND", "experience_required": "NOT_FOUND", '
+                 '"salary_range": "NOT_FOUND", "job_description": "NOT_FOUND", "required_skills": "NOT_FOUND", '
+                 '"employment_type": "NOT_FOUND", "deadline": "NOT_FOUND"}'},
+]
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4 + 1
+
+
+class MockOpenAI:
+    """Reply selection, latency/error decisions and counters shared by the request handlers"""
+
+    def __init__(self, args: argparse.Namespace):
+        self.args = args
+        self.rules = self._load_rules(args.script) + DEFAULT_RULES
+        self.recorded = self._load_recorded(args.replay) if args.replay else {}
+        self.lock = threading.Lock()
+        self.attempts = {}  # request key -> requests seen, so retries get their own error roll
+        self.window = deque()  # (time, prompt tokens) of requests in the last minute, for --rpm/--tpm
+        self.stats = {"requests": 0, "completions": 0, "streamed": 0, "errors": {}, "rate_limited": 0,
+                      "replayed": 0, "recorded": 0, "prompt_tokens": 0, "completion_tokens": 0}
+
+    @staticmethod
+    def _load_rules(path: Optional[str]) -> List[Dict]:
+        if not path:
+            return []
+        with open(path) as f:
+            rules = json.load(f)
+        return rules["rules"] if isinstance(rules, dict) else rules
+
+    @staticmethod
+    def _load_recorded(path: str) -> Dict[str, Dict]:
+        recorded = {}
+        try:
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        recorded[entry["key"]] = entry["response"]
+        except FileNotFoundError:
+            pass
+        return recorded
+
+    @staticmethod
+    def request_key(body: Dict) -> str:
+        """Model and messages; sampling parameters do not change the recorded reply"""
+        messages = [(m.get("role"), m.get("content")) for m in body.get("messages", [])]
+        return hashlib.sha256(json.dumps([body.get("model"), messages]).encode()).hexdigest()
+
+    def roll(self, key: str) -> random.Random:
+        """RNG for one attempt of one request: same seed, request and attempt -> same outcome"""
+        with self.lock:
+            attempt = self.attempts.get(key, 0)
+            self.attempts[key] = attempt + 1
+        return random.Random(f"{self.args.seed}:{key}:{attempt}")
+
+    def rate_limit_headers(self, tokens: int) -> Tuple[Optional[float], Dict[str, str]]:
+        """(retry-after seconds when over --rpm/--tpm, x-ratelimit-* headers as the real API sends them)"""
+        now = time.monotonic()
+        with self.lock:
+            while self.window and now - self.window[0][0] >= 60:
+                self.window.popleft()
+            reset = 60 - (now - self.window[0][0]) if self.window else 0.0
+            used_tokens = sum(spent for _, spent in self.window)
+            if len(self.window) >= self.args.rpm or (self.window and used_tokens + tokens > self.args.tpm):
+                return reset, {}
+            self.window.append((now, tokens))
+            remaining_requests = self.args.rpm - len(self.window)
+            remaining_tokens = self.args.tpm - used_tokens - tokens
+        return None, {
+            "x-ratelimit-limit-requests": str(self.args.rpm),
+            "x-ratelimit-remaining-requests": str(remaining_requests),
+            "x-ratelimit-reset-requests": f"{reset:.3f}s",
+            "x-ratelimit-limit-tokens": str(self.args.tpm),
+            "x-ratelimit-remaining-tokens": str(remaining_tokens),
+            "x-ratelimit-reset-tokens": f"{reset:.3f}s",
+        }
+
+    def reply_text(self, body: Dict, key: str, auth: Optional[str]) -> str:
+        if key in self.recorded:
+            self.count("replayed")
+            return self.recorded[key]["choices"][0]["message"]["content"]
+        if self.args.upstream:
+            return self.record(body, key, auth)
+
+        messages = body.get("messages", [])
+        system = "\n".join(m.get("content") or "" for m in messages if m.get("role") == "system")
+        user = next((m.get("content") or "" for m in reversed(messages) if m.get("role") == "user"), "")
+        for rule in self.rules:
+            if re.search(rule.get("system", ""), system, re.IGNORECASE) and \
+                    re.search(rule.get("user", ""), user, re.IGNORECASE):
+                return rule["response"]
+        return f"Mock reply ({body.get('model')}): received {estimate_tokens(user)} tokens starting with " \
+               f"{' '.join(user.split()[:12])!r}"
+
+    def record(self, body: Dict, key: str, auth: Optional[str]) -> str:
+        """Forward to --upstream (without streaming) and append the reply to --record"""
+        request = urllib.request.Request(
+            self.args.upstream.rstrip("/") + "/chat/completions",
+            data=json.dumps({**body, "stream": False}).encode(),
+            headers={"Content-Type": "application/json", "Authorization": auth or ""},
+        )
+        with urllib.request.urlopen(request, timeout=120) as upstream_response:
+            response = json.load(upstream_response)
+        with self.lock:
+            self.recorded[key] = response
+            self.stats["recorded"] += 1
+            if self.args.record:
+                with open(self.args.record, "a") as f:
+                    f.write(json.dumps({"key": key, "response": response}) + "\n")
+        return response["choices"][0]["message"]["content"]
+
+    def count(self, field: str, amount: int = 1):
+        with self.lock:
+            self.stats[field] += amount
+
+    def count_error(self, status: int):
+        with self.lock:
+            self.stats["errors"][str(status)] = self.stats["errors"].get(str(status), 0) + 1
+
+
+class MockHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    mock: MockOpenAI = None
+
+    def log_message(self, format, *args):
+        if self.mock.args.verbose:
+            super().log_message(format, *args)
+
+    def _send_json(self, status: int, payload: Dict, headers: Dict[str, str] = None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_error(self, status: int, message: str, headers: Dict[str, str] = None):
+        self.mock.count_error(status)
+        error_type = "rate_limit_exceeded" if status == 429 else "server_error"
+        self._send_json(status, {"error": {"message": message, "type": error_type, "code": error_type}}, headers)
+
+    def do_GET(self):
+        if self.path.rstrip("/") in ("/stats", "/v1/stats"):
+            with self.mock.lock:
+                self._send_json(200, self.mock.stats)
+        elif self.path.rstrip("/") in ("/models", "/v1/models"):
+            self._send_json(200, {"object": "list", "data": [{"id": "mock", "object": "model", "owned_by": "mock"}]})
+        else:
+            self._send_error(404, f"Unknown path {self.path}")
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_error(404, f"Unknown path {self.path}")
+            return
+        self.mock.count("requests")
+        args = self.mock.args
+
+        prompt_tokens = sum(estimate_tokens(m.get("content") or "") for m in body.get("messages", []))
+        retry_after, headers = self.mock.rate_limit_headers(prompt_tokens)
+        if retry_after is not None:
+            self.mock.count("rate_limited")
+            self._send_error(429, "Rate limit reached (mock --rpm/--tpm)", {"retry-after-ms": str(int(retry_after * 1000))})
+            return
+
+        key = self.mock.request_key(body)
+        rng = self.mock.roll(key)
+        time.sleep(max(0.0, rng.gauss(args.latency, args.jitter)))
+        if rng.random() < args.error_rate:
+            status = rng.choice(args.error_status)
+            extra = {"retry-after-ms": "1000"} if status == 429 else {}
+            self._send_error(status, "Injected error (mock --error-rate)", extra)
+            return
+
+        try:
+            content = self.mock.reply_text(body, key, self.headers.get("Authorization"))
+        except (urllib.error.URLError, OSError) as e:
+            self._send_error(502, f"Upstream request failed: {e}")
+            return
+
+        completion_tokens = estimate_tokens(content)
+        self.mock.count("prompt_tokens", prompt_tokens)
+        self.mock.count("completion_tokens", completion_tokens)
+        completion_id = f"chatcmpl-mock-{key[:12]}"
+        model = body.get("model", "mock")
+
+        if body.get("stream"):
+            self.mock.count("streamed")
+            self._stream(completion_id, model, content, headers)
+            return
+
+        self.mock.count("completions")
+        self._send_json(200, {
+            "id": completion_id,
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+            "usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+                      "total_tokens": prompt_tokens + completion_tokens},
+        }, headers)
+
+    def _stream(self, completion_id: str, model: str, content: str, headers: Dict[str, str]):
+        """Server-sent events, one chunk per word, paced by --tokens-per-second"""
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Cache-Control", "no-cache")
+        self.send_header("Connection", "close")
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.close_connection = True
+
+        def event(delta: Dict, finish_reason: Optional[str] = None):
+            chunk = {"id": completion_id, "object": "chat.completion.chunk", "created": int(time.time()),
+                     "model": model, "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}]}
+            self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode())
+            self.wfile.flush()
+
+        event({"role": "assistant", "content": ""})
+        for piece in re.findall(r"\S+\s*|\s+", content):
+            if self.mock.args.tokens_per_second:
+                time.sleep(1 / self.mock.args.tokens_per_second)
+            event({"content": piece})
+        event({}, "stop")
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+def parse_args(argv: List[str] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Local OpenAI-compatible stand-in server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8011)
+    parser.add_argument("--latency", type=float, default=0.5, help="Mean seconds before a reply")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Standard deviation of the latency")
+    parser.add_argument("--tokens-per-second", type=float, default=50, help="Streaming pace (0 = no delay)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with an error")
+    parser.add_argument("--error-status", type=int, nargs="+", default=[500, 429], help="Status codes for injected errors")
+    parser.add_argument("--rpm", type=int, default=10000, help="Requests per minute before 429s")
+    parser.add_argument("--tpm", type=int, default=2000000, help="Prompt tokens per minute before 429s")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for latency and error decisions")
+    parser.add_argument("--script", help="JSON rules mapping system/user regexes to replies")
+    parser.add_argument("--replay", help="JSONL of recorded replies to serve")
+    parser.add_argument("--record", help="JSONL file to append upstream replies to")
+    parser.add_argument("--upstream", help="Real API base URL to forward unrecorded requests to")
+    parser.add_argument("--verbose", action="store_true", help="Log every request")
+    return parser.parse_args(argv)
+
+
+def make_server(args: argparse.Namespace) -> ThreadingHTTPServer:
+    handler = type("Handler", (MockHandler,), {"mock": MockOpenAI(args)})
+    server = ThreadingHTTPServer((args.host, args.port), handler)
+    server.daemon_threads = True
+    return server
+
+
+def main():
+    args = parse_args()
+    server = make_server(args)
+    print(f"🧪 Mock OpenAI API on http://{args.host}:{server.server_port}/v1 "
+          f"(latency {args.latency}s ± {args.jitter}s, error rate {args.error_rate:.0%}, seed {args.seed})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with server.RequestHandlerClass.mock.lock:
+            print(f"\n📊 {json.dumps(server.RequestHandlerClass.mock.stats)}")
+
+
+if __name__ == "__main__":
+    main()
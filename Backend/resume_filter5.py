@@ -1,69 +1,265 @@
 # Enhanced AutoGen Resume Filtering System with Duplicate Detection
 # Complete working code with all features integrated
+#
+# Heavy dependencies (autogen, scikit-learn, numpy, PyPDF2, rapidfuzz, jellyfish, spaCy)
+# are imported in the code paths that use them, so admin commands (--status, --reset,
+# --rerank) start quickly. Check with: python benchmarks/check_import_time.py
+
+from __future__ import annotations
 
-import autogen
 import os
 import json
-import PyPDF2
-import docx
-import numpy as np
-from typing import List, Dict, Tuple, Optional, Any, Set
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-import spacy
+import pickle
+import zipfile
+import xml.etree.ElementTree as ET
+from typing import List, Dict, Tuple, Optional, Any, Set, Iterator, Iterable
+from dataclasses import dataclass
 from datetime import datetime
-import pandas as pd
 from pathlib import Path
 import re
 import hashlib
+import math
+import sqlite3
+import threading
 import time
+import uuid
+import zlib
 from difflib import SequenceMatcher
-from collections import defaultdict
-import phonenumbers
-from fuzzywuzzy import fuzz
-import jellyfish
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures, FIRST_COMPLETED
+import ahocorasick
 
-import os
 from dotenv import load_dotenv
 
+
+class _LazyModule:
+    """Module proxy that imports on first attribute access (keeps CLI startup fast)"""
+    
+    def __init__(self, name: str):
+        self._name = name
+    
+    def __getattr__(self, attr: str):
+        import importlib
+        value = getattr(importlib.import_module(self._name), attr)
+        # Later lookups find the attribute directly and skip __getattr__
+        setattr(self, attr, value)
+        return value
+
+
+np = _LazyModule('numpy')
+
 # Load environment variables
 load_dotenv()
 
 # Configuration for OpenAI API
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o")
+# Any OpenAI-compatible endpoint, e.g. mock_openai_server.py for offline benchmarks
+OPENAI_API_BASE = os.getenv("OPENAI_API_BASE", "https://api.openai.com/v1")
+# AutoGen response cache (.cache/<seed>); other endpoints get their own, so mock replies never reach real runs
+LLM_CACHE_SEED = 42 if OPENAI_API_BASE == "https://api.openai.com/v1" else zlib.crc32(OPENAI_API_BASE.encode())
 
-# Validate API key
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY not found in environment variables!")
-
-# Configuration for OpenAI with AutoGen
-config_list = [
-    {
-        "model": OPENAI_MODEL,
-        "api_key": OPENAI_API_KEY,
-        "base_url": "https://api.openai.com/v1",
-        "api_type": "openai"
-    }
-]
-
-# For basic/faster operations
-config_list_basic = [
-    {
-        "model": "gpt-3.5-turbo",
-        "api_key": OPENAI_API_KEY,
-        "base_url": "https://api.openai.com/v1",
-        "api_type": "openai"
-    }
-]
+
+def get_llm_config_lists(http_client=None) -> Tuple[List[Dict], List[Dict]]:
+    """AutoGen config lists (main and basic/faster); the API key is only required here.
+    
+    http_client (e.g. RateLimitScheduler.http_client()) is handed to the OpenAI clients.
+    """
+    if not OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY not found in environment variables!")
+    
+    # Configuration for OpenAI with AutoGen
+    config_list = [
+        {
+            "model": OPENAI_MODEL,
+            "api_key": OPENAI_API_KEY,
+            "base_url": OPENAI_API_BASE,
+        }
+    ]
+    
+    # For basic/faster operations
+    config_list_basic = [
+        {
+            "model": "gpt-3.5-turbo",
+            "api_key": OPENAI_API_KEY,
+            "base_url": OPENAI_API_BASE,
+        }
+    ]
+    
+    if http_client is not None:
+        for config in config_list + config_list_basic:
+            config["http_client"] = http_client
+    
+    return config_list, config_list_basic
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token for English text)"""
+    return len(text) // 4 + 1
+
+
+class RateLimitScheduler:
+    """Shares the API's request and token budgets between concurrent LLM calls.
+    
+    Budgets start from LLM_RPM_LIMIT / LLM_TPM_LIMIT and follow the x-ratelimit-* response headers.
+    Calls wait in acquire() while a budget is used up. A 429 pauses every call for the server's
+    retry-after and halves the concurrency, which then grows back additively: 1/concurrency per
+    successful response, i.e. by one after a full round of concurrent calls succeeds.
+    """
+    
+    WINDOW_SECONDS = 60
+    MAX_CONCURRENCY = 8
+    COMPLETION_TOKENS = 1000  # Reply allowance counted against the token budget
+    MAX_BACKOFF_SECONDS = 60
+    
+    def __init__(self, requests_per_minute: int = None, tokens_per_minute: int = None):
+        self.requests_per_minute = requests_per_minute or int(os.getenv("LLM_RPM_LIMIT", "500"))
+        self.tokens_per_minute = tokens_per_minute or int(os.getenv("LLM_TPM_LIMIT", "30000"))
+        self.concurrency = float(self.MAX_CONCURRENCY)
+        
+        self.condition = threading.Condition()
+        self.window = deque()  # (sent_at, tokens) of calls in the last WINDOW_SECONDS
+        self.window_tokens = 0
+        self.in_flight = 0
+        # Server view from the latest response headers: remaining budget and when it resets
+        self.remaining_requests = None
+        self.remaining_tokens = None
+        self.requests_reset_at = 0.0
+        self.tokens_reset_at = 0.0
+        self.paused_until = 0.0
+        self.consecutive_429 = 0
+        
+        self.stats = {'calls': 0, 'rate_limited': 0, 'waited_seconds': 0.0}
+        self._http_client = None
+    
+    def http_client(self):
+        """httpx client for the OpenAI clients that reports every response to the scheduler"""
+        if self._http_client is None:
+            import httpx
+            self._http_client = httpx.Client(
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                event_hooks={'response': [self.observe_response]},
+            )
+        return self._http_client
+    
+    @staticmethod
+    def _parse_reset(value: Optional[str]) -> float:
+        """Seconds from an x-ratelimit-reset-* header such as '20ms', '1s' or '6m0s'"""
+        if not value:
+            return 0.0
+        factors = {'ms': 0.001, 's': 1, 'm': 60, 'h': 3600}
+        return sum(float(amount) * factors[unit]
+                   for amount, unit in re.findall(r'(\d+(?:\.\d+)?)(ms|h|m|s)', value))
+    
+    def observe_response(self, response):
+        """httpx response hook: update budgets from the rate limit headers, back off on 429"""
+        headers = response.headers
+        now = time.monotonic()
+        with self.condition:
+            if headers.get('x-ratelimit-limit-requests'):
+                self.requests_per_minute = int(headers['x-ratelimit-limit-requests'])
+            if headers.get('x-ratelimit-limit-tokens'):
+                self.tokens_per_minute = int(headers['x-ratelimit-limit-tokens'])
+            if headers.get('x-ratelimit-remaining-requests'):
+                self.remaining_requests = int(headers['x-ratelimit-remaining-requests'])
+                self.requests_reset_at = now + self._parse_reset(headers.get('x-ratelimit-reset-requests'))
+            if headers.get('x-ratelimit-remaining-tokens'):
+                self.remaining_tokens = int(headers['x-ratelimit-remaining-tokens'])
+                self.tokens_reset_at = now + self._parse_reset(headers.get('x-ratelimit-reset-tokens'))
+            
+            if response.status_code == 429:
+                self.consecutive_429 += 1
+                self.stats['rate_limited'] += 1
+                retry_after = 0.0
+                if headers.get('retry-after-ms'):
+                    retry_after = float(headers['retry-after-ms']) / 1000
+                elif headers.get('retry-after', '').replace('.', '', 1).isdigit():
+                    retry_after = float(headers['retry-after'])
+                backoff = retry_after or min(self.MAX_BACKOFF_SECONDS, 2 ** self.consecutive_429)
+                self.paused_until = max(self.paused_until, now + backoff)
+                self.concurrency = max(1.0, self.concurrency / 2)
+                print(f"  🚦 Rate limited (429): pausing LLM calls {backoff:.1f}s, concurrency {int(self.concurrency)}")
+            elif response.status_code < 400:
+                self.consecutive_429 = 0
+                self.concurrency = min(float(self.MAX_CONCURRENCY), self.concurrency + 1 / self.concurrency)
+            self.condition.notify_all()
+    
+    def _wait_time(self, now: float, tokens: int) -> float:
+        """Seconds until a call of this size fits the budgets (0 when it can go now)"""
+        while self.window and now - self.window[0][0] >= self.WINDOW_SECONDS:
+            self.window_tokens -= self.window.popleft()[1]
+        
+        waits = [self.paused_until - now]
+        if self.in_flight >= int(self.concurrency):
+            waits.append(1.0)  # released calls notify earlier
+        if self.remaining_requests is not None and self.remaining_requests <= 0:
+            waits.append(self.requests_reset_at - now)
+        if self.remaining_tokens is not None and self.remaining_tokens < tokens:
+            waits.append(self.tokens_reset_at - now)
+        if self.window:
+            window_free_at = self.window[0][0] + self.WINDOW_SECONDS - now
+            if len(self.window) >= self.requests_per_minute or self.window_tokens + tokens > self.tokens_per_minute:
+                waits.append(window_free_at)
+        return max(waits)
+    
+    def acquire(self, tokens: int, cancelled: Optional[threading.Event] = None) -> bool:
+        """Block until a call estimated at `tokens` (prompt + reply) fits the budgets.
+        Returns False without taking a slot if `cancelled` is set (see cancel()) while waiting."""
+        start = time.monotonic()
+        with self.condition:
+            while True:
+                if cancelled is not None and cancelled.is_set():
+                    return False
+                now = time.monotonic()
+                wait = self._wait_time(now, tokens)
+                if wait <= 0:
+                    break
+                self.condition.wait(timeout=wait)
+            
+            self.window.append((now, tokens))
+            self.window_tokens += tokens
+            self.in_flight += 1
+            # Spend the server-reported budget now; the next response headers correct it
+            if self.remaining_requests is not None:
+                self.remaining_requests -= 1
+            if self.remaining_tokens is not None:
+                self.remaining_tokens -= tokens
+            self.stats['calls'] += 1
+            self.stats['waited_seconds'] += now - start
+        return True
+    
+    def cancel(self, cancelled: threading.Event):
+        """Give up the queue places of calls waiting in acquire() with this event"""
+        with self.condition:
+            cancelled.set()
+            self.condition.notify_all()
+    
+    def release(self):
+        with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+    
+    def summary(self) -> str:
+        return (f"{self.stats['calls']} LLM calls, {self.stats['rate_limited']} rate limited (429), "
+                f"{self.stats['waited_seconds']:.1f}s queued in total, "
+                f"limits {self.requests_per_minute} RPM / {self.tokens_per_minute:,} TPM")
 
 
 class ResumeExtractor:
     """Extract text from various resume formats"""
+
+    # Folder (inside each ticket folder) holding text pre-extracted at upload time
+    SIDECAR_FOLDER = "extracted_text"
     
+    # XML namespaces used by the streaming DOCX extractor
+    _WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+    _MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
     @staticmethod
     def extract_text_from_pdf(file_path: str) -> str:
         """Extract text from PDF file"""
+        import PyPDF2
+        
         try:
             with open(file_path, 'rb') as file:
                 pdf_reader = PyPDF2.PdfReader(file)
@@ -77,15 +273,75 @@ class ResumeExtractor:
     
     @staticmethod
     def extract_text_from_docx(file_path: str) -> str:
-        """Extract text from DOCX file"""
+        """Extract text from DOCX body, tables, text boxes, headers and footers"""
         try:
-            doc = docx.Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-            return text
+            with zipfile.ZipFile(file_path) as archive:
+                part_names = archive.namelist()
+                headers = sorted(n for n in part_names if re.fullmatch(r'word/header\d*\.xml', n))
+                footers = sorted(n for n in part_names if re.fullmatch(r'word/footer\d*\.xml', n))
+                
+                lines = []
+                seen_blocks = set()
+                for part in headers + ['word/document.xml'] + footers:
+                    with archive.open(part) as xml_file:
+                        block = list(ResumeExtractor._iter_docx_paragraphs(xml_file))
+                    
+                    # First-page/default/even headers often repeat the same contact block
+                    block_key = tuple(line for line in block if line.strip())
+                    if part != 'word/document.xml' and (not block_key or block_key in seen_blocks):
+                        continue
+                    seen_blocks.add(block_key)
+                    lines.extend(block)
+                
+                return "\n".join(lines)
         except Exception as e:
             print(f"Error reading DOCX {file_path}: {e}")
             return ""
     
+    @staticmethod
+    def _iter_docx_paragraphs(xml_file) -> Iterator[str]:
+        """Stream paragraph text out of a WordprocessingML part without keeping the tree"""
+        w = ResumeExtractor._WORD_NS
+        paragraph_tag, text_tag = f'{w}p', f'{w}t'
+        tab_tag, break_tags = f'{w}tab', (f'{w}br', f'{w}cr')
+        
+        open_elements = []  # Path from the root to the element being parsed
+        open_paragraphs = []  # Text boxes nest paragraphs inside paragraphs
+        fallback_depth = 0
+        
+        for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+            tag = elem.tag
+            
+            if event == 'start':
+                open_elements.append(elem)
+                if tag == paragraph_tag:
+                    open_paragraphs.append([])
+                elif tag == ResumeExtractor._MC_FALLBACK:
+                    fallback_depth += 1
+                continue
+            
+            # Detach every finished element (its text is read below), so the
+            # tree never holds more than the open path and memory stays flat
+            open_elements.pop()
+            if open_elements:
+                open_elements[-1].remove(elem)
+            
+            if tag == ResumeExtractor._MC_FALLBACK:
+                # Legacy VML copies of text boxes would duplicate their text
+                fallback_depth -= 1
+            elif tag == paragraph_tag:
+                text = ''.join(open_paragraphs.pop())
+                if not fallback_depth:
+                    yield text
+            elif fallback_depth or not open_paragraphs:
+                continue
+            elif tag == text_tag:
+                open_paragraphs[-1].append(elem.text or '')
+            elif tag == tab_tag:
+                open_paragraphs[-1].append('\t')
+            elif tag in break_tags:
+                open_paragraphs[-1].append('\n')
+    
     @staticmethod
     def extract_text(file_path: Path) -> str:
         """Extract text from resume file"""
@@ -101,16 +357,553 @@ class ResumeExtractor:
         else:
             return ""
 
+    @staticmethod
+    def sidecar_path(file_path: Path) -> Path:
+        """Location of the pre-extracted text sidecar for a resume"""
+        return file_path.parent / ResumeExtractor.SIDECAR_FOLDER / f"{file_path.name}.json"
+
+    @staticmethod
+    def write_sidecar(file_path: Path, registry: Optional[CandidateRegistry] = None) -> Optional[Dict]:
+        """Extract text and candidate identifiers once and store them next to the resume"""
+        file_path = Path(file_path)
+        
+        # The same file uploaded to another ticket reuses the features extracted back then
+        known = registry.lookup_document(file_path) if registry else None
+        if known:
+            text, identifiers = known['text'], dict(known['identifiers'], filename=file_path.name)
+        else:
+            text = ResumeExtractor.extract_text(file_path)
+            if not text:
+                return None
+            identifiers = DuplicateCandidateDetector().extract_candidate_identifiers(text, file_path.name)
+
+        stat = file_path.stat()
+        sidecar = {
+            'source_file': file_path.name,
+            'source_size': stat.st_size,
+            'source_mtime': stat.st_mtime,
+            'extracted_at': datetime.now().isoformat(),
+            'text': text,
+            'identifiers': identifiers
+        }
+        if registry:
+            sidecar['global_candidate_id'] = registry.register(file_path, text, identifiers)
+
+        sidecar_file = ResumeExtractor.sidecar_path(file_path)
+        sidecar_file.parent.mkdir(exist_ok=True)
+
+        # Write to a temp file first so a running filter never reads a half-written sidecar
+        tmp_file = sidecar_file.with_suffix('.tmp')
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(sidecar, f, ensure_ascii=False)
+        os.replace(tmp_file, sidecar_file)
+
+        return sidecar
+
+    @staticmethod
+    def load_sidecar(file_path: Path) -> Optional[Dict]:
+        """Load the pre-extracted sidecar if it is still current for the resume file"""
+        sidecar_file = ResumeExtractor.sidecar_path(file_path)
+        if not sidecar_file.exists():
+            return None
+
+        try:
+            with open(sidecar_file, 'r', encoding='utf-8') as f:
+                sidecar = json.load(f)
+
+            # Ignore sidecars written for a previous version of the file
+            stat = file_path.stat()
+            if sidecar.get('source_size') != stat.st_size or sidecar.get('source_mtime') != stat.st_mtime:
+                return None
+
+            return sidecar
+        except Exception as e:
+            print(f"Error reading sidecar for {file_path}: {e}")
+            return None
+
+    @staticmethod
+    def extract_with_identifiers(file_path: Path, registry: Optional[CandidateRegistry] = None) -> Tuple[str, Optional[Dict]]:
+        """Return resume text and pre-computed identifiers, using the sidecar or registry when available"""
+        sidecar = ResumeExtractor.load_sidecar(file_path)
+        if sidecar and sidecar.get('text'):
+            return sidecar['text'], sidecar.get('identifiers')
+        
+        known = registry.lookup_document(file_path) if registry else None
+        if known:
+            return known['text'], dict(known['identifiers'], filename=file_path.name)
+
+        return ResumeExtractor.extract_text(file_path), None
+
+
+class AhoCorasickMatcher:
+    """Aho-Corasick automaton that finds every occurrence of many phrases in one pass"""
+    
+    def __init__(self, patterns: Iterable[str], whole_words: bool = False):
+        self.whole_words = whole_words
+        self.patterns = list(dict.fromkeys(p.lower() for p in patterns if p))
+        
+        self._automaton = ahocorasick.Automaton()
+        for pattern in self.patterns:
+            self._automaton.add_word(pattern, pattern)
+        if self.patterns:
+            self._automaton.make_automaton()
+    
+    @staticmethod
+    def _at_word_boundary(text: str, pattern: str, start: int, end: int) -> bool:
+        """Check that a hit is not part of a longer word (e.g. 'js' inside 'json')"""
+        if pattern[0].isalnum() and start > 0 and text[start - 1].isalnum():
+            return False
+        if pattern[-1].isalnum() and end < len(text) and text[end].isalnum():
+            # Allow plurals such as 'apis' or 'microservices'
+            plural_end = end + 1
+            return text[end] == 's' and (plural_end == len(text) or not text[plural_end].isalnum())
+        return True
+    
+    def iter_matches(self, text: str) -> Iterator[Tuple[str, int]]:
+        """Yield (pattern, start offset) for every occurrence in lowercased text"""
+        if not self.patterns:
+            return
+        
+        for last_index, pattern in self._automaton.iter(text):
+            start = last_index - len(pattern) + 1
+            if not self.whole_words or self._at_word_boundary(text, pattern, start, last_index + 1):
+                yield pattern, start
+    
+    def find(self, text: str) -> Set[str]:
+        """Return the set of patterns present in lowercased text"""
+        found = set()
+        if not self.patterns:
+            return found
+        
+        for last_index, pattern in self._automaton.iter(text):
+            if pattern in found:
+                continue
+            start = last_index - len(pattern) + 1
+            if not self.whole_words or self._at_word_boundary(text, pattern, start, last_index + 1):
+                found.add(pattern)
+        return found
+    
+    def find_offsets(self, text: str) -> Dict[str, List[int]]:
+        """Return start offsets of every occurrence, grouped by pattern"""
+        offsets = defaultdict(list)
+        for pattern, start in self.iter_matches(text):
+            offsets[pattern].append(start)
+        return dict(offsets)
+
+
+class MinHashLSH:
+    """MinHash signatures over word shingles with a banded LSH index for near-duplicate lookup"""
+    
+    INDEX_FILE = "minhash_lsh.npz"
+    NUM_PERM = 128
+    SHINGLE_SIZE = 3
+    SEED = 1
+    RECALL_AT_THRESHOLD = 0.95  # Chance that a pair exactly at the threshold shares a band
+    MERSENNE_PRIME = (1 << 61) - 1
+    
+    def __init__(self, threshold: float = 0.8, num_perm: int = NUM_PERM, shingle_size: int = SHINGLE_SIZE):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        self.bands, self.rows = self._band_layout(threshold, num_perm)
+        
+        self.signatures = {}              # key -> signature (uint64 array of num_perm)
+        self.buckets = defaultdict(set)   # (band, band values) -> keys
+        self._hash_params = None
+    
+    @classmethod
+    def _band_layout(cls, threshold: float, num_perm: int) -> Tuple[int, int]:
+        """Most selective (bands, rows) that still finds pairs at the threshold with the target recall"""
+        for rows in range(num_perm, 0, -1):
+            bands = num_perm // rows
+            if 1 - (1 - threshold ** rows) ** bands >= cls.RECALL_AT_THRESHOLD:
+                return bands, rows
+        return num_perm, 1
+    
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash of the text's word shingles; None when the text has no words"""
+        words = re.findall(r'\w+', text.lower())
+        if not words:
+            return None
+        
+        size = min(self.shingle_size, len(words))
+        shingles = {' '.join(words[i:i + size]) for i in range(len(words) - size + 1)}
+        hashes = np.fromiter((zlib.crc32(shingle.encode()) for shingle in shingles),
+                             dtype=np.uint64, count=len(shingles))
+        
+        if self._hash_params is None:
+            # Random affine permutations (a * x + b) mod p; a, b < 2^32 so nothing overflows uint64
+            rng = np.random.RandomState(self.SEED)
+            self._hash_params = (
+                rng.randint(1, 1 << 32, size=(self.num_perm, 1), dtype=np.uint64),
+                rng.randint(0, 1 << 32, size=(self.num_perm, 1), dtype=np.uint64),
+            )
+        a, b = self._hash_params
+        return ((a * hashes + b) % np.uint64(self.MERSENNE_PRIME)).min(axis=1)
+    
+    @staticmethod
+    def jaccard(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+        """Estimated Jaccard similarity of the two shingle sets"""
+        return float((signature_a == signature_b).mean())
+    
+    def insert(self, key: str, signature: np.ndarray):
+        if key in self.signatures:
+            return
+        self.signatures[key] = signature
+        for band in range(self.bands):
+            band_values = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            self.buckets[(band, band_values)].add(key)
+    
+    def get(self, key: str) -> Optional[np.ndarray]:
+        return self.signatures.get(key)
+    
+    def query(self, signature: np.ndarray) -> Set[str]:
+        """Keys whose estimated similarity to the signature reaches the threshold"""
+        candidates = set()
+        for band in range(self.bands):
+            band_values = signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            candidates.update(self.buckets.get((band, band_values), ()))
+        return {key for key in candidates if self.jaccard(signature, self.signatures[key]) >= self.threshold}
+    
+    def __len__(self) -> int:
+        return len(self.signatures)
+    
+    def save(self, path: Path, keys: Optional[Iterable[str]] = None):
+        """Persist the signatures (all, or only the given keys); buckets are rebuilt on load"""
+        keys = sorted(self.signatures if keys is None else set(keys) & set(self.signatures))
+        path = Path(path)
+        tmp_path = path.with_name(path.stem + '.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            keys=np.array(keys, dtype=str),
+            signatures=np.array([self.signatures[key] for key in keys], dtype=np.uint64).reshape(len(keys), self.num_perm),
+            params=np.array([self.num_perm, self.shingle_size]),
+            threshold=np.array(self.threshold),
+        )
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: Path, threshold: Optional[float] = None) -> 'MinHashLSH':
+        with np.load(path, allow_pickle=False) as data:
+            num_perm, shingle_size = (int(value) for value in data['params'])
+            index = cls(float(data['threshold']) if threshold is None else threshold, num_perm, shingle_size)
+            for key, signature in zip(data['keys'].tolist(), data['signatures']):
+                index.insert(key, signature)
+        return index
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter: 'no' is definite, 'maybe' needs a real lookup"""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size = max(8, int(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, key: str) -> Iterator[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first, second = int.from_bytes(digest[:8], 'little'), int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.hash_count):
+            yield (first + i * second) % self.size
+    
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+
+class CandidateRegistry:
+    """Cross-ticket candidate identities: every resume resolves to a stable candidate ID by its
+    email, phone, GitHub or LinkedIn, and extracted features are kept per file content"""
+    
+    REGISTRY_FILE = "candidate_registry.db"
+    IDENTIFIER_KINDS = [('email', 'emails'), ('phone', 'phones'), ('github', 'github'), ('linkedin', 'linkedin')]
+    # Reusing or merging a known candidate is permanent, so it needs this many identifiers in common
+    # (one shared value may be a recruiter's number or a template leftover)
+    MERGE_MIN_SHARED_IDENTIFIERS = 2
+    # Kinds personal enough that a single shared value confirms the candidate
+    STRONG_IDENTIFIER_KINDS = {'email'}
+    # Template values that many unrelated resumes carry
+    PLACEHOLDER_EMAIL_USERS = {'test', 'example', 'email', 'name', 'user', 'username', 'sample', 'abc', 'xyz',
+                               'yourname', 'your.name', 'youremail', 'your.email', 'john.doe', 'noreply', 'no-reply'}
+    PLACEHOLDER_EMAIL_DOMAINS = {'example.com', 'example.org', 'test.com', 'domain.com', 'email.com', 'yourdomain.com'}
+    PLACEHOLDER_PROFILES = {'username', 'yourname', 'your-name', 'yourprofile', 'your-profile', 'profile', 'in'}
+    
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.conn = sqlite3.connect(str(self.db_path), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                candidate_id TEXT PRIMARY KEY,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS identifiers (
+                kind TEXT NOT NULL,
+                value TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                UNIQUE (kind, value)
+            );
+            CREATE INDEX IF NOT EXISTS identifiers_by_candidate ON identifiers (candidate_id);
+            CREATE TABLE IF NOT EXISTS documents (
+                content_sha TEXT PRIMARY KEY,
+                candidate_id TEXT NOT NULL,
+                text TEXT NOT NULL,
+                identifiers TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS submissions (
+                ticket_id TEXT NOT NULL,
+                filename TEXT NOT NULL,
+                content_sha TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                submitted_at TEXT NOT NULL,
+                PRIMARY KEY (ticket_id, filename)
+            );
+        """)
+        
+        # Bloom filter over the identifier keys, so unseen applicants skip the database
+        self.bloom = None
+        self._loaded_rowid = 0
+        self._data_version = None
+        self._refresh_bloom()
+        # Content hashes by (path, size, mtime), so lookup_document and register hash a file once
+        self._content_shas = {}
+    
+    @classmethod
+    def for_tickets_root(cls, tickets_root: Path) -> 'CandidateRegistry':
+        """Registry shared by all tickets under approved_tickets/"""
+        return cls(Path(tickets_root) / cls.REGISTRY_FILE)
+    
+    def close(self):
+        self.conn.close()
+    
+    @staticmethod
+    def file_sha256(file_path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+    
+    def _content_sha(self, file_path: Path) -> str:
+        stat = file_path.stat()
+        cache_key = (str(file_path), stat.st_size, stat.st_mtime_ns)
+        if cache_key not in self._content_shas:
+            self._content_shas[cache_key] = self.file_sha256(file_path)
+        return self._content_shas[cache_key]
+    
+    @classmethod
+    def is_placeholder(cls, kind: str, value: str) -> bool:
+        """Template or low-entropy identifier that cannot tell applicants apart"""
+        if kind == 'phone':
+            # 9876543210, 1234567890, 9999999999, 9090909090 ...
+            return (len(value) < 7 or len(set(value)) <= 2
+                    or value in '01234567890123456789' or value in '98765432109876543210')
+        if kind == 'email':
+            user, _, domain = value.partition('@')
+            return user in cls.PLACEHOLDER_EMAIL_USERS or domain in cls.PLACEHOLDER_EMAIL_DOMAINS
+        return value.rstrip('/').rsplit('/', 1)[-1] in cls.PLACEHOLDER_PROFILES
+    
+    @classmethod
+    def identity_keys(cls, identifiers: Dict) -> List[Tuple[str, str]]:
+        """Normalized (kind, value) pairs that identify an applicant (placeholders left out)"""
+        keys = []
+        for kind, field in cls.IDENTIFIER_KINDS:
+            values = identifiers.get(field) or []
+            for value in ([values] if isinstance(values, str) else values):
+                value = value.strip().lower()
+                if kind == 'phone':
+                    value = re.sub(r'\D', '', value)[-10:]
+                if value and not cls.is_placeholder(kind, value):
+                    keys.append((kind, value))
+        return list(dict.fromkeys(keys))
+    
+    def _refresh_bloom(self):
+        """Add identifiers written since the last refresh (also by other processes)"""
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        if self.bloom is not None and data_version == self._data_version and self.bloom.count <= self.bloom.capacity:
+            return
+        self._data_version = data_version
+        
+        total = self.conn.execute("SELECT COALESCE(MAX(rowid), 0) FROM identifiers").fetchone()[0]
+        if self.bloom is None or total > self.bloom.capacity:
+            # (Re)size with headroom and load everything
+            self.bloom = BloomFilter(max(10000, total * 2))
+            self._loaded_rowid = 0
+        
+        rows = self.conn.execute("SELECT rowid, kind, value FROM identifiers WHERE rowid > ?", (self._loaded_rowid,))
+        for rowid, kind, value in rows:
+            self.bloom.add(f"{kind}:{value}")
+            self._loaded_rowid = max(self._loaded_rowid, rowid)
+    
+    def _shared_keys(self, keys: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+        """Kinds of the keys owned by each known candidate; the Bloom filter answers most misses"""
+        self._refresh_bloom()
+        shared = defaultdict(list)
+        for kind, value in keys:
+            if f"{kind}:{value}" not in self.bloom:
+                continue
+            row = self.conn.execute(
+                "SELECT candidate_id FROM identifiers WHERE kind = ? AND value = ?", (kind, value)
+            ).fetchone()
+            if row:
+                shared[row[0]].append(kind)
+        return shared
+    
+    @classmethod
+    def _is_confirmed(cls, shared_kinds: List[str]) -> bool:
+        """Enough shared identifiers to treat a known candidate as the same person"""
+        return (len(shared_kinds) >= cls.MERGE_MIN_SHARED_IDENTIFIERS
+                or any(kind in cls.STRONG_IDENTIFIER_KINDS for kind in shared_kinds))
+    
+    def _confirmed_owners(self, shared: Dict[str, List[str]]) -> List[str]:
+        """Confirmed candidates sharing identifiers, most shared first, then oldest"""
+        owners = [cand_id for cand_id, kinds in shared.items() if self._is_confirmed(kinds)]
+        if len(owners) > 1:
+            placeholders = ','.join('?' * len(owners))
+            first_seen = dict(self.conn.execute(
+                f"SELECT candidate_id, first_seen FROM candidates WHERE candidate_id IN ({placeholders})", owners
+            ).fetchall())
+            owners.sort(key=lambda cand_id: (-len(shared[cand_id]), first_seen.get(cand_id, '')))
+        return owners
+    
+    def resolve(self, identifiers: Dict) -> Optional[str]:
+        """Stable candidate ID for these identifiers, or None for an unseen or unconfirmed applicant"""
+        owners = self._confirmed_owners(self._shared_keys(self.identity_keys(identifiers)))
+        return owners[0] if owners else None
+    
+    def lookup_document(self, file_path: Path) -> Optional[Dict]:
+        """Text, identifiers and candidate ID extracted earlier from a file with the same content"""
+        row = self.conn.execute(
+            "SELECT candidate_id, text, identifiers FROM documents WHERE content_sha = ?",
+            (self._content_sha(Path(file_path)),)
+        ).fetchone()
+        if not row:
+            return None
+        return {'candidate_id': row[0], 'text': row[1], 'identifiers': json.loads(row[2])}
+    
+    def register(self, file_path: Path, text: str, identifiers: Dict) -> str:
+        """Resolve a submitted resume to its stable candidate ID and record it with its features"""
+        file_path = Path(file_path)
+        content_sha = self._content_sha(file_path)
+        keys = self.identity_keys(identifiers)
+        now = datetime.now().isoformat()
+        
+        with self.conn:
+            shared = self._shared_keys(keys)
+            # Only a confirmed match reuses a known ID; one shared phone or profile is not enough
+            owners = self._confirmed_owners(shared)
+            if not owners:
+                # No confirmed contact match: the same file content is the only link
+                row = self.conn.execute(
+                    "SELECT candidate_id FROM documents WHERE content_sha = ?", (content_sha,)
+                ).fetchone()
+                owners = [row[0]] if row else []
+            
+            candidate_id = owners[0] if owners else uuid.uuid4().hex[:16]
+            self.conn.execute(
+                "INSERT INTO candidates (candidate_id, first_seen, last_seen) VALUES (?, ?, ?) "
+                "ON CONFLICT (candidate_id) DO UPDATE SET last_seen = excluded.last_seen",
+                (candidate_id, now, now)
+            )
+            
+            # Unowned identifiers go to this candidate; owned ones stay with their owner
+            for kind, value in keys:
+                inserted = self.conn.execute(
+                    "INSERT OR IGNORE INTO identifiers (kind, value, candidate_id) VALUES (?, ?, ?)",
+                    (kind, value, candidate_id)
+                ).rowcount
+                if inserted:
+                    self.bloom.add(f"{kind}:{value}")
+                else:
+                    # Owned already (possibly registered by another process since our lookup)
+                    owner = self.conn.execute(
+                        "SELECT candidate_id FROM identifiers WHERE kind = ? AND value = ?", (kind, value)
+                    ).fetchone()[0]
+                    if owner != candidate_id and kind not in shared[owner]:
+                        shared[owner].append(kind)
+            
+            # This resume links several known candidates: they are the same person if it shares
+            # enough identifiers with each (other links stay with their own candidate)
+            for other_id, kinds in shared.items():
+                if other_id != candidate_id and len(kinds) >= self.MERGE_MIN_SHARED_IDENTIFIERS:
+                    for table in ('identifiers', 'documents', 'submissions'):
+                        self.conn.execute(f"UPDATE {table} SET candidate_id = ? WHERE candidate_id = ?",
+                                          (candidate_id, other_id))
+                    self.conn.execute("DELETE FROM candidates WHERE candidate_id = ?", (other_id,))
+            
+            self.conn.execute(
+                "INSERT OR REPLACE INTO documents (content_sha, candidate_id, text, identifiers) VALUES (?, ?, ?, ?)",
+                (content_sha, candidate_id, text, json.dumps(identifiers))
+            )
+            self.conn.execute(
+                "INSERT OR REPLACE INTO submissions (ticket_id, filename, content_sha, candidate_id, submitted_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (file_path.parent.name, file_path.name, content_sha, candidate_id, now)
+            )
+        
+        return candidate_id
+    
+    def submissions(self, candidate_id: str) -> List[Dict]:
+        """Every ticket and file the candidate applied with"""
+        rows = self.conn.execute(
+            "SELECT ticket_id, filename, submitted_at FROM submissions WHERE candidate_id = ? ORDER BY submitted_at",
+            (candidate_id,)
+        ).fetchall()
+        return [{'ticket_id': ticket_id, 'filename': filename, 'submitted_at': submitted_at}
+                for ticket_id, filename, submitted_at in rows]
+
 
 class DuplicateCandidateDetector:
     """Advanced duplicate candidate detection system"""
     
-    def __init__(self):
+    NEAR_DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard similarity of the resume bodies
+    
+    def __init__(self, near_duplicate_threshold: float = NEAR_DUPLICATE_THRESHOLD):
         self.candidates_db = {}
         self.email_to_id = {}
         self.phone_to_id = {}
         self.name_variations = defaultdict(set)
-        
+        # Blocking index: key -> [(insertion order, candidate_id)], see _blocking_keys
+        self.blocks = defaultdict(list)
+        # Near-duplicate content: MinHash signatures of the resume bodies, keyed by content_hash
+        self.content_index = MinHashLSH(near_duplicate_threshold)
+        # Disjoint sets of confirmed duplicates: candidate_id -> parent, and root -> set size
+        self.duplicate_parent = {}
+        self.duplicate_set_size = {}
+        # Confirmed duplicate pairs, kept so the sets can be rebuilt without a removed candidate
+        self.duplicate_edges = []
+        # Soundex code of every name seen, computed once per name
+        self.soundex_codes = {}
+    
+    def to_state(self) -> Dict:
+        """Plain data an incremental run rebuilds the detector from (see from_state)"""
+        return {
+            'candidates': [[cand_id, identifiers] for cand_id, identifiers in self.candidates_db.items()],
+            'duplicate_edges': [list(edge) for edge in self.duplicate_edges],
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict, keep_filenames: Optional[Set[str]] = None) -> 'DuplicateCandidateDetector':
+        """Rebuild a detector from to_state data, leaving out candidates whose file is not in
+        keep_filenames (changed or removed resumes) and their duplicate links"""
+        detector = cls()
+        for cand_id, identifiers in state['candidates']:
+            if keep_filenames is None or identifiers['filename'] in keep_filenames:
+                detector._store_candidate(cand_id, identifiers)
+        for cand_id, other_id in state['duplicate_edges']:
+            if cand_id in detector.candidates_db and other_id in detector.candidates_db:
+                detector._add_duplicate_edge(cand_id, other_id)
+        return detector
+    
     def extract_candidate_identifiers(self, resume_text: str, filename: str) -> Dict:
         """Extract all possible identifiers from resume"""
         identifiers = {
@@ -226,6 +1019,10 @@ class DuplicateCandidateDetector:
     
     def _generate_content_hash(self, text: str) -> str:
         """Generate hash of key content (excluding name)"""
+        return hashlib.md5(self._normalized_content(text).encode()).hexdigest()
+    
+    def _normalized_content(self, text: str) -> str:
+        """Resume body used for content comparison: no header lines, emails or phones"""
         # Remove potential name lines (first few lines)
         lines = text.split('\n')
         content_lines = lines[5:] if len(lines) > 5 else lines
@@ -236,13 +1033,11 @@ class DuplicateCandidateDetector:
         content = re.sub(r'\+?1?\s*\(?(\d{3})\)?[\s.-]?(\d{3})[\s.-]?(\d{4})', '', content)
         
         # Normalize whitespace
-        content = ' '.join(content.split())
-        
-        return hashlib.md5(content.encode()).hexdigest()
+        return ' '.join(content.split())
     
     def _generate_education_hash(self, text: str) -> str:
         """Generate hash based on education details"""
-        education_section = self._extract_section(text, ['education', 'academic', 'qualification'])
+        education_section = self.extract_section(text, ['education', 'academic', 'qualification'])
         
         # Extract degree and institution patterns
         degree_patterns = [
@@ -267,7 +1062,7 @@ class DuplicateCandidateDetector:
     
     def _generate_experience_hash(self, text: str) -> str:
         """Generate hash based on work experience"""
-        experience_section = self._extract_section(text, ['experience', 'employment', 'work history'])
+        experience_section = self.extract_section(text, ['experience', 'employment', 'work history'])
         
         # Extract company names (capitalized words that might be companies)
         companies = re.findall(r'\b([A-Z][a-zA-Z]+(?:\s+[A-Z][a-zA-Z]+)*)\b', experience_section)
@@ -283,14 +1078,28 @@ class DuplicateCandidateDetector:
         exp_string = ' '.join(sorted(companies[:5] + years + techs_found))
         return hashlib.md5(exp_string.encode()).hexdigest()[:16]
     
-    def _extract_section(self, text: str, section_keywords: List[str]) -> str:
-        """Extract a section from resume based on keywords"""
+    @staticmethod
+    def extract_section(text: str, section_keywords: List[str], heading_max_words: Optional[int] = None) -> str:
+        """Extract a section from resume based on keywords
+        (with heading_max_words, longer lines never count as headings)"""
         lines = text.split('\n')
+        return '\n'.join(lines[i] for i in DuplicateCandidateDetector.section_line_numbers(
+            lines, section_keywords, heading_max_words
+        ))
+    
+    @staticmethod
+    def section_line_numbers(lines: List[str], section_keywords: List[str],
+                             heading_max_words: Optional[int] = None) -> List[int]:
+        """Indexes of the lines extract_section returns, so overlapping sections can be told apart"""
         section_start = -1
         section_lines = []
         
         for i, line in enumerate(lines):
             line_lower = line.lower()
+            if heading_max_words and len(line.split()) > heading_max_words:
+                if section_start >= 0:
+                    section_lines.append(i)
+                continue
             
             # Check if this line starts our section
             if any(keyword in line_lower for keyword in section_keywords):
@@ -305,12 +1114,54 @@ class DuplicateCandidateDetector:
                     if not any(keyword in line_lower for keyword in section_keywords):
                         break
                 
-                section_lines.append(line)
+                section_lines.append(i)
         
-        return '\n'.join(section_lines)
+        return section_lines
     
-    def calculate_similarity_score(self, id1: Dict, id2: Dict) -> Dict[str, float]:
-        """Calculate similarity scores between two candidates"""
+    def _soundex(self, name: str) -> Optional[str]:
+        if name not in self.soundex_codes:
+            import jellyfish
+            
+            try:
+                self.soundex_codes[name] = jellyfish.soundex(name)
+            except Exception:
+                self.soundex_codes[name] = None
+        return self.soundex_codes[name]
+    
+    def name_similarities(self, names: List[str], others: List[List[str]]) -> List[float]:
+        """Best name similarity of `names` against each entry of `others`: max of fuzzy token-sort
+        ratio (one rapidfuzz cdist matrix), equal soundex (1.0, compared as arrays) and one name
+        containing the other (0.8)"""
+        from rapidfuzz import fuzz, process, utils
+        
+        flat = [name for group in others for name in group]
+        if not names or not flat:
+            return [0.0] * len(others)
+        
+        fuzzy = process.cdist(names, flat, scorer=fuzz.token_sort_ratio, processor=utils.default_process,
+                              dtype=np.float64) / 100.0
+        
+        codes = np.array([self._soundex(name) for name in names], dtype=object)
+        other_codes = np.array([self._soundex(name) for name in flat], dtype=object)
+        has_code = np.array([code is not None for code in codes])
+        phonetic = (codes[:, None] == other_codes[None, :]) & has_code[:, None]
+        
+        lowered = [name.lower() for name in names]
+        other_lowered = [name.lower() for name in flat]
+        # A plain substring test per pair: for a few names against a block it beats the vectorized
+        # alternatives (np.char.find loops in Python, partial_ratio aligns every pair)
+        contains = np.array([[0.8 if a in b or b in a else 0.0 for b in other_lowered] for a in lowered])
+        
+        best_per_name = np.maximum(np.maximum(fuzzy, phonetic), contains).max(axis=0)
+        
+        # Reduce per candidate; candidates without names stay at 0
+        owners = np.repeat(np.arange(len(others)), [len(group) for group in others])
+        similarities = np.zeros(len(others))
+        np.maximum.at(similarities, owners, best_per_name)
+        return similarities.tolist()
+    
+    def calculate_similarity_score(self, id1: Dict, id2: Dict, name_similarity: Optional[float] = None) -> Dict[str, float]:
+        """Calculate similarity scores between two candidates (name_similarity may come precomputed)"""
         scores = {
             'email_match': 0.0,
             'phone_match': 0.0,
@@ -332,28 +1183,10 @@ class DuplicateCandidateDetector:
             if set(id1['phones']) & set(id2['phones']):
                 scores['phone_match'] = 1.0
         
-        # Name similarity
-        if id1['names'] and id2['names']:
-            max_similarity = 0.0
-            for name1 in id1['names']:
-                for name2 in id2['names']:
-                    # Fuzzy matching
-                    fuzzy_score = fuzz.token_sort_ratio(name1.lower(), name2.lower()) / 100.0
-                    
-                    # Phonetic matching
-                    try:
-                        phonetic_score = 1.0 if jellyfish.soundex(name1) == jellyfish.soundex(name2) else 0.0
-                    except:
-                        phonetic_score = 0.0
-                    
-                    # Check if one name contains the other (nickname/shortened name)
-                    contains_score = 0.8 if (name1.lower() in name2.lower() or 
-                                           name2.lower() in name1.lower()) else 0.0
-                    
-                    similarity = max(fuzzy_score, phonetic_score, contains_score)
-                    max_similarity = max(max_similarity, similarity)
-            
-            scores['name_similarity'] = max_similarity
+        # Name similarity (fuzzy, phonetic, nickname/shortened name)
+        if name_similarity is None:
+            name_similarity = self.name_similarities(id1['names'], [id2['names']])[0]
+        scores['name_similarity'] = name_similarity
         
         # GitHub match
         if id1['github'] and id2['github']:
@@ -363,9 +1196,14 @@ class DuplicateCandidateDetector:
         if id1['linkedin'] and id2['linkedin']:
             scores['linkedin_match'] = 1.0 if id1['linkedin'] == id2['linkedin'] else 0.0
         
-        # Content similarity
+        # Content similarity (exact, else estimated from the MinHash signatures)
         if id1['content_hash'] == id2['content_hash']:
             scores['content_similarity'] = 1.0
+        else:
+            signature1 = self.content_index.get(id1['content_hash'])
+            signature2 = self.content_index.get(id2['content_hash'])
+            if signature1 is not None and signature2 is not None:
+                scores['content_similarity'] = self.content_index.jaccard(signature1, signature2)
         
         # Education match
         if id1['education_hash'] == id2['education_hash']:
@@ -397,6 +1235,9 @@ class DuplicateCandidateDetector:
         if scores['content_similarity'] == 1.0:
             return True, 0.9, "Identical resume content"
         
+        if scores['content_similarity'] >= self.content_index.threshold:
+            return True, 0.85, "Near-identical resume content"
+        
         # Combination scoring for probable duplicates
         weighted_score = (
             scores['name_similarity'] * 0.2 +
@@ -417,9 +1258,35 @@ class DuplicateCandidateDetector:
         
         return False, weighted_score, "Not duplicate"
     
-    def add_candidate(self, resume_text: str, filename: str) -> Tuple[str, List[Dict]]:
-        """Add candidate and check for duplicates"""
-        identifiers = self.extract_candidate_identifiers(resume_text, filename)
+    @staticmethod
+    def _blocking_keys(identifiers: Dict) -> List[Tuple]:
+        """Keys two candidates must share for is_duplicate to accept them without an email/phone hit"""
+        keys = [('content', identifiers['content_hash'])]
+        if identifiers['github']:
+            keys.append(('github', identifiers['github']))
+        if identifiers['linkedin']:
+            keys.append(('linkedin', identifiers['linkedin']))
+        # Name + education + experience rule; name similarity is 0 when either side has no names,
+        # and the weighted score alone cannot pass 0.85 without (near-)identical content.
+        # Near-identical content is found through content_index instead of a block.
+        if identifiers['names']:
+            keys.append(('profile', identifiers['education_hash'], identifiers['experience_hash']))
+        return keys
+    
+    def add_candidate(self, resume_text: str, filename: str,
+                      identifiers: Optional[Dict] = None) -> Tuple[str, List[Dict]]:
+        """Add candidate and check for duplicates (identifiers may come pre-extracted)"""
+        if identifiers is None:
+            identifiers = self.extract_candidate_identifiers(resume_text, filename)
+        else:
+            identifiers = dict(identifiers, filename=filename)
+        
+        # MinHash signature of the body, reused when the same content was seen before
+        signature = self.content_index.get(identifiers['content_hash'])
+        if signature is None and resume_text:
+            signature = self.content_index.signature(self._normalized_content(resume_text))
+            if signature is not None:
+                self.content_index.insert(identifiers['content_hash'], signature)
         
         # Check for duplicates
         duplicates = []
@@ -457,10 +1324,21 @@ class DuplicateCandidateDetector:
                             'matched_by': 'phone'
                         })
         
-        # Check all candidates for similarity (if no exact match found)
+        blocking_keys = self._blocking_keys(identifiers)
+        
+        # Check similar candidates (if no exact match found); only those sharing a block can qualify
         if not duplicates:
-            for cand_id, candidate in self.candidates_db.items():
-                scores = self.calculate_similarity_score(identifiers, candidate)
+            search_keys = list(blocking_keys)
+            if signature is not None:
+                search_keys.extend(('content', content_hash) for content_hash in self.content_index.query(signature))
+            block_members = sorted(set(member for key in search_keys for member in self.blocks.get(key, ())))
+            # Names against the whole block in one matrix call
+            name_scores = self.name_similarities(
+                identifiers['names'], [self.candidates_db[cand_id]['names'] for _, cand_id in block_members]
+            )
+            for (_, cand_id), name_score in zip(block_members, name_scores):
+                candidate = self.candidates_db[cand_id]
+                scores = self.calculate_similarity_score(identifiers, candidate, name_score)
                 is_dup, confidence, reason = self.is_duplicate(scores)
                 if is_dup:
                     duplicates.append({
@@ -474,10 +1352,21 @@ class DuplicateCandidateDetector:
         # Generate unique ID
         candidate_id = hashlib.md5(f"{filename}_{datetime.now().isoformat()}".encode()).hexdigest()[:12]
         
-        # Store candidate
+        self._store_candidate(candidate_id, identifiers)
+        
+        # Record every confirmed duplicate edge
+        for duplicate in duplicates:
+            self._add_duplicate_edge(duplicate['candidate_id'], candidate_id)
+        
+        return candidate_id, duplicates
+    
+    def _store_candidate(self, candidate_id: str, identifiers: Dict):
+        """Add a candidate to the store and the lookup indexes"""
+        position = len(self.candidates_db)
         self.candidates_db[candidate_id] = identifiers
+        for key in self._blocking_keys(identifiers):
+            self.blocks[key].append((position, candidate_id))
         
-        # Update indexes
         for email in identifiers['emails']:
             self.email_to_id[email] = candidate_id
         
@@ -487,49 +1376,54 @@ class DuplicateCandidateDetector:
         # Track name variations
         for name in identifiers['names']:
             self.name_variations[name.lower()].add(candidate_id)
-        
-        return candidate_id, duplicates
+    
+    def _add_duplicate_edge(self, cand_id: str, other_id: str):
+        self.duplicate_edges.append((cand_id, other_id))
+        self._union(cand_id, other_id)
+    
+    def load_content_index(self, path: Path):
+        """Reuse MinHash signatures persisted by an earlier run"""
+        try:
+            self.content_index = MinHashLSH.load(path, threshold=self.content_index.threshold)
+        except Exception as e:
+            print(f"  ⚠️ Ignoring unreadable MinHash index: {e}")
+    
+    def save_content_index(self, path: Path):
+        """Persist the signatures of the current candidates"""
+        try:
+            self.content_index.save(path, keys=[c['content_hash'] for c in self.candidates_db.values()])
+        except Exception as e:
+            print(f"  ⚠️ Could not save MinHash index: {e}")
+    
+    def _find(self, cand_id: str) -> str:
+        """Root of the candidate's duplicate set (with path halving)"""
+        parent = self.duplicate_parent
+        while parent.get(cand_id, cand_id) != cand_id:
+            parent[cand_id] = parent.get(parent[cand_id], parent[cand_id])
+            cand_id = parent[cand_id]
+        return cand_id
+    
+    def _union(self, cand_id: str, other_id: str):
+        """Merge two duplicate sets, attaching the smaller one to the larger"""
+        root, other_root = self._find(cand_id), self._find(other_id)
+        if root == other_root:
+            return
+        size = self.duplicate_set_size.get(root, 1)
+        other_size = self.duplicate_set_size.get(other_root, 1)
+        if size < other_size:
+            root, other_root = other_root, root
+        self.duplicate_parent[other_root] = root
+        self.duplicate_set_size[root] = size + other_size
+        self.duplicate_set_size.pop(other_root, None)
     
     def get_duplicate_groups(self) -> List[List[Dict]]:
         """Get groups of duplicate candidates with details"""
-        groups = []
-        processed = set()
-        
-        for cand_id in self.candidates_db:
-            if cand_id in processed:
-                continue
-            
-            group = [{'candidate_id': cand_id, 'filename': self.candidates_db[cand_id]['filename']}]
-            processed.add(cand_id)
-            
-            # Find all related candidates
-            candidate = self.candidates_db[cand_id]
-            
-            # Check by identifiers
-            for email in candidate['emails']:
-                for other_id in self.candidates_db:
-                    if other_id != cand_id and other_id not in processed:
-                        if email in self.candidates_db[other_id]['emails']:
-                            group.append({
-                                'candidate_id': other_id,
-                                'filename': self.candidates_db[other_id]['filename']
-                            })
-                            processed.add(other_id)
-            
-            for phone in candidate['phones']:
-                for other_id in self.candidates_db:
-                    if other_id != cand_id and other_id not in processed:
-                        if phone in self.candidates_db[other_id]['phones']:
-                            group.append({
-                                'candidate_id': other_id,
-                                'filename': self.candidates_db[other_id]['filename']
-                            })
-                            processed.add(other_id)
-            
-            if len(group) > 1:
-                groups.append(group)
+        members = defaultdict(list)
+        for cand_id, candidate in self.candidates_db.items():
+            members[self._find(cand_id)].append({'candidate_id': cand_id, 'filename': candidate['filename']})
         
-        return groups
+        # Groups in order of their first submission, members in submission order
+        return [group for group in members.values() if len(group) > 1]
 
 
 class DuplicateHandlingStrategy:
@@ -585,6 +1479,9 @@ class EnhancedJobTicket:
         self.ticket_id = self.ticket_folder.name
         self.raw_data = self._load_raw_data()
         self.job_details = self._merge_with_updates()
+        # Parsed once; see tech_stack and compile_profile
+        self._tech_stack = None
+        self._profile = None
         self._print_loaded_details()
     
     def _load_raw_data(self) -> Dict:
@@ -742,7 +1639,8 @@ class EnhancedJobTicket:
             else:
                 expanded_skills.append(skill.strip())
         
-        return list(set([s for s in expanded_skills if s]))
+        # Deduplicate in a stable order so per-ticket caches and feature stores line up across runs
+        return list(dict.fromkeys(s for s in expanded_skills if s))
     
     @property
     def position(self) -> str:
@@ -776,8 +1674,16 @@ class EnhancedJobTicket:
     
     @property
     def tech_stack(self) -> List[str]:
-        skills = self.job_details.get('required_skills') or self.job_details.get('tech_stack', '')
-        return self._parse_skills(skills)
+        if self._tech_stack is None:
+            skills = self.job_details.get('required_skills') or self.job_details.get('tech_stack', '')
+            self._tech_stack = tuple(self._parse_skills(skills))
+        return list(self._tech_stack)
+    
+    def compile_profile(self, resume_filter: UpdateAwareResumeFilter) -> JobProfile:
+        """Compile the requirements for scoring once; later calls return the same profile"""
+        if self._profile is None:
+            self._profile = JobProfile.compile(self, resume_filter)
+        return self._profile
     
     @property
     def requirements(self) -> List[str]:
@@ -838,9 +1744,53 @@ class EnhancedJobTicket:
         return filtered_resumes
 
 
+@dataclass(frozen=True)
+class JobProfile:
+    """Ticket requirements compiled once for scoring; immutable so scorer workers can share it"""
+    
+    position: str
+    skills: Tuple[str, ...]
+    skill_matcher: AhoCorasickMatcher
+    skill_plan: Tuple[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]], ...]
+    experience_required: str
+    experience_min: int
+    experience_max: int
+    location: str       # raw value, for reports
+    location_key: str   # lowercased and whitespace-collapsed, for matching
+    remote: bool
+    
+    @classmethod
+    def compile(cls, job_ticket: EnhancedJobTicket, resume_filter: UpdateAwareResumeFilter) -> 'JobProfile':
+        skills = tuple(job_ticket.tech_stack)
+        skill_matcher, skill_plan = resume_filter.compile_skill_matcher(skills)
+        experience_min, experience_max = resume_filter.parse_experience_range(job_ticket.experience_required)
+        location_key = ' '.join(job_ticket.location.lower().split())
+        
+        return cls(
+            position=job_ticket.position,
+            skills=skills,
+            skill_matcher=skill_matcher,
+            skill_plan=skill_plan,
+            experience_required=job_ticket.experience_required,
+            experience_min=experience_min,
+            experience_max=experience_max,
+            location=job_ticket.location,
+            location_key=location_key,
+            remote='remote' in location_key,
+        )
+
+
 class ProfessionalDevelopmentScorer:
     """Score candidates based on continuous learning and professional development"""
     
+    COMPONENT_WEIGHTS = {
+        'certifications': 0.35,
+        'online_learning': 0.25,
+        'conferences': 0.20,
+        'content_creation': 0.20
+    }
+    RECENCY_BONUS = 0.1
+    
     def __init__(self):
         self.current_year = datetime.now().year
         self.current_month = datetime.now().month
@@ -1025,25 +1975,66 @@ class ProfessionalDevelopmentScorer:
                 'weight': 0.7
             }
         }
+        
+        # Regexes are only run when their literal anchor was seen by the scan
+        self.course_indicators = [(anchor, re.compile(pattern)) for anchor, pattern in [
+            ('course', r'completed?\s+\d+\s+courses?'),
+            ('course', r'\d+\s+courses?\s+completed'),
+            ('certificatio', r'certification?\s+in'),
+            ('specialization', r'specialization\s+in'),
+            ('nanodegree', r'nanodegree'),
+            ('micromasters', r'micromasters'),
+            ('professional certificate', r'professional certificate')
+        ]]
+        self.specialization_terms = ['specialization', 'nanodegree', 'micromasters']
+        self.github_stats_patterns = [(anchor, re.compile(pattern)) for anchor, pattern in [
+            ('stars', r'(\d+)\+?\s*stars'),
+            ('followers', r'(\d+)\+?\s*followers'),
+            ('repositories', r'(\d+)\+?\s*repositories'),
+            ('contributions', r'(\d+)\+?\s*contributions')
+        ]]
+        
+        # 4-digit years between 2010 and 2029
+        self.year_pattern = re.compile(r'\b(20[1-2][0-9])\b')
+        
+        # All pattern tables compiled into one automaton, scanned once per resume
+        self.pd_matcher = AhoCorasickMatcher(self._all_patterns())
     
-    def extract_years_from_text(self, text: str, keyword: str, look_ahead: int = 50) -> List[int]:
-        """Extract years mentioned near a keyword"""
+    def _all_patterns(self) -> Iterator[str]:
+        """Yield every phrase the component scorers look for"""
+        for cert_types in self.certifications_db.values():
+            for cert_info in cert_types.values():
+                yield from cert_info['patterns']
+        for table in (self.learning_platforms, self.conference_patterns, self.content_creation):
+            for info in table.values():
+                yield from info['patterns']
+        yield from self.specialization_terms
+        yield from (anchor for anchor, _ in self.course_indicators)
+        yield from (anchor for anchor, _ in self.github_stats_patterns)
+    
+    def scan_resume(self, resume_text: str) -> Dict[str, List[int]]:
+        """Find all professional development phrases in one pass, with their offsets"""
+        return self.pd_matcher.find_offsets(resume_text.lower())
+    
+    def extract_years_near_offsets(self, text: str, offsets: List[int], keyword_length: int,
+                                   look_ahead: int = 50) -> List[int]:
+        """Extract years mentioned in windows around known keyword offsets"""
         years_found = []
-        keyword_indices = [m.start() for m in re.finditer(keyword, text.lower())]
         
-        for idx in keyword_indices:
+        for idx in offsets:
             # Look ahead and behind the keyword for year patterns
             start = max(0, idx - 30)
-            end = min(len(text), idx + len(keyword) + look_ahead)
-            snippet = text[start:end]
-            
-            # Find 4-digit years between 2010 and current year + 1
-            year_pattern = r'\b(20[1-2][0-9])\b'
-            years = re.findall(year_pattern, snippet)
+            end = min(len(text), idx + keyword_length + look_ahead)
+            years = self.year_pattern.findall(text[start:end])
             years_found.extend([int(y) for y in years if 2010 <= int(y) <= self.current_year + 1])
         
         return years_found
     
+    def extract_years_from_text(self, text: str, keyword: str, look_ahead: int = 50) -> List[int]:
+        """Extract years mentioned near a keyword"""
+        keyword_indices = [m.start() for m in re.finditer(re.escape(keyword), text.lower())]
+        return self.extract_years_near_offsets(text, keyword_indices, len(keyword), look_ahead)
+    
     def calculate_recency_score(self, years: List[int]) -> float:
         """Calculate how recent the certifications/courses are"""
         if not years:
@@ -1065,9 +2056,10 @@ class ProfessionalDevelopmentScorer:
         else:
             return 0.2  # Older than 5 years
     
-    def score_certifications(self, resume_text: str) -> Dict[str, Any]:
+    def score_certifications(self, resume_text: str, hits: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
         """Score professional certifications"""
-        resume_lower = resume_text.lower()
+        if hits is None:
+            hits = self.scan_resume(resume_text)
         
         results = {
             'certification_score': 0.0,
@@ -1090,13 +2082,13 @@ class ProfessionalDevelopmentScorer:
             
             for cert_type, cert_info in cert_types.items():
                 for pattern in cert_info['patterns']:
-                    if pattern in resume_lower and pattern not in found_certs:
+                    if pattern in hits and pattern not in found_certs:
                         found_certs.add(pattern)
                         results['certification_count'] += 1
                         category_certs.append(pattern)
                         
                         # Extract years for recency
-                        years = self.extract_years_from_text(resume_text, pattern)
+                        years = self.extract_years_near_offsets(resume_text, hits[pattern], len(pattern))
                         all_years.extend(years)
                         
                         # Add to score with weight
@@ -1130,9 +2122,10 @@ class ProfessionalDevelopmentScorer:
         
         return results
     
-    def score_online_learning(self, resume_text: str) -> Dict[str, Any]:
+    def score_online_learning(self, resume_text: str, hits: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
         """Score online course completions"""
-        resume_lower = resume_text.lower()
+        if hits is None:
+            hits = self.scan_resume(resume_text)
         
         results = {
             'online_learning_score': 0.0,
@@ -1148,30 +2141,22 @@ class ProfessionalDevelopmentScorer:
         # Detect learning platforms
         for tier, platform_info in self.learning_platforms.items():
             for platform in platform_info['patterns']:
-                if platform in resume_lower:
+                if platform in hits:
                     platforms_detected.add(platform)
                     platform_weights.append(platform_info['weight'])
         
         results['platforms_found'] = list(platforms_detected)
         
         # Look for course completion indicators
-        course_indicators = [
-            r'completed?\s+\d+\s+courses?',
-            r'\d+\s+courses?\s+completed',
-            r'certification?\s+in',
-            r'specialization\s+in',
-            r'nanodegree',
-            r'micromasters',
-            r'professional certificate'
-        ]
-        
         course_count = 0
-        for pattern in course_indicators:
-            matches = re.findall(pattern, resume_lower)
-            course_count += len(matches)
+        resume_lower = None
+        for anchor, pattern in self.course_indicators:
+            if anchor in hits:
+                resume_lower = resume_lower or resume_text.lower()
+                course_count += len(pattern.findall(resume_lower))
         
         # Check for specializations (higher value)
-        if any(term in resume_lower for term in ['specialization', 'nanodegree', 'micromasters']):
+        if any(term in hits for term in self.specialization_terms):
             results['specializations_mentioned'] = True
             course_count += 2  # Specializations count as multiple courses
         
@@ -1193,7 +2178,7 @@ class ProfessionalDevelopmentScorer:
         # Check for recent learning
         recent_years = []
         for platform in platforms_detected:
-            years = self.extract_years_from_text(resume_text, platform)
+            years = self.extract_years_near_offsets(resume_text, hits[platform], len(platform))
             recent_years.extend(years)
         
         if recent_years:
@@ -1201,9 +2186,11 @@ class ProfessionalDevelopmentScorer:
         
         return results
     
-    def score_conference_participation(self, resume_text: str) -> Dict[str, Any]:
+    def score_conference_participation(self, resume_text: str, hits: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
         """Score conference attendance and speaking"""
-        resume_lower = resume_text.lower()
+        if hits is None:
+            hits = self.scan_resume(resume_text)
+        resume_lower = None
         
         results = {
             'conference_score': 0.0,
@@ -1216,20 +2203,21 @@ class ProfessionalDevelopmentScorer:
         
         # Check for speaking engagements (high value)
         for pattern in self.conference_patterns['speaking']['patterns']:
-            if pattern in resume_lower:
+            if pattern in hits:
                 results['speaker_events'].append(pattern)
+                resume_lower = resume_lower or resume_text.lower()
                 # Try to extract event names
                 event_matches = re.findall(f'{pattern}[^.]*(?:conference|summit|meetup|workshop)', resume_lower)
                 results['events_found'].extend(event_matches)
         
         # Check for conference attendance
         for pattern in self.conference_patterns['attendance']['patterns']:
-            if pattern in resume_lower:
+            if pattern in hits:
                 results['events_found'].append(pattern)
         
         # Check for major conferences
         for conference in self.conference_patterns['major_conferences']['patterns']:
-            if conference in resume_lower:
+            if conference in hits:
                 results['major_conferences'].append(conference)
         
         # Calculate scores
@@ -1248,9 +2236,10 @@ class ProfessionalDevelopmentScorer:
         
         return results
     
-    def score_content_creation(self, resume_text: str) -> Dict[str, Any]:
+    def score_content_creation(self, resume_text: str, hits: Optional[Dict[str, List[int]]] = None) -> Dict[str, Any]:
         """Score technical content creation and community involvement"""
-        resume_lower = resume_text.lower()
+        if hits is None:
+            hits = self.scan_resume(resume_text)
         
         results = {
             'content_creation_score': 0.0,
@@ -1267,25 +2256,20 @@ class ProfessionalDevelopmentScorer:
         # Check each content type
         for content_type, content_info in self.content_creation.items():
             for pattern in content_info['patterns']:
-                if pattern in resume_lower:
+                if pattern in hits:
                     results[f'{content_type}_activity'] = True
                     results['content_platforms'].append(pattern)
                     content_scores.append(content_info['weight'])
                     
-                    # Special handling for GitHub
-                    if 'github' in pattern:
+                    # Special handling for GitHub (stats are resume-wide, extract once)
+                    if 'github' in pattern and results['github_activity'] is None:
                         # Try to extract GitHub stats
-                        stats_patterns = [
-                            r'(\d+)\+?\s*stars',
-                            r'(\d+)\+?\s*followers',
-                            r'(\d+)\+?\s*repositories',
-                            r'(\d+)\+?\s*contributions'
-                        ]
                         github_stats = {}
-                        for stat_pattern in stats_patterns:
-                            match = re.search(stat_pattern, resume_lower)
+                        resume_lower = resume_text.lower()
+                        for anchor, stat_pattern in self.github_stats_patterns:
+                            match = stat_pattern.search(resume_lower) if anchor in hits else None
                             if match:
-                                github_stats[stat_pattern] = int(match.group(1))
+                                github_stats[stat_pattern.pattern] = int(match.group(1))
                         if github_stats:
                             results['github_activity'] = github_stats
         
@@ -1301,19 +2285,16 @@ class ProfessionalDevelopmentScorer:
     def calculate_professional_development_score(self, resume_text: str) -> Dict[str, Any]:
         """Calculate comprehensive professional development score"""
         
-        # Get all component scores
-        cert_results = self.score_certifications(resume_text)
-        learning_results = self.score_online_learning(resume_text)
-        conference_results = self.score_conference_participation(resume_text)
-        content_results = self.score_content_creation(resume_text)
+        # One scan shared by all component scores
+        hits = self.scan_resume(resume_text)
+        
+        cert_results = self.score_certifications(resume_text, hits)
+        learning_results = self.score_online_learning(resume_text, hits)
+        conference_results = self.score_conference_participation(resume_text, hits)
+        content_results = self.score_content_creation(resume_text, hits)
         
         # Calculate weighted overall score
-        weights = {
-            'certifications': 0.35,
-            'online_learning': 0.25,
-            'conferences': 0.20,
-            'content_creation': 0.20
-        }
+        weights = dict(self.COMPONENT_WEIGHTS)
         
         # Combine main scores
         weighted_score = (
@@ -1328,7 +2309,7 @@ class ProfessionalDevelopmentScorer:
             cert_results.get('recent_certification_score', 0),
             learning_results.get('recent_learning_score', 0)
         ]
-        recency_bonus = max(recency_scores) * 0.1 if recency_scores else 0
+        recency_bonus = max(recency_scores) * self.RECENCY_BONUS if recency_scores else 0
         
         # Calculate final score
         final_score = min(weighted_score + recency_bonus, 1.0)
@@ -1408,10 +2389,49 @@ class ProfessionalDevelopmentScorer:
 class UpdateAwareResumeFilter:
     """Resume filter that considers updated job requirements and professional development"""
     
+    SCORING_WEIGHTS = {
+        'skills': 0.40,           # Reduced from 0.50
+        'experience': 0.30,       # Reduced from 0.35
+        'location': 0.10,         # Reduced from 0.15
+        'professional_dev': 0.20  # New weight for PD
+    }
+    
     def __init__(self):
         self.skill_variations = self._build_skill_variations()
+        # Compiled skill matchers, built once per set of required skills
+        self._skill_matchers = {}
         # Add the professional development scorer
         self.pd_scorer = ProfessionalDevelopmentScorer()
+        self._compile_experience_patterns()
+    
+    def _compile_experience_patterns(self):
+        """Compile the experience extraction regexes once per filter"""
+        month = r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)'
+        
+        # Explicit statements such as '5+ years of experience'
+        self.experience_statement_patterns = [re.compile(pattern) for pattern in [
+            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:professional\s*)?experience',
+            r'experience\s*[:–-]\s*(\d+)\+?\s*years?',
+            r'(\d+)\+?\s*years?\s*in\s*(?:software|data|engineering|development)',
+            r'total\s*experience\s*[:–-]\s*(\d+)\+?\s*years?',
+            r'(\d+)\+?\s*yrs?\s*exp',
+        ]]
+        
+        # Employment periods: 'aug 2021 - present', '2018 to 2020', 'since march 2019', ...
+        self.date_range_pattern = re.compile(
+            rf'(?:(?P<since>since\s+)|(?:from\s+)?)'
+            rf'(?:\b(?P<start_month>{month})[a-z]*\.?,?\s*)?(?<!\d)(?P<start_year>\d{{4}})(?!\d)'
+            rf'(?(since)|\s*(?:[-–]|to)\s*(?:(?P<present>present|current|now)\b|'
+            rf'(?:\b(?P<end_month>{month})[a-z]*\.?,?\s*)?(?<!\d)(?P<end_year>\d{{4}})(?!\d)))'
+        )
+        self.month_numbers = {name: number for number, name in enumerate(
+            ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+        
+        # Context checks around a date range (to avoid counting graduation years)
+        self.education_context = re.compile(
+            'education|academic|degree|bachelor|master|phd|university|college|school|institute|gpa')
+        self.experience_context = re.compile(
+            'experience|work|employed|position|role|job|company|engineer at|developer at')
     
     def _build_skill_variations(self) -> Dict[str, List[str]]:
         """Build comprehensive skill variations dictionary"""
@@ -1480,21 +2500,13 @@ class UpdateAwareResumeFilter:
                                    "database", "databases", "rdbms", "nosql databases"],
         }
     
-    def calculate_skill_match_score(self, resume_text: str, required_skills: List[str]) -> tuple[float, List[str], Dict[str, List[str]]]:
-        """Calculate skill matching score with variations"""
-        resume_lower = resume_text.lower()
-        matched_skills = []
-        detailed_matches = {}
+    def compile_skill_matcher(self, required_skills: Iterable[str]) -> Tuple[AhoCorasickMatcher, Tuple[Tuple[str, str, Tuple[str, ...], Tuple[str, ...]], ...]]:
+        """Resolve each required skill to the phrases that count as a match and compile them into one automaton"""
+        plan = []
+        patterns = []
         
         for skill in required_skills:
             skill_lower = skill.lower().strip()
-            skill_matched = False
-            
-            if skill_lower in resume_lower:
-                matched_skills.append(skill)
-                detailed_matches[skill] = [skill_lower]
-                skill_matched = True
-                continue
             
             skill_key = None
             for key in self.skill_variations:
@@ -1502,24 +2514,47 @@ class UpdateAwareResumeFilter:
                     skill_key = key
                     break
             
-            if skill_key and skill_key in self.skill_variations:
-                variations_found = []
-                for variation in self.skill_variations[skill_key]:
-                    if variation in resume_lower:
-                        variations_found.append(variation)
-                        skill_matched = True
-                
-                if variations_found:
-                    matched_skills.append(skill)
-                    detailed_matches[skill] = variations_found
+            variations = tuple(self.skill_variations[skill_key]) if skill_key else ()
+            parts = tuple(part.lower() for part in skill.split()) if ' ' in skill else ()
             
-            if not skill_matched and ' ' in skill:
-                parts = skill.split()
-                if all(part.lower() in resume_lower for part in parts):
-                    matched_skills.append(skill)
-                    detailed_matches[skill] = [skill_lower]
+            plan.append((skill, skill_lower, variations, parts))
+            patterns.extend((skill_lower,) + variations + parts)
+        
+        return AhoCorasickMatcher(patterns, whole_words=True), tuple(plan)
+    
+    def calculate_skill_match_score(self, resume_text: str, required_skills: List[str]) -> tuple[float, List[str], Dict[str, List[str]]]:
+        """Calculate skill matching score with variations"""
+        cache_key = tuple(required_skills)
+        if cache_key not in self._skill_matchers:
+            self._skill_matchers[cache_key] = self.compile_skill_matcher(required_skills)
+        matcher, plan = self._skill_matchers[cache_key]
+        return self.match_skills(resume_text.lower(), matcher, plan)
+    
+    @staticmethod
+    def match_skills(resume_lower: str, matcher: AhoCorasickMatcher, plan: Tuple[Tuple, ...]) -> tuple[float, List[str], Dict[str, List[str]]]:
+        """Match a compiled skill plan (see compile_skill_matcher) against a lowercased resume"""
+        # Single pass over the resume finds every skill phrase at once
+        found = matcher.find(resume_lower)
+        matched_skills = []
+        detailed_matches = {}
+        
+        for skill, skill_lower, variations, parts in plan:
+            if skill_lower in found:
+                matched_skills.append(skill)
+                detailed_matches[skill] = [skill_lower]
+                continue
+            
+            variations_found = [variation for variation in variations if variation in found]
+            if variations_found:
+                matched_skills.append(skill)
+                detailed_matches[skill] = variations_found
+                continue
+            
+            if parts and all(part in found for part in parts):
+                matched_skills.append(skill)
+                detailed_matches[skill] = [skill_lower]
         
-        score = len(matched_skills) / len(required_skills) if required_skills else 0
+        score = len(matched_skills) / len(plan) if plan else 0
         return score, matched_skills, detailed_matches
     
     def parse_experience_range(self, experience_str: str) -> tuple[int, int]:
@@ -1536,196 +2571,133 @@ class UpdateAwareResumeFilter:
         else:
             return 0, 100
     
+    def extract_employment_timeline(self, resume_lower: str) -> List[Tuple[float, float]]:
+        """Collect employment periods in one pass and merge overlapping ones into a timeline"""
+        now = datetime.now()
+        current = now.year + (now.month - 1) / 12.0
+        intervals = []
+        
+        for match in self.date_range_pattern.finditer(resume_lower):
+            start_year = int(match.group('start_year'))
+            if not 1990 < start_year <= now.year:
+                continue
+            # A bare 'since 2015' is usually a membership, not a job
+            if match.group('since') and not match.group('start_month'):
+                continue
+            
+            start_month = self.month_numbers.get(match.group('start_month'), 1)
+            start = start_year + (start_month - 1) / 12.0
+            if match.group('since') or match.group('present'):
+                end = current
+            else:
+                end = int(match.group('end_year'))
+                if match.group('end_month'):
+                    # The end month is worked in full
+                    end += self.month_numbers[match.group('end_month')] / 12.0
+                end = min(end, current)
+            
+            if not 0 <= end - start < 15:
+                continue
+            
+            # Skip graduation years unless the period is clearly a job (month-precise, in a work context)
+            in_education = self.education_context.search(
+                resume_lower, max(0, match.start() - 100), match.end() + 100)
+            if in_education:
+                in_experience = self.experience_context.search(
+                    resume_lower, max(0, match.start() - 200), match.end() + 50)
+                if not (match.group('start_month') and in_experience):
+                    continue
+            
+            intervals.append((start, end))
+        
+        # Merge overlapping periods so parallel or repeated entries are counted once
+        timeline = []
+        for start, end in sorted(intervals):
+            if timeline and start <= timeline[-1][1]:
+                timeline[-1] = (timeline[-1][0], max(timeline[-1][1], end))
+            else:
+                timeline.append((start, end))
+        
+        return timeline
+    
     def calculate_experience_match(self, resume_text: str, required_experience: str) -> tuple[float, int]:
         """Calculate experience matching score"""
         min_req, max_req = self.parse_experience_range(required_experience)
-        
-        # Enhanced patterns to better detect experience
-        patterns = [
-            r'(\d+)\+?\s*years?\s*(?:of\s*)?(?:professional\s*)?experience',
-            r'experience\s*[:–-]\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*years?\s*in\s*(?:software|data|engineering|development)',
-            r'total\s*experience\s*[:–-]\s*(\d+)\+?\s*years?',
-            r'(\d+)\+?\s*yrs?\s*exp',
-            r'(\d{4})\s*[-–]\s*(?:present|current|now|(\d{4}))',
-        ]
-        
-        # Additional patterns for date ranges
-        date_patterns = [
-            # From Month Year - Present/Current format
-            r'from\s+(?:january|february|march|april|may|june|july|august|september|october|november|december),?\s*(\d{4})\s*[-–]\s*(?:present|current|now)',
-            # Month Year - Month Year format
-            r'(?:january|february|march|april|may|june|july|august|september|october|november|december),?\s*(\d{4})\s*[-–]\s*(?:january|february|march|april|may|june|july|august|september|october|november|december),?\s*(\d{4})',
-            # Year to Year format
-            r'(\d{4})\s*(?:to|-|–)\s*(\d{4})',
-            # Since Year format
-            r'since\s+(?:january|february|march|april|may|june|july|august|september|october|november|december),?\s*(\d{4})',
-        ]
-        
-        # New pattern specifically for "August, 2023 - Present" format
-        month_year_patterns = [
-            r'(?:january|february|march|april|may|june|july|august|september|october|november|december),?\s*(\d{4})\s*[-–]\s*(?:present|current|now)',
-            r'(?:jan|feb|mar|apr|may|jun|jul|aug|sep|oct|nov|dec)[a-z]*,?\s*(\d{4})\s*[-–]\s*(?:present|current|now)',
-        ]
-        
-        years_found = []
-        experience_periods = []
-        
-        # Check if we're in an education section (to avoid counting graduation years)
-        education_keywords = ['education', 'academic', 'degree', 'bachelor', 'master', 'phd', 'university', 'college', 'school']
-        
-        # First try to find explicit year mentions (but not in education sections)
-        for pattern in patterns:
-            matches = re.findall(pattern, resume_text.lower())
-            for match in matches:
-                if isinstance(match, tuple):
-                    if match[0].isdigit() and len(match[0]) == 4:
-                        start_year = int(match[0])
-                        if match[1] and match[1].isdigit():
-                            end_year = int(match[1])
-                        else:
-                            end_year = datetime.now().year
-                        
-                        # Check if this year range is likely education-related
-                        match_context = resume_text.lower()[max(0, resume_text.lower().find(match[0])-100):resume_text.lower().find(match[0])+100]
-                        if not any(edu_keyword in match_context for edu_keyword in education_keywords):
-                            if 1990 < start_year <= datetime.now().year:
-                                years_found.append(end_year - start_year)
-                else:
-                    if match.isdigit():
-                        years_found.append(int(match))
-        
-        # Try month/year patterns specifically in experience/work sections
-        experience_keywords = ['experience', 'work', 'employed', 'position', 'role', 'job', 'company', 'engineer at', 'developer at']
-        
-        for pattern in month_year_patterns:
-            for match in re.finditer(pattern, resume_text.lower()):
-                match_text = match.group(1) if match.groups() else match.group(0)
-                if match_text.isdigit():
-                    start_year = int(match_text)
-                    
-                    # Check if this is in an experience context
-                    match_context = resume_text.lower()[max(0, match.start()-200):match.end()+50]
-                    if any(exp_keyword in match_context for exp_keyword in experience_keywords):
-                        if 1990 < start_year <= datetime.now().year:
-                            # Calculate fractional years for recent experience
-                            current_year = datetime.now().year
-                            current_month = datetime.now().month
-                            
-                            # Estimate based on the month mentioned
-                            month_str = resume_text.lower()[max(0, match.start()-20):match.start()].strip()
-                            
-                            # Map months to numbers
-                            month_map = {
-                                'january': 1, 'february': 2, 'march': 3, 'april': 4,
-                                'may': 5, 'june': 6, 'july': 7, 'august': 8,
-                                'september': 9, 'october': 10, 'november': 11, 'december': 12
-                            }
-                            
-                            start_month = 1  # Default to January
-                            for month_name, month_num in month_map.items():
-                                if month_name in month_str:
-                                    start_month = month_num
-                                    break
-                            
-                            # Calculate experience more accurately
-                            if start_year == current_year:
-                                years = (current_month - start_month) / 12.0
-                            elif start_year == current_year - 1:
-                                years = 1 + ((current_month - start_month) / 12.0)
-                            else:
-                                years = current_year - start_year + ((current_month - start_month) / 12.0)
-                            
-                            experience_periods.append(max(0.5, years))  # At least 0.5 years
-        
-        # Try date patterns to calculate experience
-        for pattern in date_patterns:
-            matches = re.findall(pattern, resume_text.lower())
-            for match in matches:
-                if isinstance(match, tuple):
-                    if len(match) >= 1:
-                        start_year = int(match[0])
-                        if len(match) > 1 and match[1] and match[1].isdigit():
-                            end_year = int(match[1])
-                        else:
-                            end_year = datetime.now().year
-                        
-                        # Check context
-                        match_context = resume_text.lower()[max(0, resume_text.lower().find(str(start_year))-100):resume_text.lower().find(str(start_year))+100]
-                        if any(exp_keyword in match_context for exp_keyword in experience_keywords) and \
-                           not any(edu_keyword in match_context for edu_keyword in education_keywords):
-                            if 1990 < start_year <= datetime.now().year and end_year - start_year < 10:
-                                experience_periods.append(end_year - start_year)
-                elif match and match.isdigit():
-                    start_year = int(match)
-                    if 1990 < start_year <= datetime.now().year:
-                        experience_periods.append(datetime.now().year - start_year)
-        
-        # Combine all found years
-        all_years = years_found + experience_periods
-        
-        if all_years:
-            # Filter out unrealistic values (likely education years)
-            realistic_years = [y for y in all_years if 0 < y < 15]
-            
-            if realistic_years:
-                # Take the maximum reasonable experience
-                candidate_years = max(realistic_years)
-                # Round fractional years
-                if candidate_years < 1:
-                    candidate_years = 1
-                else:
-                    candidate_years = int(round(candidate_years))
-            else:
-                candidate_years = int(round(max(all_years)))
-            
-            if min_req <= candidate_years <= max_req:
-                return 1.0, candidate_years
-            elif candidate_years > max_req:
-                return 0.9, candidate_years
-            elif candidate_years >= min_req - 1:
-                return 0.8, candidate_years
+        return self.match_experience(resume_text.lower(), min_req, max_req)
+    
+    def match_experience(self, resume_lower: str, min_req: int, max_req: int) -> tuple[float, int]:
+        """Experience score against an already parsed (min, max) requirement"""
+        # Explicit year mentions ('5+ years of experience')
+        stated_years = [int(years) for pattern in self.experience_statement_patterns
+                        for years in pattern.findall(resume_lower)]
+        
+        # Total time covered by employment periods
+        timeline = self.extract_employment_timeline(resume_lower)
+        timeline_years = sum(end - start for start, end in timeline)
+        
+        # Filter out unrealistic statements (likely education years or typos)
+        realistic_years = [y for y in stated_years if 0 < y < 15]
+        if timeline_years > 0:
+            realistic_years.append(timeline_years)
+        
+        if realistic_years:
+            # Take the maximum reasonable experience
+            candidate_years = max(realistic_years)
+            # Round fractional years
+            if candidate_years < 1:
+                candidate_years = 1
             else:
-                return candidate_years / min_req if min_req > 0 else 0, candidate_years
-        
-        return 0.0, 0
+                candidate_years = int(round(candidate_years))
+        elif stated_years:
+            candidate_years = int(round(max(stated_years)))
+        else:
+            return 0.0, 0
+        
+        if min_req <= candidate_years <= max_req:
+            return 1.0, candidate_years
+        elif candidate_years > max_req:
+            return 0.9, candidate_years
+        elif candidate_years >= min_req - 1:
+            return 0.8, candidate_years
+        else:
+            return candidate_years / min_req if min_req > 0 else 0, candidate_years
+    
+    @classmethod
+    def combine_scores(cls, component_scores: Dict[str, Any],
+                       weights: Optional[Dict[str, float]] = None) -> Any:
+        """Weighted sum of the component scores; works on floats and on NumPy columns alike"""
+        weights = weights or cls.SCORING_WEIGHTS
+        return sum(weights[name] * component_scores[name] for name in cls.SCORING_WEIGHTS)
     
     def score_resume(self, resume_text: str, job_ticket: EnhancedJobTicket) -> Dict[str, Any]:
         """Enhanced score_resume method with professional development"""
+        profile = job_ticket.compile_profile(self)
+        resume_lower = resume_text.lower()
         
-        # Your existing scoring logic
-        skill_score, matched_skills, detailed_matches = self.calculate_skill_match_score(
-            resume_text, job_ticket.tech_stack
+        skill_score, matched_skills, detailed_matches = self.match_skills(
+            resume_lower, profile.skill_matcher, profile.skill_plan
         )
         
-        exp_score, detected_years = self.calculate_experience_match(
-            resume_text, job_ticket.experience_required
+        exp_score, detected_years = self.match_experience(
+            resume_lower, profile.experience_min, profile.experience_max
         )
         
         location_score = 0.0
-        if job_ticket.location.lower() in resume_text.lower():
+        if profile.location_key in resume_lower:
             location_score = 1.0
-        elif "remote" in job_ticket.location.lower() or "remote" in resume_text.lower():
+        elif profile.remote or "remote" in resume_lower:
             location_score = 0.8
         
         # Add professional development scoring
         pd_results = self.pd_scorer.calculate_professional_development_score(resume_text)
         
-        # Updated weights to include professional development
-        weights = {
-            'skills': 0.40,           # Reduced from 0.50
-            'experience': 0.30,       # Reduced from 0.35
-            'location': 0.10,         # Reduced from 0.15
-            'professional_dev': 0.20  # New weight for PD
-        }
-        
-        # Calculate final score with professional development
-        final_score = (
-            weights['skills'] * skill_score +
-            weights['experience'] * exp_score +
-            weights['location'] * location_score +
-            weights['professional_dev'] * pd_results['professional_development_score']
-        )
+        weights = dict(self.SCORING_WEIGHTS)
+        final_score = self.combine_scores({
+            'skills': skill_score,
+            'experience': exp_score,
+            'location': location_score,
+            'professional_dev': pd_results['professional_development_score'],
+        }, weights)
         
         return {
             'final_score': final_score,
@@ -1739,45 +2711,360 @@ class UpdateAwareResumeFilter:
             'professional_development': pd_results,
             'scoring_weights': weights,
             'job_requirements': {
-                'position': job_ticket.position,
-                'required_skills': job_ticket.tech_stack,
-                'required_experience': job_ticket.experience_required,
-                'location': job_ticket.location
+                'position': profile.position,
+                'required_skills': list(profile.skills),
+                'required_experience': profile.experience_required,
+                'location': profile.location
             }
         }
 
 
+class BatchScoringEngine:
+    """A ticket's candidate features as NumPy arrays (one row per resume) for re-ranking.
+    
+    Stage 1 still scores each resume with score_resume (the text matching is per resume); this
+    engine is built from those results, saved as the feature store, and re-scores the whole pool
+    with other weights without reading the resumes again.
+    """
+    
+    FEATURE_STORE_FILE = "candidate_features.npz"
+    SCORE_COMPONENTS = list(UpdateAwareResumeFilter.SCORING_WEIGHTS)
+    PD_COMPONENTS = [
+        ('certifications', 'certification_score'),
+        ('online_learning', 'online_learning_score'),
+        ('conferences', 'conference_score'),
+        ('content_creation', 'content_creation_score'),
+    ]
+    
+    def __init__(self, filenames: List[str], skills: List[str], skill_matrix: np.ndarray,
+                 experience_years: np.ndarray, location_scores: np.ndarray,
+                 pd_components: np.ndarray, pd_recency: np.ndarray, experience_range: Tuple[int, int],
+                 groups: Optional[np.ndarray] = None):
+        self.filenames = list(filenames)
+        self.skills = list(skills)
+        self.skill_matrix = skill_matrix          # resumes x skills, bool
+        self.experience_years = experience_years  # NaN where no experience was detected
+        self.location_scores = location_scores
+        self.pd_components = pd_components        # resumes x PD_COMPONENTS
+        self.pd_recency = pd_recency              # best recency score per resume
+        self.experience_range = experience_range
+        # Duplicate group of each resume; submissions of the same candidate share a group
+        self.groups = groups if groups is not None else np.arange(len(self.filenames))
+    
+    @classmethod
+    def from_score_results(cls, score_results: List[Dict], job_ticket: EnhancedJobTicket,
+                           resume_filter: UpdateAwareResumeFilter,
+                           dup_groups: Optional[List[List[Dict]]] = None) -> 'BatchScoringEngine':
+        """Build the feature arrays from stage 1 results of score_resume_comprehensive"""
+        profile = job_ticket.compile_profile(resume_filter)
+        skills = list(profile.skills)
+        skill_index = {skill: i for i, skill in enumerate(skills)}
+        count = len(score_results)
+        
+        skill_matrix = np.zeros((count, len(skills)), dtype=bool)
+        experience_years = np.full(count, np.nan)
+        location_scores = np.zeros(count)
+        pd_components = np.zeros((count, len(cls.PD_COMPONENTS)))
+        pd_recency = np.zeros(count)
+        
+        for row, result in enumerate(score_results):
+            for skill in result.get('matched_skills', []):
+                if skill in skill_index:
+                    skill_matrix[row, skill_index[skill]] = True
+            
+            # Zero years with a zero score means nothing usable was found
+            years = result.get('detected_experience_years', 0)
+            if years or result.get('experience_score', 0):
+                experience_years[row] = years
+            
+            location_scores[row] = result.get('location_score', 0.0)
+            
+            components = result.get('professional_development', {}).get('component_scores', {})
+            for column, (component, score_key) in enumerate(cls.PD_COMPONENTS):
+                pd_components[row, column] = components.get(component, {}).get(score_key, 0.0)
+            pd_recency[row] = max(
+                components.get('certifications', {}).get('recent_certification_score', 0),
+                components.get('online_learning', {}).get('recent_learning_score', 0)
+            )
+        
+        filenames = [result['filename'] for result in score_results]
+        group_of = {}
+        for group_id, group in enumerate(dup_groups or []):
+            for item in group:
+                group_of[item['filename']] = group_id
+        groups = np.array([group_of.get(filename, len(group_of) + row) for row, filename in enumerate(filenames)])
+        
+        return cls(
+            filenames, skills, skill_matrix,
+            experience_years, location_scores, pd_components, pd_recency,
+            (profile.experience_min, profile.experience_max),
+            groups
+        )
+    
+    def save(self, path: Path):
+        """Persist the raw features so the ticket can be re-ranked without the PDFs"""
+        path = Path(path)
+        tmp_path = path.with_name(path.stem + '.tmp.npz')
+        np.savez_compressed(
+            tmp_path,
+            filenames=np.array(self.filenames, dtype=str),
+            skills=np.array(self.skills, dtype=str),
+            skill_matrix=self.skill_matrix,
+            experience_years=self.experience_years,
+            location_scores=self.location_scores,
+            pd_components=self.pd_components,
+            pd_recency=self.pd_recency,
+            experience_range=np.array(self.experience_range),
+            groups=self.groups,
+        )
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: Path) -> 'BatchScoringEngine':
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                data['filenames'].tolist(), data['skills'].tolist(), data['skill_matrix'],
+                data['experience_years'], data['location_scores'], data['pd_components'],
+                data['pd_recency'], tuple(int(x) for x in data['experience_range']), data['groups']
+            )
+    
+    @classmethod
+    def load_for_ticket(cls, ticket_folder: str) -> 'BatchScoringEngine':
+        """Load the feature store written by the last filtering run of a ticket"""
+        store_path = Path(ticket_folder) / "filtering_results" / cls.FEATURE_STORE_FILE
+        if not store_path.exists():
+            raise FileNotFoundError(f"No feature store for {Path(ticket_folder).name}, run resume filtering first")
+        return cls.load(store_path)
+    
+    @classmethod
+    def resolve_weights(cls, overrides: Optional[Dict[str, float]] = None) -> Dict[str, float]:
+        """Merge caller-supplied weights over the defaults and rescale them to sum to 1,
+        so re-ranked scores stay on the same 0-100% scale as the filtering run"""
+        weights = dict(UpdateAwareResumeFilter.SCORING_WEIGHTS)
+        for name, value in (overrides or {}).items():
+            if name not in weights:
+                raise ValueError(f"Unknown weight '{name}', expected one of: {', '.join(cls.SCORE_COMPONENTS)}")
+            if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+                raise ValueError(f"Weight '{name}' must be a number")
+            try:
+                value = float(value)
+            except ValueError:
+                raise ValueError(f"Weight '{name}' must be a number") from None
+            if not math.isfinite(value) or value < 0:
+                raise ValueError(f"Weight '{name}' must be a non-negative number")
+            weights[name] = value
+        
+        total = sum(weights.values())
+        if total <= 0:
+            raise ValueError("At least one weight must be positive")
+        if not math.isclose(total, 1.0):
+            weights = {name: value / total for name, value in weights.items()}
+        return weights
+    
+    def skill_scores(self) -> np.ndarray:
+        if not self.skills:
+            return np.zeros(len(self.filenames))
+        return self.skill_matrix.mean(axis=1)
+    
+    def experience_scores(self) -> np.ndarray:
+        """Vectorized version of UpdateAwareResumeFilter.calculate_experience_match"""
+        min_req, max_req = self.experience_range
+        years = self.experience_years
+        found = ~np.isnan(years)
+        
+        with np.errstate(invalid='ignore'):
+            below = years / min_req if min_req > 0 else np.zeros_like(years)
+            return np.select(
+                [~found, (min_req <= years) & (years <= max_req), years > max_req, years >= min_req - 1],
+                [0.0, 1.0, 0.9, 0.8],
+                default=below
+            )
+    
+    def professional_development_scores(self) -> np.ndarray:
+        pd_weights = np.array([ProfessionalDevelopmentScorer.COMPONENT_WEIGHTS[component]
+                               for component, _ in self.PD_COMPONENTS])
+        return np.minimum(
+            self.pd_components @ pd_weights + self.pd_recency * ProfessionalDevelopmentScorer.RECENCY_BONUS,
+            1.0
+        )
+    
+    def component_scores(self) -> np.ndarray:
+        """resumes x (skills, experience, location, professional_dev) score matrix"""
+        return np.column_stack([
+            self.skill_scores(),
+            self.experience_scores(),
+            self.location_scores,
+            self.professional_development_scores(),
+        ])
+    
+    def final_scores(self, weights: Optional[Dict[str, float]] = None,
+                     components: Optional[np.ndarray] = None) -> np.ndarray:
+        """Apply the scoring weights to every resume at once (same combination as score_resume)"""
+        if components is None:
+            components = self.component_scores()
+        return UpdateAwareResumeFilter.combine_scores(
+            dict(zip(self.SCORE_COMPONENTS, components.T)), self.resolve_weights(weights)
+        )
+    
+    @staticmethod
+    def rank(scores: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+        """Indices of the best scores, highest first; only the top_k are sorted"""
+        scores = np.asarray(scores, dtype=float)
+        if top_k is None or top_k >= len(scores):
+            return np.argsort(-scores, kind='stable')
+        if top_k <= 0:
+            return np.array([], dtype=int)
+        
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        return top[np.argsort(-scores[top], kind='stable')]
+    
+    def rerank(self, weights: Optional[Dict[str, float]] = None, top_k: int = 10) -> List[Dict]:
+        """Rank unique candidates with new weights, keeping each candidate's best submission"""
+        components = self.component_scores()
+        scores = self.final_scores(weights, components)
+        
+        # Best-scoring row of every duplicate group
+        order = np.lexsort((-scores, self.groups))
+        is_first = np.ones(len(order), dtype=bool)
+        is_first[1:] = self.groups[order][1:] != self.groups[order][:-1]
+        best_rows = order[is_first]
+        
+        ranked = []
+        for rank, index in enumerate(self.rank(scores[best_rows], top_k)):
+            row = best_rows[index]
+            submissions = [self.filenames[i] for i in np.flatnonzero(self.groups == self.groups[row])]
+            years = self.experience_years[row]
+            ranked.append({
+                'rank': rank + 1,
+                'filename': self.filenames[row],
+                'final_score': float(scores[row]),
+                'component_scores': dict(zip(self.SCORE_COMPONENTS, components[row].tolist())),
+                'matched_skills': [skill for skill, matched in zip(self.skills, self.skill_matrix[row]) if matched],
+                'detected_experience_years': 0 if np.isnan(years) else int(years),
+                'submissions': submissions,
+            })
+        
+        return ranked
+
+
 class UpdateAwareBasicFilter:
     """Enhanced basic filter with comprehensive scoring and duplicate detection"""
     
+    SIMILARITY_CACHE_FILE = "tfidf_similarity.pkl"
+    SPACY_MODEL = "en_core_web_sm"
+    
     def __init__(self):
         self.resume_filter = UpdateAwareResumeFilter()
         self.duplicate_detector = DuplicateCandidateDetector()
         self.duplicate_handler = DuplicateHandlingStrategy()
         
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            os.system("python -m spacy download en_core_web_sm")
-            self.nlp = spacy.load("en_core_web_sm")
+        # spaCy pipeline, only loaded when a feature first asks for it (see nlp)
+        self._nlp = None
         
+        from sklearn.feature_extraction.text import TfidfVectorizer
         self.vectorizer = TfidfVectorizer(
             max_features=500,
             stop_words='english',
             ngram_range=(1, 2)
         )
     
-    def score_resume_comprehensive(self, resume_text: str, resume_path: Path, job_ticket: EnhancedJobTicket) -> Dict:
+    @property
+    def nlp(self):
+        """spaCy pipeline, loaded on first access; spaCy is not needed for the default scoring"""
+        if self._nlp is None:
+            import spacy
+            try:
+                self._nlp = spacy.load(self.SPACY_MODEL)
+            except OSError as e:
+                raise RuntimeError(
+                    f"spaCy model '{self.SPACY_MODEL}' is not installed. "
+                    f"Install it with: python -m spacy download {self.SPACY_MODEL}"
+                ) from e
+        return self._nlp
+    
+    def compute_similarity_scores(self, job_description: str, resume_texts: Dict[str, str],
+                                  cache_folder: Optional[Path] = None) -> Dict[str, float]:
+        """TF-IDF similarity of every resume to the job description, fitted once per ticket"""
+        from sklearn.metrics.pairwise import cosine_similarity
+        
+        if not job_description or not resume_texts:
+            return {filename: 0.0 for filename in resume_texts}
+        
+        description_hash = hashlib.md5(job_description.encode()).hexdigest()
+        text_hashes = {filename: hashlib.md5(text.encode()).hexdigest() for filename, text in resume_texts.items()}
+        cache = self._load_similarity_cache(cache_folder)
+        
+        try:
+            if cache and cache['description_hash'] == description_hash:
+                # Same job description: keep the fitted vocabulary so scores stay comparable
+                vectorizer, job_vector = cache['vectorizer'], cache['job_vector']
+                scores = {filename: cache['scores'][filename] for filename, text_hash in text_hashes.items()
+                          if cache['text_hashes'].get(filename) == text_hash}
+                pending = [filename for filename in resume_texts if filename not in scores]
+                if pending:
+                    resume_matrix = vectorizer.transform([resume_texts[filename] for filename in pending])
+                    scores.update(zip(pending, cosine_similarity(job_vector, resume_matrix)[0]))
+                print(f"  ℹ️ TF-IDF model reused, {len(pending)} new resume(s) scored")
+            else:
+                vectorizer = self.vectorizer
+                filenames = list(resume_texts)
+                tfidf_matrix = vectorizer.fit_transform([job_description] + [resume_texts[f] for f in filenames])
+                job_vector = tfidf_matrix[0:1]
+                scores = dict(zip(filenames, cosine_similarity(job_vector, tfidf_matrix[1:])[0]))
+        except ValueError:
+            # Empty vocabulary (e.g. only stop words)
+            return {filename: 0.0 for filename in resume_texts}
+        
+        scores = {filename: float(scores[filename]) for filename in resume_texts}
+        
+        if cache_folder:
+            self._save_similarity_cache(cache_folder, {
+                'description_hash': description_hash,
+                'text_hashes': text_hashes,
+                'scores': scores,
+                'vectorizer': vectorizer,
+                'job_vector': job_vector,
+            })
+        
+        return scores
+    
+    def _load_similarity_cache(self, cache_folder: Optional[Path]) -> Optional[Dict]:
+        """Load the fitted TF-IDF model of a previous run, if any"""
+        if not cache_folder:
+            return None
+        
+        cache_path = Path(cache_folder) / self.SIMILARITY_CACHE_FILE
+        if not cache_path.exists():
+            return None
+        
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception as e:
+            print(f"  ⚠️ Ignoring unreadable TF-IDF cache: {e}")
+            return None
+    
+    def _save_similarity_cache(self, cache_folder: Path, cache: Dict):
+        """Persist the fitted TF-IDF model next to the filtering results"""
+        cache_path = Path(cache_folder) / self.SIMILARITY_CACHE_FILE
+        tmp_path = cache_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(cache, f)
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"  ⚠️ Could not save TF-IDF cache: {e}")
+    
+    def score_resume_comprehensive(self, resume_text: str, resume_path: Path, job_ticket: EnhancedJobTicket,
+                                   similarity_score: Optional[float] = None) -> Dict:
         """Comprehensive scoring using multiple methods"""
         base_scores = self.resume_filter.score_resume(resume_text, job_ticket)
         
-        similarity_score = 0.0
-        if job_ticket.description:
-            try:
-                tfidf_matrix = self.vectorizer.fit_transform([job_ticket.description, resume_text])
-                similarity_score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-            except:
-                similarity_score = 0.0
+        if similarity_score is None:
+            # Scoring a single resume: fit on the job description and this resume only
+            similarity_score = self.compute_similarity_scores(
+                job_ticket.description, {resume_path.name: resume_text}
+            )[resume_path.name]
         
         additional_features = self._extract_additional_features(resume_text)
         
@@ -1832,18 +3119,59 @@ class UpdateAwareBasicFilter:
 class UpdatedResumeFilteringSystem:
     """Complete resume filtering system with update support and duplicate detection"""
     
-    def __init__(self, ticket_folder: str):
+    STATE_FILE = "stage1_state.pkl"
+    STATE_VERSION = 2  # Bump when the state layout changes; other versions are ignored
+    LLM_REVIEW_SIZE = 5  # Candidates the LLM stages look at
+    LLM_STAGE_TIMEOUT = 120  # Seconds to wait for the concurrent LLM stages
+    RESUME_TOKEN_BUDGET = 500  # Resume text per candidate in the stage 2 prompt
+    # Resume sections for the stage 2 prompt with their share weight of the token budget, most useful
+    # first (headings found by extract_section; a line of more than PROMPT_HEADING_WORDS words is
+    # content, e.g. "5 years of experience in ...")
+    PROMPT_HEADING_WORDS = 4
+    PROMPT_SECTIONS = [
+        ('experience', 4, ['experience', 'employment', 'work history']),
+        ('skills', 3, ['skills', 'technologies']),
+        ('projects', 2, ['projects']),
+        ('certifications', 1, ['certification', 'certificates']),
+        ('education', 1, ['education', 'academic', 'qualification']),
+        ('summary', 1, ['summary', 'objective']),
+    ]
+    # 'fast' ranks by the stage 1 scores alone; a later 'full' --incremental run adds the LLM reviews
+    MODES = ('full', 'fast')
+    FAST_MODE_NOTE = "[Not reviewed: fast mode ranks by stage 1 scores only; run in full mode to add the LLM reviews]"
+    
+    def __init__(self, ticket_folder: str, scheduler: Optional[RateLimitScheduler] = None, mode: str = 'full'):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown mode '{mode}', expected one of: {', '.join(self.MODES)}")
         self.ticket_folder = Path(ticket_folder)
+        self.mode = mode
         self.job_ticket = EnhancedJobTicket(ticket_folder)
+        # Shared by the tickets of a batch run so their LLM calls respect one rate limit
+        self.scheduler = scheduler
         self.basic_filter = UpdateAwareBasicFilter()
         
         self.output_folder = self.ticket_folder / "filtering_results"
         self.output_folder.mkdir(exist_ok=True)
         
-        self._create_agents()
+        # Resume text for this run, keyed by filename (filled once in stage 1)
+        self.resume_texts = {}
+        # Per-resume stage 1 results and duplicate info, kept for incremental runs
+        self.score_results = {}
+        self.duplicate_map = {}
+        # Estimated prompt tokens per LLM stage of this run
+        self.prompt_tokens = {}
+        
+        # Fast mode makes no API calls, so it needs neither the agents nor an API key
+        if mode == 'full':
+            self._create_agents()
     
     def _create_agents(self):
         """Create AutoGen agents with latest job requirements"""
+        import autogen
+        
+        config_list, config_list_basic = get_llm_config_lists(
+            self.scheduler.http_client() if self.scheduler else None
+        )
         latest_skills = ', '.join(self.job_ticket.tech_stack)
         latest_experience = self.job_ticket.experience_required
         latest_salary = self.job_ticket.salary_range
@@ -1852,14 +3180,14 @@ class UpdatedResumeFilteringSystem:
             "config_list": config_list,
             "temperature": 0.2,
             "timeout": 60,
-            "cache_seed": 42,
+            "cache_seed": LLM_CACHE_SEED,
         }
         
         llm_config_basic = {
             "config_list": config_list_basic,
             "temperature": 0.1,
             "timeout": 30,
-            "cache_seed": 42,
+            "cache_seed": LLM_CACHE_SEED,
         }
         
         self.basic_filter_agent = autogen.AssistantAgent(
@@ -1920,17 +3248,21 @@ class UpdatedResumeFilteringSystem:
             """
         )
         
-        self.user_proxy = autogen.UserProxyAgent(
-            name="user_proxy",
-            human_input_mode="NEVER",
-            max_consecutive_auto_reply=0,
-            code_execution_config={
-                "work_dir": str(self.output_folder),
-                "use_docker": False,
-            }
-        )
+        # One proxy per agent: the LLM stages run concurrently and a proxy keeps per-chat state
+        self.user_proxies = {
+            agent.name: autogen.UserProxyAgent(
+                name=f"user_proxy_{agent.name}",
+                human_input_mode="NEVER",
+                max_consecutive_auto_reply=0,
+                code_execution_config={
+                    "work_dir": str(self.output_folder),
+                    "use_docker": False,
+                }
+            )
+            for agent in (self.basic_filter_agent, self.advanced_filter_agent, self.qa_agent)
+        }
     
-    def filter_resumes(self) -> Dict:
+    def filter_resumes(self, incremental: bool = False) -> Dict:
         """Main filtering method with update awareness and duplicate detection"""
         print(f"\n{'='*70}")
         print(f"🚀 RESUME FILTERING SYSTEM")
@@ -1954,25 +3286,48 @@ class UpdatedResumeFilteringSystem:
                 "ticket_id": self.job_ticket.ticket_id
             }
         
+        previous_state = self._load_state() if incremental else None
+        
         print("\n🔍 Stage 1: Basic AI Filtering with Duplicate Detection...")
-        initial_results = self._basic_filtering_with_duplicates(resumes)
+        initial_results = self._basic_filtering_with_duplicates(resumes, previous_state)
+        
+        # LLM stages only run again when the reviewed candidates changed
+        reused_llm_results = self._reusable_llm_results(previous_state, initial_results["top_10"])
+        llm_complete = True
+        if reused_llm_results:
+            print(f"\n♻️ Top {self.LLM_REVIEW_SIZE} candidates unchanged since last run, reusing LLM reviews")
+            initial_results["agent_review"] = reused_llm_results["agent_review"]
+            final_results = reused_llm_results["stage2_results"]
+            qa_results = reused_llm_results["qa_review"]
+        elif self.mode == 'fast':
+            print("\n⚡ Fast mode: ranking by stage 1 scores, LLM review stages skipped")
+            initial_results["agent_review"] = self.FAST_MODE_NOTE
+            final_results = self._advanced_filtering(initial_results, self.FAST_MODE_NOTE)
+            qa_results = self._quality_assurance(self.FAST_MODE_NOTE, verified=False)
+            # Nothing to reuse: the next full run reviews these candidates
+            llm_complete = False
+        else:
+            print("\n🧠 Stages 2-3: Agent review, advanced LLM analysis and QA review (concurrent)...")
+            replies, llm_complete = self._run_llm_stages(initial_results)
+            initial_results["agent_review"] = replies["basic_filter_agent"]
+            final_results = self._advanced_filtering(initial_results, replies["advanced_filter_agent"])
+            # A timed-out stage leaves a placeholder reply: nothing was verified then
+            qa_results = self._quality_assurance(replies["qa_agent"], verified=llm_complete)
         
         with open(self.output_folder / "stage1_results.json", 'w') as f:
             json.dump(initial_results, f, indent=2, default=str)
         
-        print("\n🧠 Stage 2: Advanced LLM Analysis...")
-        final_results = self._advanced_filtering(initial_results)
-        
         with open(self.output_folder / "stage2_results.json", 'w') as f:
             json.dump(final_results, f, indent=2, default=str)
         
-        print("\n✅ Stage 3: Quality Assurance Review...")
-        qa_results = self._quality_assurance(initial_results, final_results)
+        self._save_state(initial_results, final_results, qa_results, keep_llm_results=llm_complete)
         
         final_output = {
             "ticket_id": self.job_ticket.ticket_id,
             "position": self.job_ticket.position,
             "timestamp": datetime.now().isoformat(),
+            "mode": self.mode,
+            "llm_reviewed": llm_complete,
             "job_status": self.job_ticket.job_details.get('status', 'unknown'),
             "requirements_last_updated": self.job_ticket.job_details.get('last_updated', ''),
             "latest_requirements": {
@@ -1989,6 +3344,7 @@ class UpdatedResumeFilteringSystem:
                 "stage1_selected": len(initial_results["top_10"]),
                 "final_selected": len(final_results.get("top_5_candidates", [])),
             },
+            "prompt_tokens": self.prompt_tokens,
             "duplicate_detection": initial_results.get('duplicate_summary', {}),
             "stage1_results": initial_results,
             "stage2_results": final_results,
@@ -2006,36 +3362,85 @@ class UpdatedResumeFilteringSystem:
         
         return final_output
     
-    def _basic_filtering_with_duplicates(self, resumes: List[Path]) -> Dict:
-        """Stage 1 with duplicate detection and handling"""
+    def _basic_filtering_with_duplicates(self, resumes: List[Path], previous_state: Optional[Dict] = None) -> Dict:
+        """Stage 1 with duplicate detection and handling (incremental when a previous state is given)"""
+        
+        # Files scored by the previous run that are unchanged can reuse their results
+        current_files = {resume_path.name: self._file_fingerprint(resume_path) for resume_path in resumes}
+        unchanged = set()
+        if previous_state:
+            unchanged = {filename for filename, fingerprint in previous_state['files'].items()
+                         if current_files.get(filename) == fingerprint}
+            print(f"\n♻️ Incremental run: {len(unchanged)} unchanged, {len(current_files) - len(unchanged)} new or changed resume(s)")
+        
+        # Keep the previous duplicate detection for unchanged resumes and add the others to it
+        duplicate_map = {}  # Map of filename to candidate_id
+        content_index_path = self.output_folder / MinHashLSH.INDEX_FILE
+        if previous_state:
+            detector = DuplicateCandidateDetector.from_state(previous_state['duplicates'], unchanged)
+            self.basic_filter.duplicate_detector = detector
+            for filename in unchanged & set(previous_state['duplicate_map']):
+                entry = dict(previous_state['duplicate_map'][filename])
+                entry['duplicates'] = [dup for dup in entry['duplicates'] if dup['candidate_id'] in detector.candidates_db]
+                duplicate_map[filename] = entry
+        if content_index_path.exists():
+            self.basic_filter.duplicate_detector.load_content_index(content_index_path)
         
         # First pass: detect duplicates
         print("\n🔍 Detecting duplicate candidates...")
         
-        duplicate_map = {}  # Map of filename to candidate_id
+        pre_extracted = 0
+        registry = self._open_registry()
         
-        for resume_path in resumes:
-            resume_text = ResumeExtractor.extract_text(resume_path)
-            if not resume_text:
-                continue
-            
-            candidate_id, duplicates = self.basic_filter.duplicate_detector.add_candidate(
-                resume_text, resume_path.name
-            )
-            
-            duplicate_map[resume_path.name] = {
-                'candidate_id': candidate_id,
-                'duplicates': duplicates
-            }
+        try:
+            for resume_path in resumes:
+                resume_text, identifiers = ResumeExtractor.extract_with_identifiers(resume_path, registry)
+                if not resume_text:
+                    continue
+                
+                if identifiers:
+                    pre_extracted += 1
+                self.resume_texts[resume_path.name] = resume_text
+                
+                if resume_path.name in duplicate_map:
+                    continue
+                
+                if identifiers is None:
+                    identifiers = self.basic_filter.duplicate_detector.extract_candidate_identifiers(
+                        resume_text, resume_path.name
+                    )
+                candidate_id, duplicates = self.basic_filter.duplicate_detector.add_candidate(
+                    resume_text, resume_path.name, identifiers
+                )
+                
+                duplicate_map[resume_path.name] = {
+                    'candidate_id': candidate_id,
+                    'global_candidate_id': registry.register(resume_path, resume_text, identifiers) if registry else None,
+                    'duplicates': duplicates
+                }
+                
+                if duplicates:
+                    print(f"  ⚠️ {resume_path.name} has {len(duplicates)} duplicate(s):")
+                    for dup in duplicates:
+                        print(f"     - {dup['filename']} (confidence: {dup['confidence']:.1%}, reason: {dup['reason']})")
             
-            if duplicates:
-                print(f"  ⚠️ {resume_path.name} has {len(duplicates)} duplicate(s):")
-                for dup in duplicates:
-                    print(f"     - {dup['filename']} (confidence: {dup['confidence']:.1%}, reason: {dup['reason']})")
+            if pre_extracted:
+                print(f"  ℹ️ Used pre-extracted text for {pre_extracted}/{len(resumes)} resumes")
+        finally:
+            if registry:
+                registry.close()
+        
+        # Keep the MinHash signatures of this ticket's resumes for the next run
+        self.basic_filter.duplicate_detector.save_content_index(content_index_path)
         
         # Get duplicate groups
         dup_groups = self.basic_filter.duplicate_detector.get_duplicate_groups()
         
+        # One TF-IDF fit for the whole ticket so similarity scores are comparable
+        similarity_scores = self.basic_filter.compute_similarity_scores(
+            self.job_ticket.description, self.resume_texts, self.output_folder
+        )
+        
         # Second pass: score resumes
         print("\n📊 Scoring resumes...")
         scored_resumes = []
@@ -2044,7 +3449,7 @@ class UpdatedResumeFilteringSystem:
         for i, resume_path in enumerate(resumes):
             print(f"  Processing {i+1}/{len(resumes)}: {resume_path.name}")
             
-            resume_text = ResumeExtractor.extract_text(resume_path)
+            resume_text = self.resume_texts.get(resume_path.name)
             if not resume_text:
                 print(f"    ⚠️ Failed to extract text from {resume_path.name}")
                 continue
@@ -2054,13 +3459,19 @@ class UpdatedResumeFilteringSystem:
             candidate_id = candidate_info.get('candidate_id')
             
             # Score the resume
-            score_result = self.basic_filter.score_resume_comprehensive(
-                resume_text, 
-                resume_path,
-                self.job_ticket
-            )
+            if resume_path.name in unchanged and resume_path.name in previous_state['score_results']:
+                score_result = dict(previous_state['score_results'][resume_path.name])
+                score_result['similarity_score'] = similarity_scores.get(resume_path.name, 0.0)
+            else:
+                score_result = self.basic_filter.score_resume_comprehensive(
+                    resume_text, 
+                    resume_path,
+                    self.job_ticket,
+                    similarity_scores.get(resume_path.name, 0.0)
+                )
             
             score_result['candidate_id'] = candidate_id
+            score_result['global_candidate_id'] = candidate_info.get('global_candidate_id')
             
             # Add duplicate information
             if candidate_info.get('duplicates'):
@@ -2069,14 +3480,26 @@ class UpdatedResumeFilteringSystem:
                 score_result['duplicates'] = candidate_info['duplicates']
             else:
                 score_result['has_duplicates'] = False
+                score_result.pop('duplicate_count', None)
+                score_result.pop('duplicates', None)
             
             scored_resumes.append(score_result)
+            self.score_results[resume_path.name] = score_result
+        
+        # Raw features for re-ranking with other weights (--rerank / rerank API);
+        # final_score already comes from score_resume with the same weighting
+        if scored_resumes:
+            scoring_engine = BatchScoringEngine.from_score_results(
+                scored_resumes, self.job_ticket, self.basic_filter.resume_filter, dup_groups
+            )
+            scoring_engine.save(self.output_folder / BatchScoringEngine.FEATURE_STORE_FILE)
         
         # Handle duplicates - merge scores for duplicate groups
         final_scored_resumes = self._merge_duplicate_scores(scored_resumes, dup_groups)
         
-        # Sort by score
-        final_scored_resumes.sort(key=lambda x: x["final_score"], reverse=True)
+        # Rank by score
+        final_scores = [candidate['final_score'] for candidate in final_scored_resumes]
+        final_scored_resumes = [final_scored_resumes[i] for i in BatchScoringEngine.rank(final_scores)]
         top_10 = final_scored_resumes[:10]
         
         # Print summary
@@ -2108,27 +3531,11 @@ class UpdatedResumeFilteringSystem:
         print(f"  Unique candidates: {duplicate_summary['unique_candidates']}")
         print(f"  Duplicate groups found: {duplicate_summary['duplicate_groups_found']}")
         
-        # Prepare agent review data
-        review_summary = self._prepare_agent_review_data(top_10)
-        
-        # Get agent review
-        self.user_proxy.initiate_chat(
-            self.basic_filter_agent,
-            message=f"""Review these candidates:
-
-{json.dumps(review_summary, indent=2)}
-
-Note: Some candidates had multiple submissions. The scores shown are their best performance.
-
-Confirm they meet the requirements, especially skills: {', '.join(self.job_ticket.tech_stack)}
-""",
-            max_turns=1
-        )
+        self.duplicate_map = duplicate_map
         
         return {
             "all_resumes": final_scored_resumes,
             "top_10": top_10,
-            "agent_review": self.basic_filter_agent.last_message()["content"],
             "scoring_criteria": {
                 "skills_required": self.job_ticket.tech_stack,
                 "experience_range": self.job_ticket.experience_required,
@@ -2139,6 +3546,189 @@ Confirm they meet the requirements, especially skills: {', '.join(self.job_ticke
             "duplicate_groups_count": len(dup_groups)
         }
     
+    def _ask_agent(self, agent, message: str, sent_at: Optional[Dict[str, float]] = None,
+                   cancelled: Optional[threading.Event] = None) -> Optional[str]:
+        """Send one message to an agent through its own proxy and return the reply.
+        
+        The send time goes to sent_at[agent.name]; a call still queued in the scheduler when
+        `cancelled` is set is not sent and returns None.
+        """
+        user_proxy = self.user_proxies[agent.name]
+        if not self.scheduler:
+            if sent_at is not None:
+                sent_at[agent.name] = time.monotonic()
+            user_proxy.initiate_chat(agent, message=message, max_turns=1)
+            return agent.last_message(user_proxy)["content"]
+        
+        tokens = estimate_tokens(agent.system_message + message) + self.scheduler.COMPLETION_TOKENS
+        if not self.scheduler.acquire(tokens, cancelled):
+            return None
+        if sent_at is not None:
+            sent_at[agent.name] = time.monotonic()
+        try:
+            user_proxy.initiate_chat(agent, message=message, max_turns=1)
+        finally:
+            self.scheduler.release()
+        return agent.last_message(user_proxy)["content"]
+    
+    def _run_llm_stages(self, initial_results: Dict) -> Tuple[Dict[str, str], bool]:
+        """Run the agent review, stage 2 analysis and QA review concurrently.
+        
+        The prompts only depend on the stage 1 scores, so wall clock is the slowest call instead of
+        the sum. Each stage has LLM_STAGE_TIMEOUT from when it is sent; time queued in the rate
+        limit scheduler does not count. Returns the replies by agent name and whether every stage
+        answered in time.
+        """
+        prompts = {
+            self.basic_filter_agent: self._review_prompt(initial_results["top_10"]),
+            self.advanced_filter_agent: self._advanced_filtering_prompt(initial_results),
+            self.qa_agent: self._quality_assurance_prompt(initial_results),
+        }
+        
+        self.prompt_tokens = {agent.name: estimate_tokens(agent.system_message + prompt) for agent, prompt in prompts.items()}
+        print(f"  📏 Prompt tokens (est.): " + ", ".join(f"{name} ~{tokens:,}" for name, tokens in self.prompt_tokens.items()))
+        
+        start = time.monotonic()
+        sent_at = {}
+        cancelled = threading.Event()
+        executor = ThreadPoolExecutor(max_workers=len(prompts), thread_name_prefix="llm_stage")
+        pending = {agent.name: executor.submit(self._ask_agent, agent, prompt, sent_at, cancelled)
+                   for agent, prompt in prompts.items()}
+        
+        replies = {}
+        complete = True
+        try:
+            while pending:
+                now = time.monotonic()
+                for name, future in list(pending.items()):
+                    if future.done():
+                        replies[name] = future.result()
+                        print(f"  ✓ {name} replied after {now - start:.1f}s")
+                    elif name in sent_at and now - sent_at[name] >= self.LLM_STAGE_TIMEOUT:
+                        complete = False
+                        replies[name] = f"[No reply: {name} timed out after {self.LLM_STAGE_TIMEOUT}s]"
+                        print(f"  ⚠️ {name} timed out after {self.LLM_STAGE_TIMEOUT}s, continuing without its review")
+                    else:
+                        continue
+                    del pending[name]
+                
+                # Wake for the next reply or the nearest deadline (queued stages have none yet)
+                deadlines = [sent_at[name] + self.LLM_STAGE_TIMEOUT - now for name in pending if name in sent_at]
+                if pending:
+                    wait_futures(list(pending.values()), timeout=max(0.0, min(deadlines, default=1.0)),
+                                 return_when=FIRST_COMPLETED)
+        finally:
+            # Stages still queued give up their place instead of sending an unread request;
+            # a timed-out call that was sent ends with the client's own request timeout
+            if self.scheduler:
+                self.scheduler.cancel(cancelled)
+            executor.shutdown(wait=False, cancel_futures=True)
+        return replies, complete
+    
+    def _review_prompt(self, top_10: List[Dict]) -> str:
+        """Agent review prompt for the top candidates"""
+        review_summary = self._prepare_agent_review_data(top_10)
+        
+        return f"""Review these candidates:
+
+{self._compact_json(review_summary)}
+
+Note: Some candidates had multiple submissions. The scores shown are their best performance.
+
+Confirm they meet the requirements, especially skills: {', '.join(self.job_ticket.tech_stack)}
+"""
+    
+    def _open_registry(self) -> Optional[CandidateRegistry]:
+        """Cross-ticket candidate registry next to the ticket folders (None if it cannot be opened)"""
+        try:
+            return CandidateRegistry.for_tickets_root(self.ticket_folder.parent)
+        except Exception as e:
+            print(f"  ⚠️ Candidate registry unavailable, continuing without it: {e}")
+            return None
+    
+    @staticmethod
+    def _file_fingerprint(file_path: Path) -> Tuple[int, float]:
+        stat = file_path.stat()
+        return stat.st_size, stat.st_mtime
+    
+    def _requirements_hash(self) -> str:
+        """Hash of everything the scores and agent prompts depend on"""
+        requirements = [
+            self.job_ticket.position, self.job_ticket.experience_required, self.job_ticket.tech_stack,
+            self.job_ticket.location, self.job_ticket.salary_range, self.job_ticket.description
+        ]
+        return hashlib.md5(json.dumps(requirements, default=str).encode()).hexdigest()
+    
+    def _load_state(self) -> Optional[Dict]:
+        """Load the previous run's stage 1 state if the job requirements are unchanged"""
+        state_path = self.output_folder / self.STATE_FILE
+        if not state_path.exists():
+            print("ℹ️ No previous run found, processing all resumes")
+            return None
+        
+        try:
+            with open(state_path, 'rb') as f:
+                state = pickle.load(f)
+        except Exception as e:
+            print(f"⚠️ Ignoring unreadable previous state: {e}")
+            return None
+        
+        if not isinstance(state, dict) or state.get('version') != self.STATE_VERSION:
+            print("ℹ️ Previous state is from another version, processing all resumes")
+            return None
+        
+        if state.get('requirements_hash') != self._requirements_hash():
+            print("🔄 Job requirements changed since last run, processing all resumes")
+            return None
+        
+        return state
+    
+    def _save_state(self, initial_results: Dict, final_results: Dict, qa_results: Dict,
+                    keep_llm_results: bool = True):
+        """Persist what an incremental run needs as plain data: fingerprints, scores, duplicate
+        detection, LLM output (not reused when a stage timed out)"""
+        state = {
+            'version': self.STATE_VERSION,
+            'requirements_hash': self._requirements_hash(),
+            'files': {
+                filename: self._file_fingerprint(self.ticket_folder / filename)
+                for filename in self.score_results if (self.ticket_folder / filename).exists()
+            },
+            'score_results': self.score_results,
+            'duplicates': self.basic_filter.duplicate_detector.to_state(),
+            'duplicate_map': self.duplicate_map,
+            'reviewed_candidates': self._reviewed_candidates(initial_results['top_10']),
+            'llm_results': {
+                'agent_review': initial_results.get('agent_review'),
+                'stage2_results': final_results,
+                'qa_review': qa_results,
+            } if keep_llm_results else None
+        }
+        
+        state_path = self.output_folder / self.STATE_FILE
+        tmp_path = state_path.with_suffix('.tmp')
+        try:
+            with open(tmp_path, 'wb') as f:
+                pickle.dump(state, f)
+            os.replace(tmp_path, state_path)
+        except Exception as e:
+            print(f"⚠️ Could not save state for incremental runs: {e}")
+    
+    def _reviewed_candidates(self, top_10: List[Dict]) -> Set[Tuple[str, Tuple[int, float]]]:
+        """Files the LLM stages look at, with fingerprints so an edited resume counts as a change"""
+        return {
+            (candidate['filename'], self._file_fingerprint(self.ticket_folder / candidate['filename']))
+            for candidate in top_10[:self.LLM_REVIEW_SIZE]
+        }
+    
+    def _reusable_llm_results(self, previous_state: Optional[Dict], top_10: List[Dict]) -> Optional[Dict]:
+        """Previous LLM output, if the candidates it reviewed are still the top ones"""
+        if not previous_state or not previous_state.get('llm_results'):
+            return None
+        if previous_state.get('reviewed_candidates') != self._reviewed_candidates(top_10):
+            return None
+        return previous_state['llm_results']
+    
     def _merge_duplicate_scores(self, scored_resumes: List[Dict], dup_groups: List[List[Dict]]) -> List[Dict]:
         """Merge scores for duplicate candidates"""
         
@@ -2223,8 +3813,8 @@ Confirm they meet the requirements, especially skills: {', '.join(self.job_ticke
         
         return summary
     
-    def _advanced_filtering(self, initial_results: Dict) -> Dict:
-        """Stage 2: Advanced filtering with detailed analysis"""
+    def _advanced_filtering_prompt(self, initial_results: Dict) -> str:
+        """Stage 2 prompt with detailed data on the top candidates"""
         top_10 = initial_results["top_10"]
         
         # For small candidate pools
@@ -2232,11 +3822,9 @@ Confirm they meet the requirements, especially skills: {', '.join(self.job_ticke
         
         detailed_candidates = []
         for i, candidate in enumerate(top_10[:candidates_to_analyze]):
-            resume_text = ResumeExtractor.extract_text(Path(candidate["file_path"]))
-            
-            max_chars = 2000
-            if len(resume_text) > max_chars:
-                resume_text = resume_text[:max_chars] + "\n[... truncated]"
+            resume_text = self.resume_texts.get(candidate["filename"])
+            if resume_text is None:
+                resume_text = ResumeExtractor.extract_with_identifiers(Path(candidate["file_path"]))[0]
             
             detailed_candidate = {
                 "rank": i + 1,
@@ -2251,7 +3839,7 @@ Confirm they meet the requirements, especially skills: {', '.join(self.job_ticke
                 "missing_skills": [s for s in self.job_ticket.tech_stack if s not in candidate["matched_skills"]],
                 "experience_years": candidate["detected_experience_years"],
                 "pd_highlights": candidate['professional_development']['summary'].get('key_highlights', []),
-                "resume_preview": resume_text
+                "resume": self._resume_excerpt(resume_text, self.RESUME_TOKEN_BUDGET)
             }
             
             # Add duplicate info if present
@@ -2260,7 +3848,7 @@ Confirm they meet the requirements, especially skills: {', '.join(self.job_ticke
             
             detailed_candidates.append(detailed_candidate)
         
-        analysis_prompt = f"""Analyze these candidates for {self.job_ticket.position}.
+        return f"""Analyze these candidates for {self.job_ticket.position}.
 
 REQUIREMENTS:
 - Skills: {', '.join(self.job_ticket.tech_stack)}
@@ -2268,21 +3856,82 @@ REQUIREMENTS:
 - Location: {self.job_ticket.location}
 
 CANDIDATES:
-{json.dumps(detailed_candidates, indent=2)}
+{self._compact_json(detailed_candidates)}
 
 Select the TOP candidates based on fit with requirements.
 Consider professional development as a positive factor.
 Note: Some candidates may have submitted multiple applications - we're showing their best scores.
 """
-        
-        self.user_proxy.initiate_chat(
-            self.advanced_filter_agent,
-            message=analysis_prompt,
-            max_turns=1
-        )
+    
+    @staticmethod
+    def _compact_json(data: Any) -> str:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+    
+    def _resume_excerpt(self, resume_text: str, token_budget: int) -> Dict[str, str]:
+        """Resume sections that fit the token budget, in PROMPT_SECTIONS order.
+        
+        Sections share the budget in proportion to their weight, so experience and skills get
+        the most; what a short section does not use goes to the others by weight.
+        Resumes without recognizable sections get their text minus contact details.
+        """
+        sections = {}
+        weights = {'text': 1}
+        resume_lines = resume_text.split('\n')
+        seen = set()
+        for name, weight, keywords in self.PROMPT_SECTIONS:
+            weights[name] = weight
+            lines = []
+            for index in DuplicateCandidateDetector.section_line_numbers(resume_lines, keywords, self.PROMPT_HEADING_WORDS):
+                # Sections can overlap when a heading is not recognized; keep each source line once
+                # (repeated text, e.g. the same bullet under two jobs, stays)
+                if index in seen:
+                    continue
+                seen.add(index)
+                # Drop icon-font glyphs (private use area) that PDF extraction leaves in headers
+                line = ' '.join(re.sub(r'[\ue000-\uf8ff]', '', resume_lines[index]).split())
+                if line:
+                    lines.append(line)
+            if lines:
+                sections[name] = lines
+        
+        if not sections:
+            text = re.sub(r'\S+@\S+|\+?\d[\d\s().-]{8,}\d', '', resume_text)
+            sections['text'] = [' '.join(text.split())]
+        
+        # Sections that fit in their weighted share take what they need; repeat with the rest,
+        # then split what is left by weight among the sections that do not fit
+        sizes = {name: estimate_tokens('\n'.join(lines)) for name, lines in sections.items()}
+        allowance = {}
+        remaining = token_budget
+        pending = dict(sizes)
+        while pending:
+            total_weight = sum(weights[name] for name in pending)
+            fitting = [name for name, size in pending.items() if size * total_weight <= remaining * weights[name]]
+            if not fitting:
+                for name in pending:
+                    allowance[name] = remaining * weights[name] // total_weight
+                break
+            for name in fitting:
+                allowance[name] = pending.pop(name)
+                remaining -= allowance[name]
+        
+        excerpt = {}
+        for name, lines in sections.items():
+            text = '\n'.join(lines)
+            if sizes[name] > allowance[name]:
+                # Cut at the last whole line that fits (~4 characters per token)
+                max_chars = allowance[name] * 4
+                cut = text.rfind('\n', 0, max_chars)
+                text = text[:cut if cut > 0 else max_chars] + ' [...]'
+            excerpt[name] = text
+        return excerpt
+    
+    def _advanced_filtering(self, initial_results: Dict, detailed_analysis: str) -> Dict:
+        """Stage 2: Top candidates by stage 1 rank, with the agent's detailed analysis"""
+        top_10 = initial_results["top_10"]
         
         top_5_candidates = []
-        for i in range(min(candidates_to_analyze, len(top_10))):
+        for i in range(min(len(top_10), 5)):
             candidate = top_10[i].copy()
             candidate["final_rank"] = i + 1
             candidate["selection_reason"] = f"Strong match for requirements"
@@ -2290,14 +3939,14 @@ Note: Some candidates may have submitted multiple applications - we're showing t
         
         return {
             "top_5_candidates": top_5_candidates,
-            "detailed_analysis": self.advanced_filter_agent.last_message()["content"],
+            "detailed_analysis": detailed_analysis,
             "selection_criteria": "Based on job requirements, professional development, and best submission per candidate",
             "requirements_version": self.job_ticket.job_details.get('last_updated', 'Unknown')
         }
     
-    def _quality_assurance(self, initial_results: Dict, final_results: Dict) -> Dict:
-        """QA review ensuring requirements were used properly and duplicates handled"""
-        qa_prompt = f"""Review the filtering process:
+    def _quality_assurance_prompt(self, initial_results: Dict) -> str:
+        """QA prompt checking requirements were used properly and duplicates handled"""
+        return f"""Review the filtering process:
 
 JOB: {self.job_ticket.position}
 
@@ -2323,16 +3972,12 @@ Verify:
 5. Any concerns about the process?
 6. Recommendations for improvement?
 """
-        
-        self.user_proxy.initiate_chat(
-            self.qa_agent,
-            message=qa_prompt,
-            max_turns=1
-        )
-        
+    
+    def _quality_assurance(self, qa_assessment: Optional[str], verified: bool = True) -> Dict:
+        """Stage 3: QA review result; requirements count as verified only with a real QA reply"""
         return {
-            "qa_assessment": self.qa_agent.last_message()["content"],
-            "requirements_verified": True,
+            "qa_assessment": qa_assessment,
+            "requirements_verified": verified and bool(qa_assessment),
             "duplicates_handled": True,
             "qa_timestamp": datetime.now().isoformat()
         }
@@ -2347,6 +3992,8 @@ Verify:
             f.write(f"Job Ticket ID: {results['ticket_id']}\n")
             f.write(f"Position: {results['position']}\n")
             f.write(f"Report Generated: {results['timestamp']}\n")
+            if results.get('mode') == 'fast':
+                f.write(f"Ranking Mode: fast (stage 1 scores only, no LLM review)\n")
             
             f.write(f"\n{'='*70}\n")
             f.write(f"JOB REQUIREMENTS:\n")
@@ -2552,8 +4199,8 @@ class TicketTracker:
         content_str = ''.join(hash_content)
         return hashlib.md5(content_str.encode()).hexdigest()
     
-    def is_ticket_processed(self, ticket_folder: Path) -> Tuple[bool, Optional[str]]:
-        """Check if ticket has been processed and if content changed"""
+    def is_ticket_processed(self, ticket_folder: Path, mode: str = 'full') -> Tuple[bool, Optional[str]]:
+        """Check if ticket has been processed (in a mode at least as thorough) and if content changed"""
         ticket_id = ticket_folder.name
         current_hash = self.get_ticket_hash(ticket_folder)
         
@@ -2561,14 +4208,15 @@ class TicketTracker:
             stored_data = self.processed_tickets[ticket_id]
             stored_hash = stored_data.get('content_hash', '')
             
-            if stored_hash == current_hash:
-                return True, stored_data.get('last_processed')
-            else:
+            if stored_hash != current_hash:
                 return False, "content_changed"
+            if mode == 'full' and stored_data.get('mode', 'full') == 'fast':
+                return False, "llm_review_pending"
+            return True, stored_data.get('last_processed')
         
         return False, None
     
-    def mark_ticket_processed(self, ticket_folder: Path, results_file: str):
+    def mark_ticket_processed(self, ticket_folder: Path, results_file: str, mode: str = 'full'):
         """Mark ticket as processed"""
         ticket_id = ticket_folder.name
         current_hash = self.get_ticket_hash(ticket_folder)
@@ -2577,7 +4225,8 @@ class TicketTracker:
             'content_hash': current_hash,
             'last_processed': datetime.now().isoformat(),
             'results_file': results_file,
-            'status': 'completed'
+            'status': 'completed',
+            'mode': mode
         }
         
         self._save_tracking_data()
@@ -2606,6 +4255,8 @@ class TicketTracker:
 class BatchProcessor:
     """Process multiple job tickets in batch"""
     
+    BATCH_WORKERS = 4  # Tickets filtered at once
+    
     def __init__(self, jobs_folder: str = None):
         # Determine the jobs folder
         if jobs_folder:
@@ -2626,6 +4277,8 @@ class BatchProcessor:
         
         self.tracker = TicketTracker(str(tracking_file))
         self.results_summary = []
+        # Tickets are processed in worker threads
+        self.lock = threading.Lock()
         
         # Create batch results folder
         self.batch_results_folder = self.jobs_folder / "batch_results"
@@ -2650,7 +4303,8 @@ class BatchProcessor:
         
         return sorted(tickets)
     
-    def process_all_tickets(self, force_reprocess: bool = False, specific_tickets: List[str] = None):
+    def process_all_tickets(self, force_reprocess: bool = False, specific_tickets: List[str] = None,
+                            incremental: bool = False, workers: int = None, mode: str = 'full'):
         """Process all tickets in the jobs folder"""
         print(f"\n{'='*80}")
         print(f"🚀 BATCH RESUME FILTERING SYSTEM WITH DUPLICATE DETECTION")
@@ -2668,67 +4322,83 @@ class BatchProcessor:
             print("❌ No valid job tickets found!")
             return
         
+        # Tickets run concurrently; one scheduler keeps their LLM calls within the API rate limits
+        workers = workers or self.BATCH_WORKERS
+        scheduler = RateLimitScheduler() if mode == 'full' else None
+        print(f"⚙️ Processing up to {workers} ticket(s) at once ({mode} mode)")
+        
         # Summary tracking
-        processed_count = 0
-        skipped_count = 0
-        error_count = 0
+        status_counts = {"completed": 0, "skipped": 0, "error": 0}
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ticket") as executor:
+            futures = [
+                executor.submit(self._process_ticket, ticket_folder, f"{i}/{len(all_tickets)}",
+                                force_reprocess, incremental, scheduler, mode)
+                for i, ticket_folder in enumerate(all_tickets, 1)
+            ]
+            for future in futures:
+                status_counts[future.result()] += 1
+        self.results_summary.sort(key=lambda entry: entry['ticket_id'])
         
-        # Process each ticket
-        for i, ticket_folder in enumerate(all_tickets, 1):
-            print(f"\n{'='*70}")
-            print(f"📋 Processing Ticket {i}/{len(all_tickets)}: {ticket_folder.name}")
-            print(f"{'='*70}")
+        if scheduler:
+            print(f"\n🚦 {scheduler.summary()}")
+        
+        # Generate batch summary report
+        self._generate_batch_summary(status_counts["completed"], status_counts["skipped"], status_counts["error"])
+    
+    def _process_ticket(self, ticket_folder: Path, position: str, force_reprocess: bool, incremental: bool,
+                        scheduler: Optional[RateLimitScheduler], mode: str = 'full') -> str:
+        """Filter one ticket of a batch; returns 'completed', 'skipped' or 'error'"""
+        print(f"\n{'='*70}")
+        print(f"📋 Processing Ticket {position}: {ticket_folder.name}")
+        print(f"{'='*70}")
+        
+        try:
+            # Check if already processed
+            with self.lock:
+                is_processed, process_info = self.tracker.is_ticket_processed(ticket_folder, mode)
             
-            try:
-                # Check if already processed
-                is_processed, process_info = self.tracker.is_ticket_processed(ticket_folder)
-                
-                if is_processed and not force_reprocess:
-                    print(f"✅ Already processed on: {process_info}")
-                    print(f"   (Use --force to reprocess)")
-                    skipped_count += 1
-                    
-                    # Load previous results for summary
-                    self._add_to_summary(ticket_folder, "skipped", process_info)
-                    continue
-                
-                if process_info == "content_changed":
-                    print(f"🔄 Content changed since last processing. Reprocessing...")
+            if is_processed and not force_reprocess:
+                print(f"✅ Already processed on: {process_info}")
+                print(f"   (Use --force to reprocess)")
                 
-                # Process the ticket
-                print(f"🔍 Starting resume filtering for: {ticket_folder.name}")
-                
-                filter_system = UpdatedResumeFilteringSystem(str(ticket_folder))
-                results = filter_system.filter_resumes()
+                # Load previous results for summary
+                self._add_to_summary(ticket_folder, "skipped", process_info)
+                return "skipped"
+            
+            if process_info == "content_changed":
+                print(f"🔄 Content changed since last processing. Reprocessing...")
+            elif process_info == "llm_review_pending":
+                # Scores from the fast run are still valid; only the LLM stages need to run
+                print(f"🧠 Only fast-ranked so far. Adding the LLM reviews...")
+                incremental = True
+            
+            # Process the ticket
+            print(f"🔍 Starting resume filtering for: {ticket_folder.name}")
+            
+            filter_system = UpdatedResumeFilteringSystem(str(ticket_folder), scheduler=scheduler, mode=mode)
+            results = filter_system.filter_resumes(incremental=incremental)
+            
+            if "error" not in results:
+                # Mark as processed
+                results_file = filter_system.output_folder / f"final_results_{filter_system.job_ticket.ticket_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                with self.lock:
+                    self.tracker.mark_ticket_processed(ticket_folder, str(results_file), mode)
                 
-                if "error" not in results:
-                    # Mark as processed
-                    results_file = filter_system.output_folder / f"final_results_{filter_system.job_ticket.ticket_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-                    self.tracker.mark_ticket_processed(ticket_folder, str(results_file))
-                    
-                    processed_count += 1
-                    self._add_to_summary(ticket_folder, "completed", results)
-                    
-                    print(f"\n✅ Successfully processed ticket: {ticket_folder.name}")
-                else:
-                    error_count += 1
-                    self._add_to_summary(ticket_folder, "error", results.get("error"))
-                    print(f"\n❌ Error processing ticket: {results.get('error')}")
+                self._add_to_summary(ticket_folder, "completed", results)
                 
-            except Exception as e:
-                error_count += 1
-                self._add_to_summary(ticket_folder, "error", str(e))
-                print(f"\n❌ Error processing ticket {ticket_folder.name}: {str(e)}")
-                import traceback
-                traceback.print_exc()
-            
-            # Add delay between tickets to avoid API rate limits
-            if i < len(all_tickets):
-                print(f"\n⏳ Waiting 2 seconds before next ticket...")
-                time.sleep(2)
-        
-        # Generate batch summary report
-        self._generate_batch_summary(processed_count, skipped_count, error_count)
+                print(f"\n✅ Successfully processed ticket: {ticket_folder.name}")
+                return "completed"
+            
+            self._add_to_summary(ticket_folder, "error", results.get("error"))
+            print(f"\n❌ Error processing ticket: {results.get('error')}")
+            return "error"
+            
+        except Exception as e:
+            self._add_to_summary(ticket_folder, "error", str(e))
+            print(f"\n❌ Error processing ticket {ticket_folder.name}: {str(e)}")
+            import traceback
+            traceback.print_exc()
+            return "error"
     
     def _add_to_summary(self, ticket_folder: Path, status: str, data: Any):
         """Add ticket result to summary"""
@@ -2760,7 +4430,8 @@ class BatchProcessor:
         elif status == "skipped":
             summary_entry['last_processed'] = data
         
-        self.results_summary.append(summary_entry)
+        with self.lock:
+            self.results_summary.append(summary_entry)
     
     def _generate_batch_summary(self, processed: int, skipped: int, errors: int):
         """Generate comprehensive batch processing summary"""
@@ -2851,6 +4522,8 @@ class BatchProcessor:
             
             if ticket_id in tracking_data['tickets']:
                 status = "✅ Processed"
+                if tracking_data['tickets'][ticket_id].get('mode') == 'fast':
+                    status = "⚡ Fast-ranked"
                 last_processed = tracking_data['tickets'][ticket_id]['last_processed']
             
             print(f"{ticket_id:40} | {status:20} | Last: {last_processed}")
@@ -2869,6 +4542,14 @@ def main():
     parser.add_argument('--reset', type=str, help='Reset specific ticket ID to allow reprocessing')
     parser.add_argument('--reset-all', action='store_true', help='Reset all tracking data')
     parser.add_argument('--tickets', nargs='+', help='Process specific ticket IDs only')
+    parser.add_argument('--incremental', action='store_true', help='Only score new or changed resumes; rerun LLM stages only if the top candidates changed')
+    parser.add_argument('--rerank', action='store_true', help='Re-rank a filtered ticket from its saved features (no PDFs or LLM)')
+    parser.add_argument('--weights', type=str, help='Weights for --rerank, e.g. skills=0.5,experience=0.2 '
+                             '(unlisted weights keep their defaults; all are rescaled to sum to 1)')
+    parser.add_argument('--top', type=int, default=10, help='Number of candidates to show with --rerank')
+    parser.add_argument('--workers', type=int, default=BatchProcessor.BATCH_WORKERS, help='Tickets processed at once with --batch')
+    parser.add_argument('--mode', choices=UpdatedResumeFilteringSystem.MODES, default='full',
+                        help='fast: rank by scores only, no LLM calls (a later full run adds the LLM reviews)')
     
     args = parser.parse_args()
     
@@ -2893,13 +4574,48 @@ def main():
             print(f"❌ Ticket {args.reset} not found in tracking data")
         return
     
+    # Handle re-ranking from the saved feature store
+    if args.rerank:
+        if not args.ticket_folder:
+            print("❌ --rerank needs a ticket folder")
+            return
+        
+        try:
+            weights = {}
+            for item in (args.weights.split(',') if args.weights else []):
+                name, sep, value = item.partition('=')
+                if not sep:
+                    raise ValueError(f"Invalid weight '{item}', expected name=value")
+                weights[name.strip()] = value
+            
+            scoring_engine = BatchScoringEngine.load_for_ticket(args.ticket_folder)
+            start = time.perf_counter()
+            ranked = scoring_engine.rerank(weights, args.top)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+        except (ValueError, FileNotFoundError) as e:
+            print(f"❌ Error: {e}")
+            return
+        
+        print(f"📊 Re-ranked {len(scoring_engine.filenames)} resumes in {elapsed_ms:.1f} ms")
+        print(f"   Weights: {BatchScoringEngine.resolve_weights(weights)}")
+        for candidate in ranked:
+            print(f"  {candidate['rank']}. {candidate['filename']} - Score: {candidate['final_score']:.2%}")
+            print(f"      Skills: {len(candidate['matched_skills'])}/{len(scoring_engine.skills)} matched")
+            print(f"      Experience: {candidate['detected_experience_years']} years")
+            if len(candidate['submissions']) > 1:
+                print(f"      ⚠️ Best of {len(candidate['submissions'])} submissions")
+        return
+    
     # Handle batch processing
     if args.batch:
         print("🚀 Starting batch processing of all tickets...")
         processor = BatchProcessor()
         processor.process_all_tickets(
             force_reprocess=args.force,
-            specific_tickets=args.tickets
+            specific_tickets=args.tickets,
+            incremental=args.incremental,
+            workers=args.workers,
+            mode=args.mode
         )
         return
     
@@ -2913,10 +4629,13 @@ def main():
         print("  Process single ticket:     python main.py approved_tickets/e206b5ae66_Re-Data-Engineer")
         print("  Process all tickets:       python main.py --batch")
         print("  Force reprocess all:       python main.py --batch --force")
+        print("  Score only new resumes:    python main.py --batch --incremental")
+        print("  Rank without LLM calls:    python main.py --batch --mode fast")
         print("  Process specific tickets:  python main.py --batch --tickets e206b5ae66_Re-Data-Engineer")
         print("  Show status:              python main.py --status")
         print("  Reset ticket:             python main.py --reset e206b5ae66_Re-Data-Engineer")
         print("  Reset all:                python main.py --reset-all")
+        print("  Re-rank with new weights: python main.py approved_tickets/e206b5ae66_Re-Data-Engineer --rerank --weights skills=0.6,experience=0.2")
         return
     
     # Process single ticket
@@ -2927,23 +4646,26 @@ def main():
     # Check if already processed
     tracker = TicketTracker()
     ticket_path = Path(ticket_folder)
-    is_processed, info = tracker.is_ticket_processed(ticket_path)
+    is_processed, info = tracker.is_ticket_processed(ticket_path, args.mode)
     
     if is_processed and not args.force:
         print(f"✅ Ticket {ticket_path.name} already processed on: {info}")
         print(f"   Use --force to reprocess")
         return
     
+    # Scores from a fast run are still valid; only the LLM stages need to run
+    incremental = args.incremental or info == "llm_review_pending"
+    
     try:
         print("🚀 Initializing Resume Filtering System with Duplicate Detection...")
-        filter_system = UpdatedResumeFilteringSystem(ticket_folder)
+        filter_system = UpdatedResumeFilteringSystem(ticket_folder, mode=args.mode)
         
-        results = filter_system.filter_resumes()
+        results = filter_system.filter_resumes(incremental=incremental)
         
         if "error" not in results:
             # Mark as processed
             results_file = filter_system.output_folder / f"final_results_{filter_system.job_ticket.ticket_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            tracker.mark_ticket_processed(ticket_path, str(results_file))
+            tracker.mark_ticket_processed(ticket_path, str(results_file), args.mode)
             
             print(f"\n{'='*70}")
             print(f"✅ FILTERING COMPLETE - FINAL SUMMARY")
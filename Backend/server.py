@@ -16,6 +16,7 @@ import logging
 import re
 import subprocess
 import threading
+import queue
 import time
 import os
 import signal
@@ -54,6 +55,7 @@ CLOUDFLARE_TUNNEL_URL = None  # Will be set after tunnel starts
 BASE_STORAGE_PATH = "approved_tickets"  # Base folder for storing approved tickets
 ALLOWED_EXTENSIONS = {'pdf', 'doc', 'docx', 'txt', 'rtf'}
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB max file size
+STREAM_FLUSH_SECONDS = 0.05  # Streamed reply tokens are sent as one message_chunk at most this often
 
 # ============================================
 # Flask App Initialization
@@ -506,6 +508,110 @@ def get_ticket_resumes(ticket_id):
         logger.error(f"Error getting resumes for ticket {ticket_id}: {e}")
         return []
 
+# ============================================
+# Resume Pre-extraction Worker
+# ============================================
+
+# Resumes waiting for text extraction, processed by a single background thread
+resume_extraction_queue = queue.Queue()
+resume_extraction_thread = None
+resume_extraction_lock = threading.Lock()
+
+def resume_extraction_worker():
+    """Extract text and identifiers for uploaded resumes so filtering only has to score"""
+    registry = None  # Cross-ticket candidate registry, opened on this thread's first resume
+    while True:
+        file_path = resume_extraction_queue.get()
+        try:
+            # Imported here so the filtering dependencies only load once a resume arrives
+            from resume_filter5 import ResumeExtractor, CandidateRegistry
+            
+            if registry is None:
+                registry = CandidateRegistry.for_tickets_root(BASE_STORAGE_PATH)
+            
+            sidecar = ResumeExtractor.write_sidecar(Path(file_path), registry)
+            if sidecar:
+                logger.info(f"Pre-extracted text for {file_path} (candidate {sidecar.get('global_candidate_id')})")
+            else:
+                logger.warning(f"No text could be extracted from {file_path}")
+        except Exception as e:
+            logger.error(f"Error pre-extracting resume {file_path}: {e}")
+        finally:
+            resume_extraction_queue.task_done()
+
+def enqueue_resume_extraction(file_path):
+    """Queue a saved resume for background text extraction"""
+    global resume_extraction_thread
+    
+    with resume_extraction_lock:
+        if resume_extraction_thread is None or not resume_extraction_thread.is_alive():
+            resume_extraction_thread = threading.Thread(target=resume_extraction_worker, daemon=True)
+            resume_extraction_thread.start()
+    
+    resume_extraction_queue.put(file_path)
+
+# ============================================
+# Resume Filtering Worker
+# ============================================
+
+# Full (LLM-reviewed) filtering runs, one ticket at a time on a background thread
+resume_filtering_queue = queue.Queue()
+resume_filtering_thread = None
+resume_filtering_lock = threading.Lock()
+resume_filtering_pending = set()  # Ticket folders queued or running
+
+def mark_ticket_filtered(folder_path, results, mode):
+    """Record a filtering run in the tracker shared with resume_filter5.py --batch"""
+    from resume_filter5 import TicketTracker
+    
+    results_file = os.path.join(folder_path, 'filtering_results',
+                                f"final_results_{results['ticket_id']}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    with resume_filtering_lock:
+        TicketTracker(os.path.join(BASE_STORAGE_PATH, '.processing_tracker.json')).mark_ticket_processed(
+            Path(folder_path), results_file, mode
+        )
+
+def resume_filtering_worker():
+    """Run full filtering for queued tickets; incremental runs reuse the stage 1 scores"""
+    scheduler = None  # Shared OpenAI rate limits, created on this thread's first ticket
+    while True:
+        folder_path, incremental = resume_filtering_queue.get()
+        try:
+            from resume_filter5 import UpdatedResumeFilteringSystem, RateLimitScheduler
+            
+            if scheduler is None:
+                scheduler = RateLimitScheduler()
+            
+            results = UpdatedResumeFilteringSystem(folder_path, scheduler=scheduler, mode='full').filter_resumes(
+                incremental=incremental
+            )
+            if 'error' in results:
+                logger.error(f"Full filtering failed for {folder_path}: {results['error']}")
+            else:
+                mark_ticket_filtered(folder_path, results, 'full')
+                logger.info(f"Full filtering finished for {folder_path} (LLM reviewed: {results.get('llm_reviewed')})")
+        except Exception as e:
+            logger.error(f"Error filtering resumes for {folder_path}: {e}")
+        finally:
+            with resume_filtering_lock:
+                resume_filtering_pending.discard(folder_path)
+            resume_filtering_queue.task_done()
+
+def enqueue_resume_filtering(folder_path, incremental=True):
+    """Queue a full filtering run; returns False when the ticket is already queued or running"""
+    global resume_filtering_thread
+    
+    with resume_filtering_lock:
+        if folder_path in resume_filtering_pending:
+            return False
+        resume_filtering_pending.add(folder_path)
+        if resume_filtering_thread is None or not resume_filtering_thread.is_alive():
+            resume_filtering_thread = threading.Thread(target=resume_filtering_worker, daemon=True)
+            resume_filtering_thread.start()
+    
+    resume_filtering_queue.put((folder_path, incremental))
+    return True
+
 def create_folders_for_existing_approved_tickets():
     """Create folders for all existing approved tickets"""
     try:
@@ -1095,10 +1201,14 @@ def upload_resume(ticket_id):
         )
         
         if saved_path:
+            # Extract text in the background so filtering can skip parsing this file
+            enqueue_resume_extraction(saved_path)
+            
             return jsonify({
                 'success': True,
                 'message': 'Resume uploaded successfully',
-                'file_path': saved_path
+                'file_path': saved_path,
+                'text_extraction': 'queued'
             })
         else:
             return jsonify({
@@ -1251,8 +1361,23 @@ def create_existing_folders_endpoint():
 @app.route('/api/tickets/<ticket_id>/filter-resumes', methods=['POST'])
 @require_api_key
 def trigger_resume_filtering(ticket_id):
-    """Trigger resume filtering for a specific ticket"""
+    """Trigger resume filtering for a specific ticket.
+    
+    mode=fast ranks by scores only (no LLM calls) and answers with the ranking. mode=full queues
+    the LLM-reviewed run on a background worker; after a fast run it reuses the stage 1 scores,
+    so a fast request followed by a full one adds the reviews later.
+    """
     try:
+        data = request.get_json(silent=True) or {}
+        mode = data.get('mode') or request.args.get('mode', 'full')
+        force = str(data.get('force', request.args.get('force', 'false'))).lower() == 'true'
+        
+        if mode not in ('full', 'fast'):
+            return jsonify({
+                'success': False,
+                'error': "mode must be 'full' or 'fast'"
+            }), 400
+        
         # Check if ticket exists and has resumes
         ticket_folders = [f for f in os.listdir(BASE_STORAGE_PATH) 
                          if f.startswith(f"{ticket_id}_")]
@@ -1269,7 +1394,7 @@ def trigger_resume_filtering(ticket_id):
         filtering_results_path = os.path.join(folder_path, 'filtering_results')
         
         # Get the latest filtering results if they exist
-        if os.path.exists(filtering_results_path):
+        if os.path.exists(filtering_results_path) and not force:
             result_files = list(Path(filtering_results_path).glob('final_results_*.json'))
             if result_files:
                 # Sort by modification time and get the latest
@@ -1278,23 +1403,71 @@ def trigger_resume_filtering(ticket_id):
                 with open(latest_result, 'r') as f:
                     filtering_data = json.load(f)
                 
+                # Fast results don't satisfy a full request: that one adds the LLM reviews
+                if mode == 'fast' or filtering_data.get('mode', 'full') == 'full':
+                    return jsonify({
+                        'success': True,
+                        'message': 'Filtering results already exist',
+                        'data': {
+                            'filtered_at': filtering_data.get('timestamp'),
+                            'mode': filtering_data.get('mode', 'full'),
+                            'total_resumes': filtering_data.get('summary', {}).get('total_resumes', 0),
+                            'top_candidates_count': len(filtering_data.get('final_top_5', []))
+                        }
+                    })
+        
+        if mode == 'fast':
+            with resume_filtering_lock:
+                filtering_running = folder_path in resume_filtering_pending
+            if filtering_running:
                 return jsonify({
-                    'success': True,
-                    'message': 'Filtering results already exist',
-                    'data': {
-                        'filtered_at': filtering_data.get('timestamp'),
-                        'total_resumes': filtering_data.get('summary', {}).get('total_resumes', 0),
-                        'top_candidates_count': len(filtering_data.get('final_top_5', []))
-                    }
-                })
+                    'success': False,
+                    'error': 'Full filtering is queued or running for this ticket'
+                }), 409
+            
+            # Scores only: finishes in seconds, so run it in the request
+            from resume_filter5 import UpdatedResumeFilteringSystem
+            
+            results = UpdatedResumeFilteringSystem(folder_path, mode='fast').filter_resumes(incremental=True)
+            if 'error' in results:
+                return jsonify({
+                    'success': False,
+                    'error': results['error']
+                }), 400
+            
+            # A later --batch or mode=full run sees the LLM review as pending
+            mark_ticket_filtered(folder_path, results, 'fast')
+            
+            return jsonify({
+                'success': True,
+                'message': 'Resumes ranked by score (fast mode, no LLM review)',
+                'data': {
+                    'filtered_at': results['timestamp'],
+                    'mode': 'fast',
+                    'total_resumes': results['summary']['total_resumes'],
+                    'unique_candidates': results['summary']['unique_candidates'],
+                    'top_candidates': [
+                        {
+                            'filename': candidate['filename'],
+                            'score': candidate['final_score'],
+                            'matched_skills': candidate['matched_skills'],
+                            'experience_years': candidate['detected_experience_years']
+                        }
+                        for candidate in results['final_top_5']
+                    ]
+                }
+            })
         
-        # If no results exist, you would trigger the filtering here
-        # For now, return a message indicating manual filtering is needed
+        # Full mode calls the LLM stages and takes minutes: run it in the background
+        queued = enqueue_resume_filtering(folder_path, incremental=not force)
         return jsonify({
             'success': True,
-            'message': 'Please run the filtering script manually for this ticket',
-            'command': f'python resume_filter.py {folder_path}'
-        })
+            'message': 'Full filtering queued' if queued else 'Full filtering is already queued for this ticket',
+            'data': {
+                'mode': 'full',
+                'status': 'queued' if queued else 'already_queued'
+            }
+        }), 202
         
     except Exception as e:
         logger.error(f"Error triggering resume filtering: {e}")
@@ -1563,6 +1736,76 @@ def get_filtering_report(ticket_id):
             'error': str(e)
         }), 500
 
+@app.route('/api/tickets/<ticket_id>/rerank', methods=['POST'])
+@require_api_key
+def rerank_resumes(ticket_id):
+    """Re-rank filtered resumes with custom scoring weights (uses saved features, no PDFs or LLM)"""
+    try:
+        from resume_filter5 import BatchScoringEngine
+        
+        data = request.get_json(silent=True) or {}
+        weights = data.get('weights') or {}
+        top_n = data.get('top', 10)
+        
+        if not isinstance(weights, dict):
+            return jsonify({
+                'success': False,
+                'error': 'weights must be an object, e.g. {"skills": 0.5}'
+            }), 400
+        
+        try:
+            resolved_weights = BatchScoringEngine.resolve_weights(weights)
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
+        
+        if isinstance(top_n, bool) or not isinstance(top_n, (int, str)) or not str(top_n).strip().isdigit() or int(top_n) < 1:
+            return jsonify({
+                'success': False,
+                'error': 'top must be a positive integer'
+            }), 400
+        top_n = int(top_n)
+        
+        ticket_folders = [f for f in os.listdir(BASE_STORAGE_PATH) 
+                         if f.startswith(f"{ticket_id}_")]
+        
+        if not ticket_folders:
+            return jsonify({
+                'success': False,
+                'error': 'Ticket folder not found'
+            }), 404
+        
+        folder_path = os.path.join(BASE_STORAGE_PATH, ticket_folders[0])
+        
+        try:
+            scoring_engine = BatchScoringEngine.load_for_ticket(folder_path)
+        except FileNotFoundError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 404
+        
+        ranked = scoring_engine.rerank(resolved_weights, top_n)
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'ticket_id': ticket_id,
+                'weights': resolved_weights,
+                'total_resumes': len(scoring_engine.filenames),
+                'candidates': ranked
+            }
+        })
+        
+    except Exception as e:
+        logger.error(f"Error re-ranking resumes: {e}")
+        return jsonify({
+            'success': False,
+            'error': str(e)
+        }), 500
+
 @app.route('/api/tickets/<ticket_id>/send-top-resumes', methods=['POST'])
 @require_api_key
 def send_top_resumes_email(ticket_id):
@@ -2421,8 +2664,35 @@ def handle_websocket_message(data):
             emit('error', {'error': 'Missing required fields'})
             return
         
+        # LLM-written replies arrive as message_chunk events while they are generated;
+        # message_response below still carries the complete (saved) reply. message_stream_reset
+        # tells the client to drop the chunks so far (streaming failed and the reply is regenerated)
+        pending = []
+        last_flush = time.monotonic()
+        
+        def flush_chunks():
+            nonlocal last_flush
+            if pending:
+                emit('message_chunk', {'chunk': ''.join(pending), 'session_id': session_id})
+                pending.clear()
+            last_flush = time.monotonic()
+        
+        def on_token(token):
+            pending.append(token)
+            if time.monotonic() - last_flush >= STREAM_FLUSH_SECONDS:
+                flush_chunks()
+        
+        def on_reset():
+            pending.clear()
+            emit('message_stream_reset', {'session_id': session_id})
+        
         # Process message
-        bot_response = chat_bot.process_message(session_id, user_id, message)
+        stream = data.get('stream', True)
+        bot_response = chat_bot.process_message(
+            session_id, user_id, message,
+            on_token=on_token if stream else None, on_reset=on_reset if stream else None
+        )
+        flush_chunks()
         
         # Format response for WebSocket
         formatted_response = {